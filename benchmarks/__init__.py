@@ -0,0 +1,7 @@
+"""Benchmarks for lildb, run them from repository root.
+
+Usage:
+    python -m benchmarks.run --datasets 1k 100k --output results.json
+    python -m benchmarks.compare baseline.json results.json
+    python -m benchmarks.bench_row_factory --rows 1000000
+"""
@@ -0,0 +1,187 @@
+"""Benchmark public table operations on synthetic person dataset.
+
+Cases: single and bulk insert, get by primary key, filtered select,
+Query with projection, group and order, streaming iteration, row
+change and DB open time against table count.
+
+Usage:
+    python -m benchmarks.bench_operations --rows 100000
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from benchmarks.common import PERSON_COLUMNS
+from benchmarks.common import TResults
+from benchmarks.common import fill
+from benchmarks.common import measure
+from benchmarks.common import person_row
+from benchmarks.common import print_results
+from benchmarks.common import record
+from benchmarks.common import write_json
+from lildb import DB
+
+
+# Count of single row statements, they do not scale with dataset
+SINGLE_OPERATIONS = 1000
+# Table counts for DB open time
+TABLE_COUNTS = (1, 10, 100, 1000)
+
+
+def person_dicts(rows: int) -> list[dict[str, Any]]:
+    """Return synthetic person rows like dicts."""
+    return [
+        dict(zip(PERSON_COLUMNS, person_row(id_)))
+        for id_ in range(rows)
+    ]
+
+
+def insert_single(db: DB, data: list[dict[str, Any]]) -> None:
+    """Insert rows one by one in autocommit mode."""
+    for row in data:
+        db.person.add(row)
+
+
+def get_rows(db: DB, rows: int) -> None:
+    """Fetch rows by primary key."""
+    for id_ in range(SINGLE_OPERATIONS):
+        db.person.get(id=id_ * 7 % rows)
+
+
+def change_rows(rows: list[Any]) -> None:
+    """Update every row through row object."""
+    for row in rows:
+        row["salary"] += 1
+        row.change()
+
+
+def iterate(db: DB) -> None:
+    """Stream all rows."""
+    for _ in db.person.select(return_generator=True):
+        pass
+
+
+def run(rows: int) -> TResults:
+    """Return seconds of each operation on dataset with row count."""
+    results: TResults = {}
+    single = min(rows, SINGLE_OPERATIONS)
+    with tempfile.TemporaryDirectory() as directory:
+        path = str(Path(directory) / "bench.db")
+        fill(path, 0)
+        db = DB(path)
+        data = person_dicts(rows)
+
+        def clear() -> None:
+            db.person.delete(condition="1")
+
+        record(
+            results,
+            "insert_single",
+            measure(lambda: insert_single(db, data[:single]), setup=clear),
+            single,
+        )
+        record(
+            results,
+            "insert_bulk",
+            measure(lambda: db.person.add(data), setup=clear),
+            rows,
+        )
+
+        person = db.person
+        record(results, "get", measure(lambda: get_rows(db, rows)), single)
+        record(
+            results,
+            "select_filtered",
+            measure(lambda: person.select(post="post3")),
+            rows // 10,
+        )
+        record(
+            results,
+            "query_projection",
+            measure(
+                lambda: person.query(
+                    person.c.name,
+                    person.c.salary,
+                ).where(post="post3").all(),
+            ),
+            rows // 10,
+        )
+        record(
+            results,
+            "query_group",
+            measure(
+                lambda: person.query(
+                    person.c.post,
+                    person.c.salary.sum(),
+                ).group_by(person.c.post).all(),
+            ),
+            rows,
+        )
+        record(
+            results,
+            "query_order",
+            measure(
+                lambda: person.query().order_by(
+                    salary="desc",
+                ).limit(100).all(),
+            ),
+            rows,
+        )
+        record(results, "iterate", measure(lambda: iterate(db)), rows)
+
+        # Rows are fetched again before each timed change
+        changed: list[Any] = []
+
+        def fetch_rows() -> None:
+            changed[:] = person.query().limit(single).all()
+
+        record(
+            results,
+            "row_change",
+            measure(lambda: change_rows(changed), setup=fetch_rows),
+            single,
+        )
+        db.close()
+        DB._instances.pop(path)
+    return results
+
+
+def run_open(table_counts: tuple[int, ...] = TABLE_COUNTS) -> TResults:
+    """Return seconds of DB open and close against table count."""
+    results: TResults = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for count in table_counts:
+            path = str(Path(directory) / f"open_{count}.db")
+            db = DB(path)
+            for position in range(count):
+                db.create_table(f"table{position}", PERSON_COLUMNS)
+            db.close()
+            DB._instances.pop(path)
+
+            def open_db(path: str = path) -> None:
+                DB(path).close()
+                DB._instances.pop(path)
+
+            record(results, f"open_tables={count}", measure(open_db), 1)
+    return results
+
+
+def main() -> None:
+    """Run benchmark and print operations/sec."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--json", help="write results to json file")
+    args = parser.parse_args()
+
+    results = run(args.rows)
+    results.update(run_open())
+    print_results(results)
+    if args.json:
+        write_json(args.json, results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Benchmark Query.parallel_reduce against single process scan.
+
+Usage:
+    python -m benchmarks.bench_parallel --rows 1000000
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+from functools import reduce
+from pathlib import Path
+from typing import Any
+
+from benchmarks.common import TResults
+from benchmarks.common import fill
+from benchmarks.common import measure
+from benchmarks.common import print_results
+from benchmarks.common import record
+from benchmarks.common import write_json
+from lildb import DB
+
+
+def score(total: float, row: dict[str, Any]) -> float:
+    """Python side derived value, keeps GIL busy."""
+    return total + len(row["name"]) * row["salary"] ** 0.5
+
+
+def run(rows: int) -> TResults:
+    """Return seconds of single and parallel scan by workers."""
+    results: TResults = {}
+    with tempfile.TemporaryDirectory() as directory:
+        path = str(Path(directory) / "bench.db")
+        fill(path, rows)
+        db = DB(path)
+
+        record(
+            results,
+            "single",
+            measure(lambda: reduce(score, db.person.query().all(), 0.0), 1),
+            rows,
+        )
+        workers = 1
+        while workers <= (os.cpu_count() or 1):
+            record(
+                results,
+                f"workers={workers}",
+                measure(
+                    lambda: db.person.query().parallel_reduce(
+                        score,
+                        0.0,
+                        workers,  # noqa: B023
+                    ),
+                    1,
+                ),
+                rows,
+            )
+            workers *= 2
+        db.close()
+        DB._instances.pop(path)
+    return results
+
+
+def main() -> None:
+    """Run benchmark and print seconds per scan."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--json", help="write results to json file")
+    args = parser.parse_args()
+
+    results = run(args.rows)
+    print_results(results)
+    if args.json:
+        write_json(args.json, results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Benchmark insert and select throughput for every PRAGMA profile.
+
+Inserts are single row autocommit writes, so synchronous setting
+dominates them. Read-only profile is measured on db filled before switch.
+
+Usage:
+    python -m benchmarks.bench_profiles --rows 5000 --selects 2000
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.common import PERSON_COLUMNS
+from benchmarks.common import TResults
+from benchmarks.common import person_row
+from benchmarks.common import print_results
+from benchmarks.common import record
+from benchmarks.common import write_json
+from lildb import DB
+from lildb.profiles import PROFILES
+
+
+def insert(db: DB, rows: int) -> float:
+    """Return seconds of single row inserts."""
+    start = time.perf_counter()
+    for id_ in range(rows):
+        db.person.add(dict(zip(PERSON_COLUMNS, person_row(id_))))
+    return time.perf_counter() - start
+
+
+def select(db: DB, rows: int, selects: int) -> float:
+    """Return seconds of select queries."""
+    start = time.perf_counter()
+    for id_ in range(selects):
+        db.person.get(id=id_ % rows)
+    return time.perf_counter() - start
+
+
+def run(rows: int = 5000, selects: int = 2000) -> TResults:
+    """Return seconds of inserts and selects by profile."""
+    results: TResults = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for profile in (None, *PROFILES):
+            path = str(Path(directory) / f"bench_{profile}.db")
+            write_profile = "throughput" if profile == "read_only" else profile
+            db = DB(path, profile=write_profile)
+            db.create_table("person", PERSON_COLUMNS)
+
+            inserted = insert(db, rows)
+            if profile == "read_only":
+                db.use_profile(profile)
+            selected = select(db, rows, selects)
+            db.close()
+            DB._instances.pop(path)
+
+            name = profile or "default"
+            if profile != "read_only":
+                record(results, f"{name}_insert", inserted, rows)
+            record(results, f"{name}_select", selected, selects)
+    return results
+
+
+def main() -> None:
+    """Run benchmark and print rows/sec and queries/sec."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--selects", type=int, default=2000)
+    parser.add_argument("--json", help="write results to json file")
+    args = parser.parse_args()
+
+    results = run(args.rows, args.selects)
+    print_results(results)
+    if args.json:
+        write_json(args.json, results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Benchmark ThreadDB read throughput against thread count.
+
+Compares the single worker connection with the pool of WAL readers.
+
+Usage:
+    python -m benchmarks.bench_readers --rows 100000 --queries 200
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from benchmarks.common import TResults
+from benchmarks.common import fill
+from benchmarks.common import print_results
+from benchmarks.common import record
+from benchmarks.common import write_json
+from lildb import ThreadDB
+
+
+THREADS = (1, 2, 4, 8, 16, 32, 64)
+READERS = 8
+
+
+def read(db: ThreadDB, id_: int) -> int:
+    """One read query, aggregation keeps sqlite busy without GIL."""
+    result = db.person.query(
+        db.person.c.salary.sum(),
+    ).where(
+        condition=f"post = 'post{id_ % 10}'",
+    ).all(only_data=True)
+    return len(result)
+
+
+def measure(db: ThreadDB, threads: int, queries: int) -> float:
+    """Return seconds of queries made by thread count."""
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        start = time.perf_counter()
+        list(executor.map(lambda id_: read(db, id_), range(queries)))
+        return time.perf_counter() - start
+
+
+def run(rows: int, queries: int = 200) -> TResults:
+    """Return seconds of queries for worker and readers by threads."""
+    results: TResults = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for readers in (0, READERS):
+            path = str(Path(directory) / f"bench_{readers}.db")
+            fill(path, rows)
+            db = ThreadDB(path, readers=readers)
+            for threads in THREADS:
+                record(
+                    results,
+                    f"readers={readers}_threads={threads}",
+                    measure(db, threads, queries),
+                    queries,
+                )
+            db.close()
+            ThreadDB._instances.pop(path)
+    return results
+
+
+def main() -> None:
+    """Run benchmark and print queries/sec."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--json", help="write results to json file")
+    args = parser.parse_args()
+
+    results = run(args.rows, args.queries)
+    print_results(results)
+    if args.json:
+        write_json(args.json, results)
+
+
+if __name__ == "__main__":
+    main()
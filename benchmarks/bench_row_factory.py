@@ -0,0 +1,74 @@
+"""Benchmark row materialization: dict(zip()) in Python vs row_factory.
+
+Usage:
+    python -m benchmarks.bench_row_factory --rows 1000000
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+from pathlib import Path
+from typing import Any
+from typing import Callable
+
+from benchmarks.common import TResults
+from benchmarks.common import fill
+from benchmarks.common import measure
+from benchmarks.common import print_results
+from benchmarks.common import record
+from benchmarks.common import write_json
+from lildb import DB
+from lildb import Table
+from lildb.rows import RowDict
+
+
+def before(table: Table) -> list[Any]:
+    """Materialize rows like lildb did before row_factory."""
+    columns_name = table.column_names
+    items = table.db.connect.execute(
+        f"SELECT * FROM {table.name}",  # noqa: S608
+    ).fetchall()
+    return [
+        RowDict(table=table, **dict(zip(columns_name, item)))
+        for item in items
+    ]
+
+
+def run(rows: int) -> TResults:
+    """Return seconds of reading all rows by each row mode."""
+    results: TResults = {}
+    with tempfile.TemporaryDirectory() as directory:
+        path = str(Path(directory) / "bench.db")
+        fill(path, rows)
+        db = DB(path)
+
+        cases: dict[str, Callable[[], list[Any]]] = {
+            "before_dict_zip": lambda: before(db.person),
+        }
+        for row_mode in ("dict", "datacls", "tuple"):
+            table = Table("person", row_mode=row_mode)  # type: ignore
+            table(db)
+            cases[f"row_factory_{row_mode}"] = table.select
+
+        for name, func in cases.items():
+            record(results, name, measure(func), rows)
+        db.close()
+        DB._instances.pop(path)
+    return results
+
+
+def main() -> None:
+    """Run benchmark and print rows/sec."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--json", help="write results to json file")
+    args = parser.parse_args()
+
+    results = run(args.rows)
+    print_results(results)
+    if args.json:
+        write_json(args.json, results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Benchmark ThreadDB worker queue against thread count.
+
+Threads make single row inserts, merged by group commit, and primary
+key reads, both pass the worker queue.
+
+Usage:
+    python -m benchmarks.bench_thread_db --operations 2000
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable
+
+from benchmarks.common import PERSON_COLUMNS
+from benchmarks.common import TResults
+from benchmarks.common import fill
+from benchmarks.common import person_row
+from benchmarks.common import print_results
+from benchmarks.common import record
+from benchmarks.common import write_json
+from lildb import ThreadDB
+
+
+THREADS = (1, 2, 4, 8, 16, 32, 64)
+
+
+def measure(
+    threads: int,
+    operations: int,
+    func: Callable[[int], object],
+) -> float:
+    """Return seconds of operations made by thread count."""
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        start = time.perf_counter()
+        list(executor.map(func, range(operations)))
+        return time.perf_counter() - start
+
+
+def run(rows: int, operations: int = 2000) -> TResults:
+    """Return seconds of inserts and reads by thread count."""
+    results: TResults = {}
+    with tempfile.TemporaryDirectory() as directory:
+        path = str(Path(directory) / "bench.db")
+        fill(path, rows)
+        db = ThreadDB(path)
+        next_id = rows
+        for threads in THREADS:
+            start_id = next_id
+            record(
+                results,
+                f"insert_threads={threads}",
+                measure(
+                    threads,
+                    operations,
+                    lambda id_: db.person.add(
+                        dict(zip(
+                            PERSON_COLUMNS,
+                            person_row(start_id + id_),  # noqa: B023
+                        )),
+                    ),
+                ),
+                operations,
+            )
+            next_id += operations
+            record(
+                results,
+                f"get_threads={threads}",
+                measure(
+                    threads,
+                    operations,
+                    lambda id_: db.person.get(id=id_ * 7 % rows),
+                ),
+                operations,
+            )
+        db.close()
+        ThreadDB._instances.pop(path)
+    return results
+
+
+def main() -> None:
+    """Run benchmark and print operations/sec."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--operations", type=int, default=2000)
+    parser.add_argument("--json", help="write results to json file")
+    args = parser.parse_args()
+
+    results = run(args.rows, args.operations)
+    print_results(results)
+    if args.json:
+        write_json(args.json, results)
+
+
+if __name__ == "__main__":
+    main()
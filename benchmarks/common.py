@@ -0,0 +1,105 @@
+"""Module contains shared benchmark fixtures."""
+from __future__ import annotations
+
+import gc
+import json
+import platform
+import sqlite3
+import sys
+import time
+from datetime import datetime
+from datetime import timezone
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Dict
+
+
+__all__ = (
+    "DATASETS",
+    "PERSON_COLUMNS",
+    "TResults",
+    "fill",
+    "measure",
+    "person_row",
+    "print_results",
+    "record",
+    "write_json",
+)
+
+
+# Dataset label -> row count
+DATASETS = {"1k": 1_000, "100k": 100_000, "1m": 1_000_000}
+
+PERSON_COLUMNS = ("id", "name", "post", "salary")
+
+# Case name -> {'seconds': best seconds, 'operations': count}
+TResults = Dict[str, Dict[str, float]]
+
+
+def person_row(id_: int) -> tuple[int, str, str, float]:
+    """Return synthetic person row, the same for the same id."""
+    return (id_, f"name{id_}", f"post{id_ % 10}", id_ * 1.5)
+
+
+def fill(path: str, rows: int) -> None:
+    """Create person table with synthetic rows."""
+    connect = sqlite3.connect(path)
+    connect.execute(
+        "CREATE TABLE person (id INTEGER PRIMARY KEY, name TEXT, "
+        "post TEXT, salary REAL)"
+    )
+    connect.executemany(
+        "INSERT INTO person VALUES(?, ?, ?, ?)",
+        (person_row(id_) for id_ in range(rows)),
+    )
+    connect.commit()
+    connect.close()
+
+
+def measure(
+    func: Callable[[], Any],
+    repeat: int = 3,
+    setup: Callable[[], Any] | None = None,
+) -> float:
+    """Return best seconds of several calls, setup is not timed."""
+    best = float("inf")
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def record(
+    results: TResults,
+    name: str,
+    seconds: float,
+    operations: int,
+) -> None:
+    """Add case result, operations are rows or queries done in seconds."""
+    results[name] = {"seconds": seconds, "operations": operations}
+
+
+def print_results(results: TResults) -> None:
+    """Print results table with operations/sec."""
+    print(f"{'case':<40}{'seconds':>10}{'ops/sec':>14}")
+    for name, result in results.items():
+        seconds = result["seconds"]
+        rate = result["operations"] / seconds if seconds else 0.0
+        print(f"{name:<40}{seconds:>10.4f}{rate:>14,.0f}")
+
+
+def write_json(path: str | Path, results: TResults) -> None:
+    """Write results with environment description."""
+    data = {
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "sqlite": sqlite3.sqlite_version,
+        "platform": platform.platform(),
+        "results": results,
+    }
+    Path(path).write_text(json.dumps(data, indent=2, sort_keys=True))
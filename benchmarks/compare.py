@@ -0,0 +1,102 @@
+"""Compare benchmark results with baseline and report regressions.
+
+Cases are compared by operations/sec, case slower than baseline by
+more than threshold is regression, then exit code is 1.
+
+Usage:
+    python -m benchmarks.compare baseline.json results.json
+    python -m benchmarks.compare baseline.json results.json --threshold 0.2
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import NamedTuple
+
+from benchmarks.common import TResults
+
+
+__all__ = (
+    "Change",
+    "compare",
+    "load",
+)
+
+
+class Change(NamedTuple):
+    """Rate change of case present in both results."""
+
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        """Return current rate divided by baseline rate."""
+        return self.current / self.baseline if self.baseline else 1.0
+
+
+def load(path: str | Path) -> TResults:
+    """Read results of benchmark json file."""
+    return json.loads(Path(path).read_text())["results"]
+
+
+def _rate(result: dict[str, float]) -> float:
+    """Return operations/sec of case."""
+    if not result["seconds"]:
+        return 0.0
+    return result["operations"] / result["seconds"]
+
+
+def compare(baseline: TResults, current: TResults) -> list[Change]:
+    """Return rate changes of cases present in both results."""
+    return [
+        Change(name, _rate(baseline[name]), _rate(result))
+        for name, result in current.items()
+        if name in baseline
+    ]
+
+
+def main() -> None:
+    """Print changes and exit with 1 on regression."""
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="allowed slowdown part, defaults to 0.1",
+    )
+    args = parser.parse_args()
+
+    baseline = load(args.baseline)
+    current = load(args.current)
+    changes = compare(baseline, current)
+    regressions = [
+        change for change in changes
+        if change.ratio < 1 - args.threshold
+    ]
+
+    print(f"{'case':<48}{'baseline':>14}{'current':>14}{'change':>9}")
+    for change in changes:
+        mark = "  REGRESSION" if change in regressions else ""
+        print(
+            f"{change.name:<48}{change.baseline:>14,.0f}"
+            f"{change.current:>14,.0f}{change.ratio - 1:>+9.1%}{mark}",
+        )
+    missing = sorted(baseline.keys() - current.keys())
+    if missing:
+        print(f"Not measured: {', '.join(missing)}")
+    if regressions:
+        print(f"{len(regressions)} regression(s) over {args.threshold:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Run all benchmarks on datasets and write results to json.
+
+Result names are '<benchmark>.<case>[<dataset>]', compare result files
+with benchmarks.compare.
+
+Usage:
+    python -m benchmarks.run --datasets 1k 100k --output results.json
+    python -m benchmarks.run --only operations thread_db --datasets 1m
+"""
+from __future__ import annotations
+
+import argparse
+from typing import Callable
+
+from benchmarks import bench_operations
+from benchmarks import bench_parallel
+from benchmarks import bench_profiles
+from benchmarks import bench_readers
+from benchmarks import bench_row_factory
+from benchmarks import bench_thread_db
+from benchmarks.common import DATASETS
+from benchmarks.common import TResults
+from benchmarks.common import print_results
+from benchmarks.common import write_json
+
+
+# Benchmark name -> function of dataset row count
+BENCHMARKS: dict[str, Callable[[int], TResults]] = {
+    "operations": bench_operations.run,
+    "row_factory": bench_row_factory.run,
+    "thread_db": bench_thread_db.run,
+    "readers": bench_readers.run,
+    "parallel": bench_parallel.run,
+}
+
+# Benchmark name -> function, they do not depend on dataset
+FIXED_BENCHMARKS: dict[str, Callable[[], TResults]] = {
+    "open": bench_operations.run_open,
+    "profiles": bench_profiles.run,
+}
+
+
+def run(datasets: list[str], only: list[str] | None = None) -> TResults:
+    """Run selected benchmarks and return prefixed results."""
+    results: TResults = {}
+    for name, fixed_func in FIXED_BENCHMARKS.items():
+        if only and name not in only:
+            continue
+        print(f"{name}...", flush=True)
+        for case, result in fixed_func().items():
+            results[f"{name}.{case}"] = result
+    for dataset in datasets:
+        for name, func in BENCHMARKS.items():
+            if only and name not in only:
+                continue
+            print(f"{name}[{dataset}]...", flush=True)
+            for case, result in func(DATASETS[dataset]).items():
+                results[f"{name}.{case}[{dataset}]"] = result
+    return results
+
+
+def main() -> None:
+    """Run benchmarks, print and write results."""
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--datasets",
+        nargs="+",
+        choices=tuple(DATASETS),
+        default=list(DATASETS),
+    )
+    parser.add_argument(
+        "--only",
+        nargs="+",
+        choices=(*FIXED_BENCHMARKS, *BENCHMARKS),
+        help="run only these benchmarks",
+    )
+    parser.add_argument("--output", default="benchmark_results.json")
+    args = parser.parse_args()
+
+    results = run(args.datasets, args.only)
+    print_results(results)
+    write_json(args.output, results)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,16 @@
 """Module contain lildb."""
+from .advisor import *  # noqa: F403
+from .aio import AsyncDB  # noqa: F401
 from .db import DB  # noqa: F401
 from .db import ThreadDB  # noqa: F401
 from .enumcls import *  # noqa: F403
+from .instrumentation import *  # noqa: F403
+from .metrics import *  # noqa: F403
 from .operations import *  # noqa: F403
+from .plan import *  # noqa: F403
 from .rows import *  # noqa: F403
 from .table import Column  # noqa: F401
+from .table import ColumnInfo  # noqa: F401
+from .table import IndexInfo  # noqa: F401
 from .table import Table  # noqa: F401
+from .transaction import Transaction  # noqa: F401
@@ -0,0 +1,323 @@
+"""Module contains index advisor components."""
+from __future__ import annotations
+
+import math
+import re
+from threading import Lock
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import NamedTuple
+
+from .cache import LRUCache
+from .column_types import Index
+from .enumcls import ResultFetch
+
+
+if TYPE_CHECKING:
+    from .db import DB
+    from .table import Table
+
+
+__all__ = (
+    "IndexAdvisor",
+    "QueryShape",
+    "Recommendation",
+)
+
+
+# Clauses of generated select after 'FROM <table>'
+_CLAUSES = re.compile(r"\s(WHERE|GROUP BY|HAVING|ORDER BY|LIMIT)\s")
+# Column compared in condition, like '`person`.name = ?' or 'salary > 10'
+_COMPARISON = re.compile(
+    r"(?:`?\w+`?\.)?`?(\w+)`?\s*"
+    r"(NOT\s+IN|IS\s+NOT|IN|IS|LIKE|GLOB|BETWEEN|==|=|!=|<>|<=|>=|<|>)",
+    re.IGNORECASE,
+)
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_OR = re.compile(r"\bOR\b", re.IGNORECASE)
+
+# Comparisons served by index equality lookup
+_EQUAL = frozenset(("=", "==", "is", "in"))
+# Comparisons served by index range scan
+_RANGE = frozenset(("<", ">", "<=", ">=", "between", "like", "glob"))
+
+# Part of rows assumed to match range condition
+RANGE_SELECTIVITY = 0.25
+
+
+class QueryShape(NamedTuple):
+    """Filtered and sorted columns of select."""
+
+    table: str
+    # Columns compared by equality, in query order
+    equal: tuple[str, ...]
+    # Columns compared by range, only first of them is used by index
+    range: tuple[str, ...]
+    # ORDER BY or GROUP BY columns
+    order: tuple[str, ...]
+
+    @property
+    def index_columns(self) -> tuple[str, ...]:
+        """Return columns of index serving this shape."""
+        columns = list(self.equal)
+        if self.range:
+            columns.append(self.range[0])
+        else:
+            columns.extend(
+                column for column in self.order if column not in columns
+            )
+        return tuple(columns)
+
+
+class _ShapeStats:
+    """Observed executions of query shape."""
+
+    __slots__ = ("query", "parameters", "count", "time")
+
+    def __init__(self, query: str, parameters: Any) -> None:
+        """Initialize."""
+        # Last executed query of shape, it is explained
+        self.query = query
+        self.parameters = parameters
+        self.count = 0
+        self.time = 0.0
+
+
+class Recommendation(NamedTuple):
+    """Recommended index."""
+
+    table: str
+    columns: tuple[str, ...]
+    # Count and total seconds of observed queries served by index
+    queries: int
+    time: float
+    # Estimated seconds saved for the same queries
+    saving: float
+    sql: str
+
+
+def _column_names(table: Table, clause: str) -> tuple[str, ...]:
+    """Return table columns of ORDER BY or GROUP BY clause."""
+    names = []
+    for item in clause.split(","):
+        words = re.findall(r"\w+", item.split(".")[-1])
+        if words and words[0].lower() in table.column_names:
+            names.append(words[0].lower())
+    return tuple(names)
+
+
+def parse_shape(table: Table, query: str) -> QueryShape | None:
+    """Parse select generated by lildb operation to query shape.
+
+    Returns None for query without table columns in filter and order
+    and for filter with OR.
+    """
+    _, found, rest = query.partition(f" FROM {table.name}")
+    if not found:
+        return None
+    if query.startswith("SELECT EXISTS("):
+        rest = rest[:-1]
+    parts = _CLAUSES.split(f" {rest} ")
+    clauses = dict(zip(parts[1::2], parts[2::2]))
+
+    equal: list[str] = []
+    range_: list[str] = []
+    where = _STRING.sub("?", clauses.get("WHERE", ""))
+    if _OR.search(where):
+        return None
+    for column, operator in _COMPARISON.findall(where):
+        column = column.lower()
+        operator = " ".join(operator.lower().split())
+        if column not in table.column_names:
+            continue
+        if operator in _EQUAL and column not in equal:
+            equal.append(column)
+        elif operator in _RANGE and column not in range_:
+            range_.append(column)
+    order = _column_names(table, clauses.get("GROUP BY", ""))
+    order += _column_names(table, clauses.get("ORDER BY", ""))
+
+    shape = QueryShape(
+        table.name,
+        tuple(equal),
+        tuple(column for column in range_ if column not in equal),
+        order,
+    )
+    if not shape.index_columns:
+        return None
+    return shape
+
+
+class IndexAdvisor:
+    """Index advisor driven by observed select shapes.
+
+    Operations record filtered and sorted columns of executed selects
+    with count and time, 'recommend' checks shapes with EXPLAIN QUERY
+    PLAN and existing indexes and estimates saved time.
+    """
+
+    def __init__(self, db: DB) -> None:
+        """Initialize disabled advisor."""
+        self.db = db
+        self.enabled = False
+        # Query -> parsed shape, None for not advised query
+        self._shapes = LRUCache(maxsize=512)
+        self._stats: dict[QueryShape, _ShapeStats] = {}
+        self._lock = Lock()
+
+    def enable(self) -> None:
+        """Start recording queries."""
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stop recording queries, recorded shapes are kept."""
+        self.enabled = False
+
+    def reset(self) -> None:
+        """Forget recorded shapes."""
+        with self._lock:
+            self._stats.clear()
+
+    def record(
+        self,
+        table: Table,
+        query: str,
+        parameters: Any,
+        time: float,
+    ) -> None:
+        """Record executed select of table."""
+        shape = self._shapes.get_or_create(
+            (table.name, query),
+            lambda: parse_shape(table, query),
+        )
+        if shape is None:
+            return
+        with self._lock:
+            stats = self._stats.get(shape)
+            if stats is None:
+                stats = self._stats[shape] = _ShapeStats(query, parameters)
+            stats.query = query
+            stats.parameters = parameters
+            stats.count += 1
+            stats.time += time
+
+    @property
+    def shapes(self) -> dict[QueryShape, tuple[int, float]]:
+        """Return recorded shapes with count and total time."""
+        with self._lock:
+            return {
+                shape: (stats.count, stats.time)
+                for shape, stats in self._stats.items()
+            }
+
+    def _is_served(
+        self,
+        table: Table,
+        shape: QueryShape,
+        query: str,
+        parameters: Any,
+    ) -> bool:
+        """Check shape is already served by index or rowid."""
+        columns = shape.index_columns
+        if columns[:1] == table.primary_key[:1] and len(columns) == 1:
+            return True
+        for index in table.indexes:
+            if index.columns[:len(columns)] == columns:
+                return True
+        plan = self.db.explain(query, parameters)
+        return not plan.full_scans and not plan.temp_btrees
+
+    def _remaining(self, table: Table, shape: QueryShape) -> float:
+        """Estimate part of query time left with index."""
+        rows = len(table)
+        if rows < 2:
+            return 1.0
+        matched = float(rows)
+        if shape.equal:
+            distinct = self.db.execute(
+                "SELECT COUNT(*) FROM (SELECT DISTINCT {} FROM {})".format(
+                    ", ".join(shape.equal),
+                    table.name,
+                ),
+                result=ResultFetch.fetchone,
+                cache=False,
+            )[0]  # type: ignore
+            matched /= max(distinct, 1)
+        if shape.range:
+            matched *= RANGE_SELECTIVITY
+        if not shape.equal and not shape.range:
+            # Index removes sorting only
+            return min(1.0, 1 / math.log2(rows))
+        return min(1.0, (math.log2(rows) + matched) / rows)
+
+    def recommend(self) -> list[Recommendation]:
+        """Return recommended indexes, biggest saving first.
+
+        Shapes served by the same index are joined. Saving is rough
+        estimate from table size and selectivity of equal columns.
+        """
+        with self._lock:
+            observed = [
+                (shape, stats.count, stats.time, stats.query, stats.parameters)
+                for shape, stats in self._stats.items()
+            ]
+        joined: dict[tuple[str, tuple[str, ...]], list[float]] = {}
+        for shape, count, time, query, parameters in observed:
+            table = getattr(self.db, shape.table.lower())
+            if self._is_served(table, shape, query, parameters):
+                continue
+            saving = time * (1 - self._remaining(table, shape))
+            key = (shape.table, shape.index_columns)
+            totals = joined.setdefault(key, [0, 0.0, 0.0])
+            totals[0] += count
+            totals[1] += time
+            totals[2] += saving
+
+        recommendations = [
+            Recommendation(
+                table_name,
+                columns,
+                int(totals[0]),
+                totals[1],
+                totals[2],
+                Index(*columns)(table_name),
+            )
+            for (table_name, columns), totals in joined.items()
+        ]
+        recommendations.sort(key=lambda item: item.saving, reverse=True)
+        return recommendations
+
+    def report(self) -> str:
+        """Return recommendations like text table."""
+        lines = [
+            "{:<40} {:>8} {:>10} {:>10}".format(
+                "index",
+                "queries",
+                "time, s",
+                "saving, s",
+            ),
+        ]
+        for item in self.recommend():
+            lines.append("{:<40} {:>8} {:>10.4f} {:>10.4f}".format(
+                f"{item.table}({', '.join(item.columns)})",
+                item.queries,
+                item.time,
+                item.saving,
+            ))
+        return "\n".join(lines)
+
+    def apply(self, min_saving: float = 0.0) -> list[str]:
+        """Create recommended indexes and return their names.
+
+        Args:
+            min_saving (float): skip indexes saving less seconds.
+            Defaults to 0.0.
+
+        """
+        names = []
+        for item in self.recommend():
+            if item.saving < min_saving:
+                continue
+            table = getattr(self.db, item.table.lower())
+            names.append(table.create_index(*item.columns))
+        return names
@@ -0,0 +1,348 @@
+"""Module contains asyncio components."""
+from __future__ import annotations
+
+import asyncio
+from functools import partial
+from functools import singledispatchmethod
+from itertools import islice
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import AsyncIterator
+from typing import Callable
+from typing import Iterable
+
+from .db import Future
+from .db import ThreadDB
+from .table import Table
+
+
+if TYPE_CHECKING:
+    from .operations import Query
+    from .operations import TOperator
+    from .operations import TQueryData
+    from .profiles import TProfile
+    from .sql import SQLBase
+    from .table import Column
+
+
+__all__ = (
+    "AsyncDB",
+    "AsyncTable",
+    "AsyncQuery",
+)
+
+
+class AsyncFuture(Future):
+    """Future delivering worker result in asyncio event loop."""
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        future: asyncio.Future,
+    ) -> None:
+        """Initialize."""
+        super().__init__()
+        self.loop = loop
+        self.future = future
+
+    @singledispatchmethod
+    def put(self, result: Any) -> None:
+        """Write operation result."""
+        self.result = result
+        self.event.set()
+        self.loop.call_soon_threadsafe(self._set_result, result)
+
+    @put.register(Exception)
+    def _(self, result: Exception) -> None:
+        """Write exception."""
+        self.exception = result
+        self.event.set()
+        self.loop.call_soon_threadsafe(self._set_exception, result)
+
+    def _set_result(self, result: Any) -> None:
+        """Set result if awaiting was not cancelled."""
+        if not self.future.done():
+            self.future.set_result(result)
+
+    def _set_exception(self, exception: Exception) -> None:
+        """Set exception if awaiting was not cancelled."""
+        if not self.future.done():
+            self.future.set_exception(exception)
+
+
+class AsyncDB:
+    """Asyncio db.
+
+    All operations are executed by ThreadDB worker thread, result is
+    delivered in event loop without blocking it.
+    """
+
+    def __init__(self, path: str, **db_params: Any) -> None:
+        """Initialize.
+
+        Args:
+            path (str): path to db file.
+            **db_params (Any): params for ThreadDB.
+
+        """
+        self.db = ThreadDB(path, **db_params)
+        if not isinstance(self.db, ThreadDB):
+            msg = f"DB '{path}' is already opened without worker thread."
+            raise TypeError(msg)
+        self._tables: dict[str, AsyncTable] = {}
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run callable in worker thread and await its result."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        item: tuple[
+            Future,
+            Callable[..., Any],
+            tuple[Any, ...],
+            dict[str, Any],
+        ] = (AsyncFuture(loop, future), func, args, {})
+        lock = self.db.transaction_lock
+        if lock.acquire(blocking=False):
+            try:
+                self.db.worker_queue.put(item)
+            finally:
+                lock.release()
+        else:
+            # Other thread owns transaction, wait for it outside of loop
+            await loop.run_in_executor(None, self._put_locked, item)
+        return await future
+
+    def _put_locked(self, item: tuple[Any, ...]) -> None:
+        """Put item in worker queue under transaction lock."""
+        with self.db.transaction_lock:
+            self.db.worker_queue.put(item)
+
+    async def run_read(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run reading callable and await its result.
+
+        With ThreadDB readers it is executed by default executor
+        in parallel, else by worker thread.
+        """
+        if self.db.readers is None:
+            return await self.run(func, *args)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, func, *args)
+
+    async def execute(self, *args: Any, **kwargs: Any) -> list[Any] | None:
+        """Execute sql query in worker, see DB.execute."""
+        return await self.run(partial(self.db.execute, *args, **kwargs))
+
+    async def create_table(self, *args: Any, **kwargs: Any) -> None:
+        """Create table in DB, see CreateTable."""
+        await self.run(partial(self.db.create_table, *args, **kwargs))
+
+    async def use_profile(self, profile: TProfile) -> None:
+        """Apply PRAGMA profile, see ThreadDB.use_profile."""
+        await self.run(self.db.use_profile, profile)
+
+    @property
+    def tables(self) -> tuple[AsyncTable, ...]:
+        """Return all tables obj."""
+        return tuple(
+            getattr(self, table.name.lower())
+            for table in self.db.tables
+        )
+
+    def __getattr__(self, name: str) -> AsyncTable:
+        """Return async table by name."""
+        # Attribute db is absent when initialization failed
+        if name.startswith("_") or "db" not in self.__dict__:
+            raise AttributeError(name)
+        table = getattr(self.db, name)
+        if not isinstance(table, Table):
+            msg = f"{self.__class__.__name__} object has no table {name}"
+            raise AttributeError(msg)
+        async_table = self._tables.get(name)
+        if async_table is None or async_table.table is not table:
+            async_table = AsyncTable(table, self)
+            self._tables[name] = async_table
+        return async_table
+
+    async def close(self) -> None:
+        """Close worker thread and connection."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.db.close)
+
+    async def __aenter__(self) -> AsyncDB:
+        """Create async context manager."""
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Close connection."""
+        await self.close()
+
+
+class AsyncTable:
+    """Awaitable operations for table."""
+
+    __slots__ = ("table", "db")
+
+    def __init__(self, table: Table, db: AsyncDB) -> None:
+        """Initialize."""
+        self.table = table
+        self.db = db
+
+    @property
+    def name(self) -> str:
+        """Return table name."""
+        return self.table.name
+
+    @property
+    def c(self) -> Any:
+        """Return table columns."""
+        return self.table.c
+
+    columns = c
+
+    async def select(self, **kwargs: Any) -> list[Any]:
+        """Select-query for current table, see Select."""
+        if kwargs.get("return_generator"):
+            msg = "Use 'iterate' for streaming rows."
+            raise ValueError(msg)
+        return await self.db.run_read(partial(self.table.select, **kwargs))
+
+    async def all(self) -> list[Any]:
+        """Get all rows from table."""
+        return await self.db.run_read(self.table.all)
+
+    async def get(self, **filter_by: Any) -> Any:
+        """Get one row by filter."""
+        return await self.db.run_read(partial(self.table.get, **filter_by))
+
+    async def insert(self, data: TQueryData | Iterable[TQueryData]) -> None:
+        """Insert-query for current table."""
+        await self.db.run(self.table.insert, data)
+
+    add = insert
+
+    async def update(
+        self,
+        data: TQueryData,
+        operator: TOperator = "AND",
+        condition: str | None = None,
+        **filter_by: Any,
+    ) -> None:
+        """Update-query for current table."""
+        await self.db.run(partial(
+            self.table.update,
+            data,
+            operator,
+            condition,
+            **filter_by,
+        ))
+
+    async def delete(self, *args: Any, **kwargs: Any) -> None:
+        """Delete-query for current table."""
+        await self.db.run(partial(self.table.delete, *args, **kwargs))
+
+    def query(self, *columns: SQLBase | Column) -> AsyncQuery:
+        """Create new query for current table."""
+        query = type(self.table.query)(self.table)(*columns)
+        return AsyncQuery(query, self.db)
+
+    async def iterate(
+        self,
+        *,
+        chunk_size: int | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[Any]:
+        """Stream rows from table, worker fetches them by chunks."""
+        size = chunk_size or self.table.db.chunk_size
+        rows = await self.db.run(partial(
+            self.table.select,
+            return_generator=True,
+            chunk_size=size,
+            **kwargs,
+        ))
+        try:
+            while True:
+                chunk = await self.db.run(lambda: list(islice(rows, size)))
+                if not chunk:
+                    return
+                for row in chunk:
+                    yield row
+        finally:
+            close = getattr(rows, "close", None)
+            if close is not None:
+                await self.db.run(close)
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        """Iterate through the table rows."""
+        return self.iterate()
+
+    def __repr__(self) -> str:
+        """Repr view."""
+        return f"<{self.__class__.__name__}: {self.name.title()}>"
+
+
+class AsyncQuery:
+    """Query with awaitable results, see Query."""
+
+    __slots__ = ("query", "db")
+
+    def __init__(self, query: Query, db: AsyncDB) -> None:
+        """Initialize."""
+        self.query = query
+        self.db = db
+
+    def where(self, *args: Any, **kwargs: Any) -> AsyncQuery:
+        """Use where construction in sql query."""
+        self.query.where(*args, **kwargs)
+        return self
+
+    def having(self, *args: Any, **kwargs: Any) -> AsyncQuery:
+        """Use having construction in sql query."""
+        self.query.having(*args, **kwargs)
+        return self
+
+    def order_by(self, *args: Any, **kwargs: Any) -> AsyncQuery:
+        """Use order by in query."""
+        self.query.order_by(*args, **kwargs)
+        return self
+
+    def group_by(self, *args: Any) -> AsyncQuery:
+        """Use group by operation."""
+        self.query.group_by(*args)
+        return self
+
+    def limit(self, limit_number: int) -> AsyncQuery:
+        """Use limit in sql query."""
+        self.query.limit(limit_number)
+        return self
+
+    def offset(self, offset_number: int) -> AsyncQuery:
+        """Use offset in sql query."""
+        self.query.offset(offset_number)
+        return self
+
+    def cache(self, enabled: bool = True) -> AsyncQuery:
+        """Use db result cache for query results."""
+        self.query.cache(enabled)
+        return self
+
+    async def all(self, size: int = 0, *, only_data: bool = False) -> Any:
+        """Return all items from query."""
+        return await self.db.run_read(
+            partial(self.query.all, size, only_data=only_data),
+        )
+
+    async def first(self) -> Any:
+        """Return first item from query."""
+        return await self.db.run_read(self.query.first)
+
+    async def count(self) -> int:
+        """Return row count."""
+        return await self.db.run_read(self.query.count)
+
+    async def exists(self) -> bool:
+        """Check query result exists."""
+        return await self.db.run_read(self.query.exists)
+
+    def __str__(self) -> str:
+        """Return sql query."""
+        return str(self.query)
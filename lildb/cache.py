@@ -0,0 +1,309 @@
+"""Module contains cache components."""
+from __future__ import annotations
+
+import sys
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Any
+from typing import Callable
+from typing import Hashable
+from typing import Iterable
+
+
+__all__ = (
+    "LRUCache",
+    "ResultCache",
+)
+
+
+_MISSING = object()
+
+
+class LRUCache:
+    """Thread safe LRU cache with hit, miss and eviction counters."""
+
+    __slots__ = (
+        "maxsize",
+        "hits",
+        "misses",
+        "evictions",
+        "_data",
+        "_lock",
+    )
+
+    def __init__(self, maxsize: int = 256) -> None:
+        """Initialize.
+
+        Args:
+            maxsize (int): max count of items in cache. Defaults to 256.
+
+        """
+        if maxsize < 1:
+            msg = "Cache maxsize must be positive."
+            raise ValueError(msg)
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return cached value and mark it like recently used."""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Put value in cache and evict least recently used item."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_create(
+        self,
+        key: Hashable,
+        factory: Callable[[], Any],
+    ) -> Any:
+        """Return cached value or create it with factory."""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = factory()
+            self.set(key, value)
+        return value
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove item from cache."""
+        with self._lock:
+            return self._data.pop(key, default)
+
+    def clear(self) -> None:
+        """Remove all items from cache."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        """Return count of cached items."""
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Check key in cache without changing counters."""
+        return key in self._data
+
+    @property
+    def hit_rate(self) -> float:
+        """Part of lookups served from cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    @property
+    def miss_rate(self) -> float:
+        """Part of lookups missed cache."""
+        total = self.hits + self.misses
+        return self.misses / total if total else 0.0
+
+    def stats(self) -> dict[str, int | float]:
+        """Return cache counters like dict."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._data),
+            "hit_rate": self.hit_rate,
+        }
+
+    def __repr__(self) -> str:
+        """Repr view."""
+        return "<{}: size={}, hits={}, misses={}>".format(
+            self.__class__.__name__,
+            len(self._data),
+            self.hits,
+            self.misses,
+        )
+
+
+def _result_size(value: Any) -> int:
+    """Estimate memory size of fetched result in bytes."""
+    size = sys.getsizeof(value)
+    if not isinstance(value, (list, tuple)):
+        return size
+    for item in value:
+        size += sys.getsizeof(item)
+        if isinstance(item, tuple):
+            size += sum(map(sys.getsizeof, item))
+    return size
+
+
+class ResultCache:
+    """Thread safe LRU cache of query results with TTL.
+
+    Every item is bound to tables read by its query, so a write to
+    table invalidates items of this table only.
+    """
+
+    __slots__ = (
+        "maxsize",
+        "ttl",
+        "hits",
+        "misses",
+        "evictions",
+        "invalidations",
+        "bytes",
+        "generation",
+        "_data",
+        "_tables",
+        "_lock",
+    )
+
+    def __init__(self, maxsize: int = 1024, ttl: float | None = None) -> None:
+        """Initialize.
+
+        Args:
+            maxsize (int): max count of cached results. Defaults to 1024.
+            ttl (float | None): seconds result stays valid, without it
+            result lives until eviction or invalidation. Defaults to None.
+
+        """
+        if maxsize < 1:
+            msg = "Cache maxsize must be positive."
+            raise ValueError(msg)
+        if ttl is not None and ttl <= 0:
+            msg = "Cache ttl must be positive."
+            raise ValueError(msg)
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.bytes = 0
+        # Changed by every invalidation, result read before it is stale
+        self.generation = 0
+        # Key -> (value, tables, expiration time, size)
+        self._data: OrderedDict[Hashable, tuple[Any, ...]] = OrderedDict()
+        # Lower table name -> keys of results reading it
+        self._tables: dict[str, set[Hashable]] = {}
+        self._lock = Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return cached result and mark it like recently used."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return default
+            if item[2] is not None and item[2] < monotonic():
+                self._remove(key)
+                self.evictions += 1
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        tables: Iterable[str],
+        *,
+        generation: int | None = None,
+    ) -> None:
+        """Put result in cache and evict least recently used results.
+
+        Args:
+            key (Hashable): result key.
+            value (Any): fetched result.
+            tables (Iterable[str]): lower names of tables read by query.
+            generation (int | None): cache generation before query was
+            executed, result is skipped if it was invalidated meanwhile.
+            Defaults to None.
+
+        """
+        tables = frozenset(tables)
+        size = _result_size(value)
+        expires = None if self.ttl is None else monotonic() + self.ttl
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            if key in self._data:
+                self._remove(key)
+            self._data[key] = (value, tables, expires, size)
+            self.bytes += size
+            for table in tables:
+                self._tables.setdefault(table, set()).add(key)
+            while len(self._data) > self.maxsize:
+                self._remove(next(iter(self._data)))
+                self.evictions += 1
+
+    def _remove(self, key: Hashable) -> None:
+        """Remove result and its table links, lock must be held."""
+        _, tables, _, size = self._data.pop(key)
+        self.bytes -= size
+        for table in tables:
+            keys = self._tables.get(table)
+            if keys is None:
+                continue
+            keys.discard(key)
+            if not keys:
+                del self._tables[table]
+
+    def invalidate(self, *tables: str) -> None:
+        """Remove results reading any of tables."""
+        with self._lock:
+            self.generation += 1
+            for table in tables:
+                for key in tuple(self._tables.get(table.lower(), ())):
+                    self._remove(key)
+                    self.invalidations += 1
+
+    def clear(self) -> None:
+        """Remove all results."""
+        with self._lock:
+            self.generation += 1
+            self.invalidations += len(self._data)
+            self._data.clear()
+            self._tables.clear()
+            self.bytes = 0
+
+    def __len__(self) -> int:
+        """Return count of cached results."""
+        return len(self._data)
+
+    @property
+    def hit_rate(self) -> float:
+        """Part of lookups served from cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict[str, int | float]:
+        """Return cache counters like dict."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "bytes": self.bytes,
+            "size": len(self._data),
+            "hit_rate": self.hit_rate,
+        }
+
+    def __repr__(self) -> str:
+        """Repr view."""
+        return "<{}: size={}, bytes={}, hits={}, misses={}>".format(
+            self.__class__.__name__,
+            len(self._data),
+            self.bytes,
+            self.hits,
+            self.misses,
+        )
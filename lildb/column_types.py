@@ -1,6 +1,7 @@
 """Module contains column types for create table."""
 from __future__ import annotations
 
+import re
 from collections import UserString
 from numbers import Number
 from typing import TypeVar
@@ -16,6 +17,7 @@ __all__ = (
     "Text",
     "Blob",
     "ForeignKey",
+    "Index",
 )
 
 
@@ -239,3 +241,70 @@ class ForeignKey(UserString):
         if self.on_update:
             stmt += f" ON UPDATE {self.on_update.value}"
         return stmt
+
+
+class Index(UserString):
+    """Index of table.
+
+    Column is plain name or expression like 'lower(name)' or
+    'salary DESC'. Columns from 'include' are appended after key
+    columns, so queries reading only them are served by index
+    (covering index).
+    """
+
+    def __init__(
+        self,
+        *columns: str,
+        unique: bool = False,
+        where: str | None = None,
+        name: str | None = None,
+        include: tuple[str, ...] = (),
+    ) -> None:
+        """Initialize.
+
+        Args:
+            *columns (str): key columns or expressions.
+            unique (bool): create unique index. Defaults to False.
+            where (str | None): condition of partial index.
+            Defaults to None.
+            name (str | None): index name. Defaults to
+            'ix_<table>_<columns>'.
+            include (tuple[str, ...]): extra columns for covering index.
+            Defaults to ().
+
+        """
+        if not columns:
+            msg = "Index needs at least one column."
+            raise ValueError(msg)
+        self.columns = (*columns, *include)
+        self.unique = unique
+        self.where = where
+        self.name = name
+        super().__init__(
+            "CREATE {}INDEX IF NOT EXISTS `{}` ON `{}` ({})",
+        )
+
+    def index_name(self, table: str) -> str:
+        """Return index name for table."""
+        if self.name is not None:
+            return self.name
+        words = "_".join(
+            "_".join(re.findall(r"\w+", column.lower()))
+            for column in self.columns
+        )
+        return f"ix_{table.lower()}_{words}"
+
+    def __call__(self, table: str) -> str:
+        """Create command."""
+        stmt = self.data.format(
+            "UNIQUE " if self.unique else "",
+            self.index_name(table),
+            table,
+            ", ".join(
+                f"`{column}`" if column.isidentifier() else column
+                for column in self.columns
+            ),
+        )
+        if self.where:
+            stmt += f" WHERE {self.where}"
+        return stmt
@@ -2,25 +2,52 @@
 from __future__ import annotations
 
 import logging
+import re
 import sqlite3
-from functools import cached_property
 from functools import singledispatchmethod
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
+from queue import Empty
+from queue import LifoQueue
 from queue import Queue
 from threading import Event
+from threading import Lock
+from threading import RLock
 from threading import Thread
+from threading import current_thread
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import Callable
 from typing import ClassVar
 from typing import Final
+from typing import Hashable
 from typing import Iterator
+from typing import KeysView
+from typing import Mapping
 from typing import MutableMapping
 from typing import Sequence
 
+from .advisor import IndexAdvisor
+from .cache import LRUCache
+from .cache import ResultCache
 from .enumcls import ResultFetch
+from .instrumentation import Instrumentation
+from .instrumentation import log_query
+from .metrics import Metrics
 from .operations import CreateTable
+from .plan import QueryPlan
+from .profiles import apply_pragmas
+from .profiles import profile_pragmas
+from .table.column import ColumnInfo
 from .table.table import Table
+from .transaction import Transaction
+
+
+if TYPE_CHECKING:
+    from .profiles import TProfile
+    from .rows import TRowMode
+    from .transaction import TTransactionMode
 
 
 __all__ = (
@@ -29,11 +56,36 @@ __all__ = (
 )
 
 
+# Words of query, they are matched with table names
+_WORDS = re.compile(r"\w+")
+
+# Commands not changing table data
+_READ_COMMANDS = frozenset((
+    "select",
+    "pragma",
+    "explain",
+    "begin",
+    "commit",
+    "end",
+    "rollback",
+    "savepoint",
+    "release",
+))
+
+# Changed tables mark for writes changing unknown tables
+_ALL_TABLES = "*"
+
+_MISSING = object()
+
+
 class DB:
     """DB component."""
 
     custom_tables: ClassVar[list[Table]]
 
+    # Row count for each fetchmany call in streaming iteration
+    chunk_size: int = 1000
+
     _instances: Final[dict[str, DB]] = {}
 
     def __new__(cls: type[DB], *args: Any, **kwargs: Any) -> DB:
@@ -63,72 +115,266 @@ class DB:
         path: str,
         *,
         use_datacls: bool = False,
+        row_mode: TRowMode | None = None,
         debug: bool = False,
+        profile: TProfile | None = None,
+        result_cache: int = 0,
+        result_cache_ttl: float | None = None,
+        scan_warning_rows: int | None = None,
+        slow_query_time: float | None = None,
         **connect_params: Any,
     ) -> None:
-        """Initialize DB create connection and cursor."""
+        """Initialize DB create connection and cursor.
+
+        Args:
+            path (str): path to db file.
+            use_datacls (bool): use dataclass rows. Defaults to False.
+            row_mode (TRowMode | None): 'dict', 'datacls' or compact 'tuple'
+            rows for all tables. Defaults to None.
+            debug (bool): log sql queries. Defaults to False.
+            profile (TProfile | None): PRAGMA profile 'durable',
+            'throughput', 'bulk_load' or 'read_only'. Defaults to None.
+            result_cache (int): max count of cached select results,
+            0 disables cache. Defaults to 0.
+            result_cache_ttl (float | None): seconds cached result stays
+            valid. Defaults to None.
+            scan_warning_rows (int | None): log warning when select reads
+            without index table with more rows, it is debug aid.
+            Defaults to None.
+            slow_query_time (float | None): log warning for statements
+            slower than this seconds. Defaults to None.
+            **connect_params (Any): params for sqlite3.connect.
+
+        """
+        self.instrumentation = Instrumentation(self)
+        self.metrics = Metrics(self)
         if debug:
             logging.basicConfig(level=logging.DEBUG)
+            self.instrumentation.add_hook(before=log_query)
+        if slow_query_time is not None:
+            self.instrumentation.log_slow_queries(slow_query_time)
         self.path = path
         self.connect: sqlite3.Connection = sqlite3.connect(
             path,
             **connect_params,
         )
         self.use_datacls = use_datacls
-        self.table_names: set = set()
+        self.row_mode = row_mode
+        # Count of opened explicit transactions and savepoints
+        self.transaction_depth = 0
+        self.result_cache: ResultCache | None = None
+        if result_cache:
+            self.result_cache = ResultCache(result_cache, result_cache_ttl)
+        # Query -> lower names of tables in it
+        self._query_tables = LRUCache(maxsize=512)
+        # Tables written since last invalidation of cached results
+        self._changed_tables: set[str] = set()
+        # Schema has triggers, views or foreign key actions, so write
+        # could change any table
+        self._cascading_writes = False
+        # Last seen PRAGMA data_version, lock guards it with cache clear
+        self.data_version = -1
+        self._data_version_lock = Lock()
+        self.scan_warning_rows = scan_warning_rows
+        # Query -> tables read by it without index
+        self._scan_plans = LRUCache(maxsize=512)
+        self.advisor = IndexAdvisor(self)
+        # Lower table name -> table name and its CREATE statement
+        self._table_names: dict[str, str] = {}
+        self._table_sql: dict[str, str] = {}
+        self._custom_tables: dict[str, Table] = {}
+        # Lower table name -> columns metadata, loaded on demand
+        self._table_info: dict[str, tuple[ColumnInfo, ...]] = {}
+        # Last seen PRAGMA schema_version
+        self.schema_version = -1
+        self.profile: TProfile | None = None
+        if profile is not None:
+            self.use_profile(profile)
         self.initialize_tables()
 
         self.create_table = getattr(self, "create_table", CreateTable)(self)
 
     def initialize_tables(self) -> None:
-        """Initialize all db tables."""
-        stmt = (
-            "SELECT name FROM sqlite_master "
-            "WHERE type='table' AND substr(`name`, 1, 6) != 'sqlite';"
-        )
-        result = self.execute(stmt, result=ResultFetch.fetchall)
-
-        custom_table_names = set()
+        """Prepare custom tables and read table names.
 
+        Table objects for other tables are created on first access.
+        Names are read here, in the thread executing DDL, so attribute
+        access never waits for busy ThreadDB worker.
+        """
+        custom_tables = {}
         for attr in filter(
             lambda i: not i.startswith("_"),
             dir(self.__class__),
         ):
-            custom_table = getattr(self, attr)
+            custom_table = getattr(self.__class__, attr)
             if not isinstance(custom_table, Table):
                 continue
-            custom_table_names.add(custom_table.name.lower())
+            custom_tables[custom_table.name.lower()] = custom_table
             custom_table(self)
+        self._custom_tables = custom_tables
+
+        self._table_names = {}
+        self._table_sql = {}
+        self._table_info = {}
+        for name, value in tuple(vars(self).items()):
+            if isinstance(value, Table):
+                delattr(self, name)
+        self.schema_version = -1
+        self.refresh_schema()
+
+    def refresh_schema(self) -> None:
+        """Apply schema changes to table objects.
+
+        PRAGMA schema_version tells whether schema changed at all, then
+        names and CREATE statements of all tables are compared and only
+        created, dropped and changed tables are updated. Whole list is
+        compared, because one version change can cover many tables
+        changed by other connection.
+        """
+        version = self.execute(
+            "PRAGMA schema_version",
+            result=ResultFetch.fetchone,
+        )[0]  # type: ignore
+        if version == self.schema_version:
+            return
+        self._scan_plans.clear()
+        if self.result_cache is not None:
+            self._reset_result_cache()
+
+        stmt = (
+            "SELECT name, sql FROM sqlite_master "
+            "WHERE type='table' AND substr(`name`, 1, 6) != 'sqlite'"
+        )
+        result = self.execute(
+            stmt,
+            result=ResultFetch.fetchall,
+            cache=False,
+        )
+        tables = {name.lower(): (name, sql) for name, sql in result or ()}
 
-        for name in result:
-            table_name = name[0].lower()
-            self.table_names.add(table_name)
+        for name in self._table_sql.keys() - tables.keys():
+            self._forget_table(name)
 
-            if table_name in custom_table_names:
+        for name, (original_name, sql) in tables.items():
+            old_sql = self._table_sql.get(name)
+            if old_sql == sql:
                 continue
+            self._table_names[name] = original_name
+            self._table_sql[name] = sql
+            self._table_info.pop(name, None)
+            if old_sql is None:
+                continue
+            table = vars(self).get(name) or self._custom_tables.get(name)
+            if isinstance(table, Table):
+                table.refresh()
+        self.schema_version = version
+
+    def table_info(self, table_name: str) -> tuple[ColumnInfo, ...]:
+        """Return columns metadata of table.
 
-            new_table = Table(name[0], use_datacls=self.use_datacls)
-            new_table(self)
-            setattr(
-                self,
-                table_name,
-                new_table,
+        First call reads metadata of all tables in one query joining
+        sqlite_master with pragma_table_info, later calls read only
+        tables changed since.
+        """
+        name = table_name.lower()
+        info = self._table_info.get(name)
+        if info is None:
+            self._load_table_info(table_name if self._table_info else None)
+            info = self._table_info.get(name, ())
+        return info
+
+    def _load_table_info(self, table_name: str | None = None) -> None:
+        """Read columns metadata of all tables or one table."""
+        stmt = (
+            "SELECT m.name, p.name, p.type, p.\"notnull\", p.dflt_value, "
+            "p.pk FROM sqlite_master AS m "
+            "JOIN pragma_table_info(m.name) AS p "
+            "WHERE m.type='table' AND substr(m.name, 1, 6) != 'sqlite'"
+        )
+        parameters: tuple[str, ...] = ()
+        if table_name is not None:
+            stmt += " AND m.name = ? COLLATE NOCASE"
+            parameters = (table_name,)
+        stmt += " ORDER BY m.name, p.cid"
+        result = self.execute(
+            stmt,
+            parameters,
+            result=ResultFetch.fetchall,
+            cache=False,
+        )
+        for name, items in groupby(result or (), key=itemgetter(0)):
+            self._table_info[name.lower()] = tuple(
+                ColumnInfo(column, type_, bool(notnull), default, pk)
+                for _, column, type_, notnull, default, pk in items
             )
-            self.table_names.add(table_name)
-        if hasattr(self, "tables"):
-            del self.tables
 
-    @cached_property
-    def tables(self) -> tuple[Table]:
-        """Return all tables obj."""
-        return tuple(
-            getattr(self, table_name)
-            for table_name in self.table_names
+    def _reset_result_cache(self) -> None:
+        """Drop cached results after schema change."""
+        self.result_cache.clear()  # type: ignore
+        self._query_tables.clear()
+        self._cascading_writes = bool(self.execute(
+            "SELECT 1 FROM sqlite_master WHERE type IN ('trigger', 'view') "
+            "OR sql LIKE '% ON DELETE %' OR sql LIKE '% ON UPDATE %' "
+            "LIMIT 1",
+            result=ResultFetch.fetchone,
+            cache=False,
+        ))
+
+    def _forget_table(self, name: str) -> None:
+        """Remove dropped table."""
+        self._table_names.pop(name, None)
+        self._table_sql.pop(name, None)
+        self._table_info.pop(name, None)
+        if isinstance(vars(self).get(name), Table):
+            delattr(self, name)
+
+    @property
+    def table_names(self) -> KeysView[str]:
+        """Return lower names of all db tables."""
+        return self._table_names.keys()
+
+    def _create_table_obj(self, name: str) -> Table:
+        """Create table obj and keep it like db attribute."""
+        custom_table = self._custom_tables.get(name)
+        if custom_table is not None:
+            return custom_table
+        new_table: Table = Table(
+            self._table_names[name],
+            use_datacls=self.use_datacls,
+            row_mode=self.row_mode,
         )
+        new_table(self)
+        # Concurrent first access keeps only one obj
+        return self.__dict__.setdefault(name, new_table)
+
+    def __getattr__(self, name: str) -> Table:
+        """Create table obj on first access."""
+        if name.startswith("_") or "_table_names" not in self.__dict__:
+            msg = "{!r} object has no attribute {!r}".format(
+                self.__class__.__name__,
+                name,
+            )
+            raise AttributeError(msg)
+        if name not in self._table_names:
+            # Table could be created by other connection
+            self.refresh_schema()
+        if name not in self._table_names:
+            msg = "{!r} object has no attribute {!r}".format(
+                self.__class__.__name__,
+                name,
+            )
+            raise AttributeError(msg)
+        return self._create_table_obj(name)
+
+    @property
+    def tables(self) -> tuple[Table, ...]:
+        """Return all tables obj."""
+        return tuple(self)
 
     def __iter__(self) -> Iterator[Any]:
-        """Iterate by db tables."""
-        return self.tables.__iter__()
+        """Iterate by db tables, table obj is created on demand."""
+        for table_name in tuple(self.table_names):
+            yield getattr(self, table_name)
 
     def drop_tables(self) -> None:
         """Drop all db tables."""
@@ -144,6 +390,8 @@ class DB:
         many: bool = False,
         size: int | None = None,
         result: ResultFetch | None = None,
+        row_factory: Callable[[sqlite3.Cursor, tuple], Any] | None = None,
+        cache: bool = True,
     ) -> list[Any] | None:
         """Single execute to simplify it.
 
@@ -154,25 +402,204 @@ class DB:
             many (bool): flag for executemany operation. Defaults to False.
             size (int | None): size for fetchmany operation. Defaults to None.
             result (ResultFetch | None): enum for fetch func. Defaults to None.
+            row_factory (Callable | None): cursor row factory creating
+            result rows. Defaults to None.
+            cache (bool): use result cache for select. Defaults to True.
 
         Returns:
             list[Any] or None
 
         """
+        key = None
+        if self.result_cache is not None and cache and not many:
+            key = self._result_key(query, parameters, result, size)
+        if key is not None:
+            generation, rows = self._lookup_result(key)
+            if rows is not _MISSING:
+                if self.metrics.enabled:
+                    self.metrics.add_cache_hit(query)
+                return self._build_rows(rows, result, row_factory)
+
         command = query.partition(" ")[0].lower()
+        if self.scan_warning_rows is not None and command == "select":
+            self._warn_full_scan(self.connect, query, parameters)
+        event = None
+        if self.instrumentation.enabled:
+            event = self.instrumentation.start(query, parameters)
         cursor = self.connect.cursor()
-        logging.info(query)
-        if many:
-            cursor.executemany(query, parameters)
-        else:
-            cursor.execute(query, parameters)
+        if row_factory is not None and key is None and event is None:
+            cursor.row_factory = row_factory
+        # Transaction opened by user, like with 'BEGIN', is not rolled back
+        implicit = (
+            not self.transaction_depth and
+            not self.connect.in_transaction
+        )
+        try:
+            if many:
+                cursor.executemany(query, parameters)
+            else:
+                cursor.execute(query, parameters)
+        except Exception as e:
+            if event is not None:
+                self.instrumentation.fail(event, e)
+            # Close implicit transaction opened by failed write
+            if implicit and self.connect.in_transaction:
+                self.connect.rollback()
+            raise
 
-        if command in {"insert", "delete", "update", "create", "drop"}:
+        if (
+            command in {"insert", "delete", "update", "create", "drop"} and
+            not self.transaction_depth
+        ):
             self.connect.commit()
 
-        if command in {"drop", "create"}:
-            self.initialize_tables()
+        if self.result_cache is not None:
+            if command not in _READ_COMMANDS:
+                self._forget_results(query)
+            if (
+                self._changed_tables and
+                not self.transaction_depth and
+                not self.connect.in_transaction
+            ):
+                self._invalidate_results()
+
+        if command in {"drop", "create", "alter"}:
+            self.refresh_schema()
+
+        if key is None and event is None:
+            return self._fetch(cursor, result, size)
+        rows = self._fetch(cursor, result, size)
+        if key is not None:
+            self._store_result(key, query, rows, generation)
+        if event is None:
+            return self._build_rows(rows, result, row_factory)
+        return self.instrumentation.build_rows(
+            event,
+            cursor,
+            rows,
+            result,
+            row_factory,
+        )
+
+    def _result_key(
+        self,
+        query: str,
+        parameters: Mapping | Sequence,
+        result: ResultFetch | None,
+        size: int | None,
+    ) -> Hashable | None:
+        """Return result cache key of select, None if it is not cacheable.
 
+        Results read inside transaction see own uncommitted writes,
+        so they are not cached.
+        """
+        if (
+            result is None or
+            self.transaction_depth or
+            self.connect.in_transaction or
+            query.lstrip()[:6].lower() != "select"
+        ):
+            return None
+        if isinstance(parameters, Mapping):
+            values = tuple(sorted(parameters.items()))
+        else:
+            values = tuple(parameters)
+        key = (query, values, result.value, size)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def _lookup_result(self, key: Hashable) -> tuple[int, Any]:
+        """Return cache generation and cached result or _MISSING.
+
+        PRAGMA data_version of connection changes when other connection
+        or process commits, then all cached results are dropped.
+        """
+        cache: ResultCache = self.result_cache  # type: ignore
+        version = self._read_data_version()
+        with self._data_version_lock:
+            if version != self.data_version:
+                self.data_version = version
+                cache.clear()
+            generation = cache.generation
+        return generation, cache.get(key, _MISSING)
+
+    def _read_data_version(self) -> int:
+        """Return PRAGMA data_version of main connection."""
+        return self.connect.execute("PRAGMA data_version").fetchone()[0]
+
+    def _query_table_names(self, query: str) -> frozenset[str]:
+        """Return lower names of tables used in query."""
+        tables = self._query_tables.get(query)
+        if tables is None:
+            words = frozenset(_WORDS.findall(query.lower()))
+            tables = words & self._table_names.keys()
+            self._query_tables.set(query, tables)
+        return tables
+
+    def _store_result(
+        self,
+        key: Hashable,
+        query: str,
+        rows: Any,
+        generation: int,
+    ) -> None:
+        """Put fetched result in result cache."""
+        if rows is None:
+            # Failed read or empty fetchone, nothing to cache
+            return
+        self.result_cache.set(  # type: ignore
+            key,
+            rows,
+            self._query_table_names(query),
+            generation=generation,
+        )
+
+    @staticmethod
+    def _build_rows(
+        rows: Any,
+        result: ResultFetch | None,
+        row_factory: Callable[[sqlite3.Cursor, tuple], Any] | None,
+    ) -> Any:
+        """Create result rows from raw cached items."""
+        if rows is None:
+            return None
+        if result is ResultFetch.fetchone:
+            if row_factory is None:
+                return rows
+            return row_factory(None, rows)  # type: ignore
+        if row_factory is None:
+            return list(rows)
+        return [row_factory(None, item) for item in rows]  # type: ignore
+
+    def _forget_results(self, query: str) -> None:
+        """Mark tables changed by write query."""
+        if self._cascading_writes:
+            self._changed_tables.add(_ALL_TABLES)
+            return
+        self._changed_tables.update(self._query_table_names(query))
+
+    def _invalidate_results(self) -> None:
+        """Remove cached results of changed tables.
+
+        It is called after commit, result read before commit by other
+        connection is not stored because cache generation is changed.
+        """
+        tables, self._changed_tables = self._changed_tables, set()
+        if _ALL_TABLES in tables:
+            self.result_cache.clear()  # type: ignore
+            return
+        self.result_cache.invalidate(*tables)  # type: ignore
+
+    @staticmethod
+    def _fetch(
+        cursor: sqlite3.Cursor,
+        result: ResultFetch | None,
+        size: int | None,
+    ) -> list[Any] | None:
+        """Fetch executed query result."""
         # Check result
         if result is None:
             return None
@@ -185,6 +612,178 @@ class DB:
             return result_func(size=size)
         return result_func()
 
+    def explain(
+        self,
+        query: str,
+        parameters: MutableMapping | Sequence = (),
+    ) -> QueryPlan:
+        """Run EXPLAIN QUERY PLAN and return parsed plan tree."""
+        rows = self.execute(
+            f"EXPLAIN QUERY PLAN {query}",
+            parameters,
+            result=ResultFetch.fetchall,
+            cache=False,
+        )
+        return QueryPlan(query, rows or ())
+
+    def _warn_full_scan(
+        self,
+        connect: sqlite3.Connection,
+        query: str,
+        parameters: MutableMapping | Sequence,
+    ) -> None:
+        """Log warning if query reads big table without index.
+
+        Plan is explained once per query text, row count of table is
+        estimated by max rowid.
+        """
+        tables = self._scan_plans.get(query)
+        if tables is None:
+            plan = QueryPlan(
+                query,
+                connect.execute(
+                    f"EXPLAIN QUERY PLAN {query}",
+                    parameters,
+                ).fetchall(),
+            )
+            tables = plan.full_scans
+            self._scan_plans.set(query, tables)
+        for table in tables:
+            try:
+                rows = connect.execute(
+                    f"SELECT max(rowid) FROM `{table}`",  # noqa: S608
+                ).fetchone()[0]
+            except sqlite3.OperationalError:
+                # WITHOUT ROWID table
+                continue
+            if (rows or 0) > self.scan_warning_rows:  # type: ignore
+                logging.warning(
+                    "Full scan of %s with about %s rows: %s",
+                    table,
+                    rows,
+                    query,
+                )
+
+    def use_profile(self, profile: TProfile) -> None:
+        """Apply PRAGMA profile to connection, see PROFILES."""
+        for name, value in profile_pragmas(profile).items():
+            self.execute(f"PRAGMA {name}={value}")
+        self.profile = profile
+
+    def transaction(self, mode: TTransactionMode = "DEFERRED") -> Transaction:
+        """Create explicit transaction context manager.
+
+        Writes inside it are committed once at exit, nested
+        transactions use savepoints.
+
+        Args:
+            mode (TTransactionMode): BEGIN mode. Defaults to 'DEFERRED'.
+
+        """
+        return Transaction(self, mode)
+
+    def _begin_transaction(self, mode: str) -> str | None:
+        """Begin transaction or savepoint and return savepoint name."""
+        savepoint = None
+        if self.transaction_depth:
+            savepoint = f"lildb_savepoint_{self.transaction_depth}"
+            self.connect.execute(f"SAVEPOINT {savepoint}")
+        else:
+            if self.connect.in_transaction:
+                self.connect.commit()
+            self.connect.execute(f"BEGIN {mode}")
+        self.transaction_depth += 1
+        return savepoint
+
+    def _end_transaction(
+        self,
+        savepoint: str | None,
+        *,
+        commit: bool = True,
+    ) -> None:
+        """Commit or rollback transaction or savepoint."""
+        try:
+            if savepoint is None:
+                self._finish_transaction(commit=commit)
+                return
+            if not commit:
+                self.connect.execute(f"ROLLBACK TO {savepoint}")
+            self.connect.execute(f"RELEASE {savepoint}")
+        finally:
+            self.transaction_depth -= 1
+            if not self.transaction_depth and self._changed_tables:
+                self._invalidate_results()
+
+    def _finish_transaction(self, *, commit: bool) -> None:
+        """Commit or rollback outer transaction."""
+        if not commit:
+            self.connect.rollback()
+            return
+        try:
+            self.connect.commit()
+        except Exception:
+            # Failed writes must not be committed by next autocommit write
+            self.connect.rollback()
+            raise
+
+    def iterate(
+        self,
+        query: str,
+        parameters: MutableMapping | Sequence = (),
+        *,
+        size: int | None = None,
+        row_factory: Callable[[sqlite3.Cursor, tuple], Any] | None = None,
+    ) -> Iterator[Any]:
+        """Execute query and fetch result lazily by chunks.
+
+        Args:
+            query (str): sql query
+            parameters (MutableMapping | Sequence): data for executing.
+            Defaults to ().
+            size (int | None): chunk size for fetchmany operation.
+            Defaults to DB.chunk_size.
+            row_factory (Callable | None): cursor row factory creating
+            result rows. Defaults to None.
+
+        Returns:
+            Iterator[Any]
+
+        """
+        if self.scan_warning_rows is not None:
+            self._warn_full_scan(self.connect, query, parameters)
+        if self.instrumentation.enabled:
+            event = self.instrumentation.start(query, parameters)
+            try:
+                cursor = self.connect.execute(query, parameters)
+            except Exception as e:
+                self.instrumentation.fail(event, e)
+                raise
+            return self.instrumentation.iterate(
+                event,
+                self._iterate_cursor(cursor, size or self.chunk_size),
+                row_factory,
+            )
+        cursor = self.connect.cursor()
+        if row_factory is not None:
+            cursor.row_factory = row_factory
+        cursor.execute(query, parameters)
+        return self._iterate_cursor(cursor, size or self.chunk_size)
+
+    def _iterate_cursor(
+        self,
+        cursor: sqlite3.Cursor,
+        size: int,
+    ) -> Iterator[Any]:
+        """Yield cursor rows and hold only one chunk in memory."""
+        try:
+            while True:
+                chunk = cursor.fetchmany(size)
+                if not chunk:
+                    return
+                yield from chunk
+        finally:
+            cursor.close()
+
     def close(self) -> None:
         """Close connection."""
         self.connect.close()
@@ -197,11 +796,6 @@ class DB:
         """Close connection."""
         self.close()
 
-    if TYPE_CHECKING:
-        def __getattr__(self, name: str) -> Table:
-            """Typing for runtime created table."""
-            ...
-
 
 class Future:
     """Future for managing query execution."""
@@ -241,11 +835,48 @@ class ThreadDB(DB):
         path: str,
         *,
         use_datacls: bool = False,
+        row_mode: TRowMode | None = None,
         debug: bool = False,
+        group_commit: bool = True,
+        readers: int = 0,
+        profile: TProfile | None = None,
+        result_cache: int = 0,
+        result_cache_ttl: float | None = None,
+        scan_warning_rows: int | None = None,
+        slow_query_time: float | None = None,
         **connect_params: Any,
     ) -> None:
-        """Initialize DB create connection, cursor and worker thread."""
+        """Initialize DB create connection, cursor and worker thread.
+
+        Args:
+            path (str): path to db file.
+            use_datacls (bool): use dataclass rows. Defaults to False.
+            row_mode (TRowMode | None): 'dict', 'datacls' or compact 'tuple'
+            rows for all tables. Defaults to None.
+            debug (bool): log sql queries. Defaults to False.
+            group_commit (bool): execute consecutive queued writes in one
+            transaction with single commit. Defaults to True.
+            readers (int): count of read-only connections, they execute
+            SELECT in caller threads in parallel, db is switched to WAL
+            journal mode. Defaults to 0.
+            profile (TProfile | None): PRAGMA profile for worker and reader
+            connections. Defaults to None.
+            result_cache (int): max count of cached select results,
+            0 disables cache. Defaults to 0.
+            result_cache_ttl (float | None): seconds cached result stays
+            valid. Defaults to None.
+            scan_warning_rows (int | None): log warning when select reads
+            without index table with more rows. Defaults to None.
+            slow_query_time (float | None): log warning for statements
+            slower than this seconds. Defaults to None.
+            **connect_params (Any): params for sqlite3.connect.
+
+        """
         connect_params["check_same_thread"] = False
+        self.group_commit = group_commit
+        self.readers: LifoQueue[sqlite3.Connection] | None = None
+        # Owner of explicit transaction holds it, other threads wait
+        self.transaction_lock = RLock()
         self.worker_event = Event()
         self.worker_queue = Queue()
         self.worker = Thread(
@@ -256,48 +887,499 @@ class ThreadDB(DB):
         super().__init__(
             path,
             use_datacls=use_datacls,
+            row_mode=row_mode,
             debug=debug,
+            profile=profile,
+            result_cache=result_cache,
+            result_cache_ttl=result_cache_ttl,
+            scan_warning_rows=scan_warning_rows,
+            slow_query_time=slow_query_time,
             **connect_params,
         )
-        if debug:
-            logging.basicConfig(level=logging.DEBUG)
+        if readers:
+            self._open_readers(readers, connect_params)
+
+    def _open_readers(
+        self,
+        count: int,
+        connect_params: dict[str, Any],
+    ) -> None:
+        """Switch db to WAL and open pool of read-only connections."""
+        if self.path == ":memory:" or not Path(self.path).exists():
+            msg = "Readers need db file."
+            raise ValueError(msg)
+        self.execute("PRAGMA journal_mode=WAL")
+        connect_params = {
+            **connect_params,
+            "uri": True,
+            "check_same_thread": False,
+        }
+        uri = Path(self.path).resolve().as_uri() + "?mode=ro"
+        readers: LifoQueue[sqlite3.Connection] = LifoQueue()
+        for _ in range(count):
+            connect = sqlite3.connect(uri, **connect_params)
+            if self.profile is not None:
+                apply_pragmas(
+                    connect,
+                    profile_pragmas(self.profile, connection_only=True),
+                )
+            readers.put(connect)
+        self.reader_count = count
+        self.readers = readers
+
+    def use_profile(self, profile: TProfile) -> None:
+        """Apply PRAGMA profile to worker and reader connections."""
+        super().use_profile(profile)
+        if self.readers is None:
+            return
+        pragmas = profile_pragmas(profile, connection_only=True)
+        # Take all readers, it waits for readers used by other threads
+        connections = [self.readers.get() for _ in range(self.reader_count)]
+        try:
+            for connect in connections:
+                apply_pragmas(connect, pragmas)
+        finally:
+            for connect in connections:
+                self.readers.put(connect)
+
+    def _use_reader(self, query: str) -> bool:
+        """Check query can be executed by read-only connection."""
+        return (
+            self.readers is not None and
+            not self.transaction_depth and
+            query.lstrip()[:6].lower() == "select" and
+            current_thread() is not self.worker
+        )
+
+    def _execute_read(
+        self,
+        query: str,
+        parameters: MutableMapping | Sequence = (),
+        *,
+        size: int | None = None,
+        result: ResultFetch | None = None,
+        row_factory: Callable[[sqlite3.Cursor, tuple], Any] | None = None,
+        **kwargs: Any,
+    ) -> list[Any] | None:
+        """Execute select in current thread with pooled reader."""
+        connect = self.readers.get()  # type: ignore
+        event = None
+        try:
+            if self.scan_warning_rows is not None:
+                self._warn_full_scan(connect, query, parameters)
+            if self.instrumentation.enabled:
+                event = self.instrumentation.start(query, parameters)
+            cursor = connect.cursor()
+            if row_factory is not None and event is None:
+                cursor.row_factory = row_factory
+            cursor.execute(query, parameters)
+            rows = self._fetch(cursor, result, size)
+            if event is None:
+                return rows
+            return self.instrumentation.build_rows(
+                event,
+                cursor,
+                rows,
+                result,
+                row_factory,
+            )
+        except Exception as e:
+            if event is not None:
+                self.instrumentation.fail(event, e)
+            logging.exception(
+                "Error: %s, Arguments: %s, %s",
+                e,
+                query,
+                parameters,
+            )
+            return None
+        finally:
+            self.readers.put(connect)  # type: ignore
 
     def execute_worker(self) -> None:
-        """Worker for executing sql-query and return result."""
+        """Worker for executing sql-query and return result.
+
+        Worker takes all queued calls at once. Consecutive writes of them
+        are executed in one transaction with single commit, writes with
+        the same query are merged in one executemany.
+        """
         while not self.worker_event.is_set():
+            batch = [self.worker_queue.get()]
+            while self.group_commit:
+                try:
+                    batch.append(self.worker_queue.get_nowait())
+                except Empty:
+                    break
+
+            start = 0
+            while start < len(batch):
+                end = start + 1
+                while (
+                    end < len(batch) and
+                    self._is_group_write(batch[start]) and
+                    self._is_group_write(batch[end])
+                ):
+                    end += 1
+                if end - start > 1:
+                    self._execute_writes(batch[start:end])
+                else:
+                    self._execute_item(batch[start])
+                start = end
+
+            for _ in batch:
+                self.worker_queue.task_done()
+
+    def _execute_item(self, item: tuple[Any, ...]) -> None:
+        """Execute one queued call."""
+        future, func, args, kwargs = item
+        try:
+            if func is None:
+                self.worker_event.set()
+                return
+            future.put(func(*args, **kwargs))
+        except Exception as e:
+            logging.exception(
+                "Error: %s, Arguments: %s, %s",
+                e,
+                args,
+                kwargs,
+            )
+            future.put(e)
+            if not self.transaction_depth:
+                self.connect.rollback()
+        finally:
+            future.event.set()
+
+    def _is_group_write(self, item: tuple[Any, ...]) -> bool:
+        """Check queued call is write without result."""
+        _, func, args, kwargs = item
+        if (
+            getattr(func, "__func__", None) is not DB.execute or
+            kwargs.get("result") is not None or
+            self.transaction_depth
+        ):
+            return False
+        query = args[0] if args else kwargs.get("query", "")
+        command = query.partition(" ")[0].lower()
+        return command in {"insert", "update", "delete"}
+
+    def _execute_writes(self, items: list[tuple[Any, ...]]) -> None:
+        """Execute writes in one transaction and commit once."""
+        # Futures are resolved only after commit
+        pending: list[Future] = []
+        super()._begin_transaction("IMMEDIATE")
+
+        for query, group in groupby(
+            items,
+            key=lambda item: item[2][0] if item[2] else item[3]["query"],
+        ):
+            group_items = list(group)
+            if len(group_items) == 1:
+                self._execute_pending(group_items[0], pending)
+                continue
+
+            parameters: list[Any] = []
+            for _, _, args, kwargs in group_items:
+                item_parameters = (
+                    args[1] if len(args) > 1
+                    else kwargs.get("parameters", ())
+                )
+                if kwargs.get("many"):
+                    parameters.extend(item_parameters)
+                else:
+                    parameters.append(item_parameters)
+
+            event = None
+            if self.instrumentation.enabled:
+                event = self.instrumentation.start(query, parameters)
+            self.connect.execute("SAVEPOINT lildb_group")
             try:
-                future, args, kwargs = self.worker_queue.get()
-                if kwargs.get("finish_worker"):
-                    self.worker_event.set()
-                    continue
-                result = super().execute(*args, **kwargs)
-                future.put(result)
-            except Exception as e:  # noqa: PERF203
-                logging.exception(
-                    "Error: %s, Arguments: %s, %s",
-                    e,
-                    args,
-                    kwargs,
+                cursor = self.connect.executemany(query, parameters)
+            except Exception as e:
+                if event is not None:
+                    self.instrumentation.fail(event, e)
+                # Find failed writes one by one
+                self.connect.execute("ROLLBACK TO lildb_group")
+                self.connect.execute("RELEASE lildb_group")
+                for item in group_items:
+                    self._execute_pending(item, pending)
+                continue
+            self.connect.execute("RELEASE lildb_group")
+            if event is not None:
+                self.instrumentation.build_rows(
+                    event,
+                    cursor,
+                    None,
+                    None,
+                    None,
                 )
+            if self.result_cache is not None:
+                # Cached results are invalidated after commit
+                self._forget_results(query)
+            pending.extend(item[0] for item in group_items)
+
+        try:
+            super()._end_transaction(None, commit=True)
+        except Exception as e:
+            logging.exception("Error: %s, Group commit", e)
+            self.connect.rollback()
+            for future in pending:
                 future.put(e)
-                self.connect.rollback()
-            finally:
-                future.event.set()
-                self.worker_queue.task_done()
+            return
+        for future in pending:
+            future.put(None)
+
+    def _execute_pending(
+        self,
+        item: tuple[Any, ...],
+        pending: list[Future],
+    ) -> None:
+        """Execute one write of group without commit."""
+        future, func, args, kwargs = item
+        try:
+            func(*args, **kwargs)
+        except Exception as e:
+            logging.exception(
+                "Error: %s, Arguments: %s, %s",
+                e,
+                args,
+                kwargs,
+            )
+            future.put(e)
+            if not self.connect.in_transaction:
+                # Error rolled back all transaction with previous writes
+                for pending_future in pending:
+                    pending_future.put(e)
+                pending.clear()
+                self.connect.execute("BEGIN IMMEDIATE")
+            return
+        pending.append(future)
 
-    def execute(self, *args: Any, **kwargs: Any) -> list[Any] | None:
-        """Create future obj and sending args in worker."""
+    def _submit(
+        self,
+        func: Callable[..., Any] | None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Future:
+        """Send callable in worker and wait for execution."""
         future = Future()
-        self.worker_queue.put((future, args, kwargs))
+        # Wait here while other thread owns explicit transaction
+        with self.transaction_lock:
+            self.worker_queue.put((future, func, args, kwargs))
         future.wait()
-        if future.done():
-            return future.result
-        return None
+        return future
+
+    def call(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run callable in worker thread and return its result."""
+        if current_thread() is self.worker:
+            return func(*args, **kwargs)
+        future = self._submit(func, *args, **kwargs)
+        if future.exception is not None:
+            raise future.exception
+        return future.result
+
+    def execute(
+        self,
+        query: str,
+        parameters: MutableMapping | Sequence = (),
+        *,
+        many: bool = False,
+        size: int | None = None,
+        result: ResultFetch | None = None,
+        row_factory: Callable[[sqlite3.Cursor, tuple], Any] | None = None,
+        cache: bool = True,
+    ) -> list[Any] | None:
+        """Create future obj and sending args in worker.
+
+        Cached select result is returned in caller thread without
+        worker, see DB.execute.
+        """
+        # Worker itself (initialize_tables after DDL) executes directly
+        if current_thread() is self.worker:
+            return super().execute(
+                query,
+                parameters,
+                many=many,
+                size=size,
+                result=result,
+                row_factory=row_factory,
+                cache=cache,
+            )
+        key = None
+        if self.result_cache is not None and cache and not many:
+            key = self._result_key(query, parameters, result, size)
+        factory = row_factory
+        if key is not None:
+            generation, rows = self._lookup_result(key)
+            if rows is not _MISSING:
+                if self.metrics.enabled:
+                    self.metrics.add_cache_hit(query)
+                return self._build_rows(rows, result, row_factory)
+            factory = None
+
+        if self._use_reader(query):
+            rows = self._execute_read(
+                query,
+                parameters,
+                size=size,
+                result=result,
+                row_factory=factory,
+            )
+        else:
+            future = self._submit(
+                super().execute,
+                query,
+                parameters,
+                many=many,
+                size=size,
+                result=result,
+                row_factory=factory,
+                cache=False,
+            )
+            if not future.done() or future.exception is not None:
+                return None
+            rows = future.result
+        if key is None:
+            return rows
+        self._store_result(key, query, rows, generation)
+        return self._build_rows(rows, result, row_factory)
+
+    def _read_data_version(self) -> int:
+        """Read data_version by worker, only it uses main connection.
+
+        Version of other connection would change after own commits too.
+        """
+        return self.call(super()._read_data_version)
+
+    def _begin_transaction(self, mode: str) -> str | None:
+        """Begin transaction in worker and lock db for current thread."""
+        self.transaction_lock.acquire()
+        try:
+            return self.call(super()._begin_transaction, mode)
+        except Exception:
+            self.transaction_lock.release()
+            raise
+
+    def _end_transaction(
+        self,
+        savepoint: str | None,
+        *,
+        commit: bool = True,
+    ) -> None:
+        """End transaction in worker and unlock db."""
+        try:
+            self.call(super()._end_transaction, savepoint, commit=commit)
+        finally:
+            self.transaction_lock.release()
+
+    def iterate(
+        self,
+        query: str,
+        parameters: MutableMapping | Sequence = (),
+        *,
+        size: int | None = None,
+        row_factory: Callable[[sqlite3.Cursor, tuple], Any] | None = None,
+    ) -> Iterator[Any]:
+        """Execute query in worker and fetch result lazily by chunks."""
+        if current_thread() is self.worker:
+            return super().iterate(
+                query,
+                parameters,
+                size=size,
+                row_factory=row_factory,
+            )
+        event = None
+        factory = row_factory
+        if self.instrumentation.enabled:
+            event = self.instrumentation.start(query, parameters)
+            # Instrumentation creates rows to time it apart from sqlite
+            row_factory = None
+        try:
+            rows = self._open_rows(query, parameters, size, row_factory)
+        except Exception as e:
+            if event is not None:
+                self.instrumentation.fail(event, e)
+            raise
+        if event is None:
+            return rows
+        return self.instrumentation.iterate(event, rows, factory)
+
+    def _open_rows(
+        self,
+        query: str,
+        parameters: MutableMapping | Sequence,
+        size: int | None,
+        row_factory: Callable[[sqlite3.Cursor, tuple], Any] | None,
+    ) -> Iterator[Any]:
+        """Execute query by reader or worker and return streamed rows."""
+        if self._use_reader(query):
+            connect = self.readers.get()  # type: ignore
+            try:
+                if self.scan_warning_rows is not None:
+                    self._warn_full_scan(connect, query, parameters)
+                cursor = connect.cursor()
+                if row_factory is not None:
+                    cursor.row_factory = row_factory
+                cursor.execute(query, parameters)
+            except Exception:
+                self.readers.put(connect)  # type: ignore
+                raise
+            return self._iterate_reader(
+                connect,
+                cursor,
+                size or self.chunk_size,
+            )
+        cursor = self.call(self._open_cursor, query, parameters, row_factory)
+        return self._iterate_worker_cursor(cursor, size or self.chunk_size)
+
+    def _open_cursor(
+        self,
+        query: str,
+        parameters: MutableMapping | Sequence,
+        row_factory: Callable[[sqlite3.Cursor, tuple], Any] | None = None,
+    ) -> sqlite3.Cursor:
+        """Create cursor and execute query on it."""
+        if self.scan_warning_rows is not None:
+            self._warn_full_scan(self.connect, query, parameters)
+        cursor = self.connect.cursor()
+        if row_factory is not None:
+            cursor.row_factory = row_factory
+        return cursor.execute(query, parameters)
+
+    def _iterate_worker_cursor(
+        self,
+        cursor: sqlite3.Cursor,
+        size: int,
+    ) -> Iterator[Any]:
+        """Yield cursor rows, every chunk is fetched by worker."""
+        try:
+            while True:
+                chunk = self.call(cursor.fetchmany, size)
+                if not chunk:
+                    return
+                yield from chunk
+        finally:
+            if self.worker.is_alive():
+                self.call(cursor.close)
+
+    def _iterate_reader(
+        self,
+        connect: sqlite3.Connection,
+        cursor: sqlite3.Cursor,
+        size: int,
+    ) -> Iterator[Any]:
+        """Yield cursor rows and return reader in pool at the end."""
+        try:
+            yield from self._iterate_cursor(cursor, size)
+        finally:
+            self.readers.put(connect)  # type: ignore
 
     def close(self) -> None:
-        """Close worker thread and close db connection."""
-        self.execute(finish_worker=True)
+        """Close worker thread, readers and close db connection."""
+        self._submit(None)
         self.worker.join()
+        while self.readers is not None and not self.readers.empty():
+            self.readers.get_nowait().close()
         super().close()
 
 
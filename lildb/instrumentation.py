@@ -0,0 +1,424 @@
+"""Module contains statement instrumentation components."""
+from __future__ import annotations
+
+import logging
+from bisect import bisect_left
+from collections import deque
+from threading import Lock
+from time import perf_counter
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from typing import Iterator
+from typing import Mapping
+
+from .enumcls import ResultFetch
+
+
+if TYPE_CHECKING:
+    import sqlite3
+
+    from .db import DB
+
+
+__all__ = (
+    "LATENCY_BUCKETS",
+    "Histogram",
+    "Instrumentation",
+    "StatementEvent",
+    "log_query",
+)
+
+
+# Upper bounds of latency buckets in seconds, 4 buckets per decade
+# from 1 microsecond to 10 seconds
+LATENCY_BUCKETS = tuple(10 ** (exponent / 4) for exponent in range(-24, 5))
+
+THook = Callable[["StatementEvent"], Any]
+
+_END = object()
+
+
+class StatementEvent:
+    """Executed statement passed to instrumentation hooks."""
+
+    __slots__ = (
+        "query",
+        "parameters",
+        "operation",
+        "tables",
+        "rows",
+        "sqlite_time",
+        "build_time",
+        "blob_read",
+        "blob_written",
+        "error",
+        "started",
+    )
+
+    def __init__(
+        self,
+        query: str,
+        parameters: Any,
+        operation: str,
+        tables: frozenset[str],
+    ) -> None:
+        """Initialize.
+
+        Args:
+            query (str): sql query.
+            parameters (Any): query parameters.
+            operation (str): lower sql command, like 'select' or 'insert'.
+            tables (frozenset[str]): lower names of tables in query.
+
+        """
+        self.query = query
+        self.parameters = parameters
+        self.operation = operation
+        self.tables = tables
+        # Fetched or changed rows, set before post hooks
+        self.rows = 0
+        # Seconds spent in sqlite and in creating python rows
+        self.sqlite_time = 0.0
+        self.build_time = 0.0
+        # Bytes of BLOB values fetched and sent in parameters, counted
+        # only when instrumentation 'count_blobs' is set
+        self.blob_read = 0
+        self.blob_written = 0
+        self.error: Exception | None = None
+        self.started = perf_counter()
+
+    @property
+    def time(self) -> float:
+        """Return total seconds of statement."""
+        return self.sqlite_time + self.build_time
+
+    def __repr__(self) -> str:
+        """Repr view."""
+        return (
+            f"<{self.__class__.__name__}: {self.operation} "
+            f"{self.rows} rows {self.time:.6f}s>"
+        )
+
+
+class Histogram:
+    """Thread safe histogram of latencies with fixed buckets."""
+
+    __slots__ = ("bounds", "counts", "count", "total", "max", "_lock")
+
+    def __init__(self, bounds: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        """Initialize.
+
+        Args:
+            bounds (tuple[float, ...]): sorted upper bounds of buckets,
+            values above the last are counted in extra bucket.
+            Defaults to LATENCY_BUCKETS.
+
+        """
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._lock = Lock()
+
+    def add(self, value: float) -> None:
+        """Count value in its bucket."""
+        position = bisect_left(self.bounds, value)
+        with self._lock:
+            self.counts[position] += 1
+            self.count += 1
+            self.total += value
+            if value > self.max:
+                self.max = value
+
+    @property
+    def mean(self) -> float:
+        """Return mean value."""
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, percent: float) -> float:
+        """Return upper bound of bucket with percentile, like 99."""
+        with self._lock:
+            counts = list(self.counts)
+            count = self.count
+        if not count:
+            return 0.0
+        rank = count * percent / 100
+        seen = 0
+        for position, bucket_count in enumerate(counts):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                break
+        if position == len(self.bounds):
+            return self.max
+        return min(self.bounds[position], self.max)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return counters and main percentiles."""
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.mean,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": self.max,
+        }
+
+    def __repr__(self) -> str:
+        """Repr view."""
+        return (
+            f"<{self.__class__.__name__}: count={self.count} "
+            f"mean={self.mean:.6f}s>"
+        )
+
+
+def log_query(event: StatementEvent) -> None:
+    """Log sql query, it is pre hook of debug db."""
+    logging.info(event.query)
+
+
+def _blob_size(values: Any) -> int:
+    """Return bytes of BLOB values in row, parameters or list of them."""
+    if isinstance(values, Mapping):
+        values = values.values()
+    size = 0
+    for value in values:
+        if isinstance(value, (bytes, bytearray)):
+            size += len(value)
+        elif isinstance(value, (Mapping, list, tuple)):
+            size += _blob_size(value)
+    return size
+
+
+def _row_count(
+    rows: Any,
+    result: ResultFetch | None,
+    rowcount: int,
+) -> int:
+    """Return count of fetched rows or rows changed by write."""
+    if result is None:
+        return max(rowcount, 0)
+    if rows is None:
+        return 0
+    if result is ResultFetch.fetchone:
+        return 1
+    return len(rows)
+
+
+class Instrumentation:
+    """Statement hooks, slow query log and latency histograms of db.
+
+    It is disabled until hook, slow query threshold or histograms are
+    added, disabled instrumentation costs one attribute check for each
+    statement.
+    """
+
+    def __init__(self, db: DB) -> None:
+        """Initialize disabled instrumentation."""
+        self.db = db
+        self.enabled = False
+        self.before_hooks: list[THook] = []
+        self.after_hooks: list[THook] = []
+        self.slow_query_time: float | None = None
+        self.slow_queries: deque[StatementEvent] = deque(maxlen=100)
+        self.collect_histograms = False
+        self.count_blobs = False
+        # Operation -> latency histogram
+        self.histograms: dict[str, Histogram] = {}
+        self._lock = Lock()
+
+    def _update(self) -> None:
+        """Enable instrumentation if anything listens."""
+        self.enabled = bool(
+            self.before_hooks or
+            self.after_hooks or
+            self.slow_query_time is not None or
+            self.collect_histograms,
+        )
+
+    def add_hook(
+        self,
+        *,
+        before: THook | None = None,
+        after: THook | None = None,
+    ) -> None:
+        """Add hooks called before and after each statement.
+
+        Args:
+            before (THook | None): called with event before execution.
+            Defaults to None.
+            after (THook | None): called with finished event, it has rows
+            count, times and error. Defaults to None.
+
+        """
+        if before is not None:
+            self.before_hooks.append(before)
+        if after is not None:
+            self.after_hooks.append(after)
+        self._update()
+
+    def remove_hook(self, hook: THook) -> None:
+        """Remove hook added before or after statements."""
+        if hook in self.before_hooks:
+            self.before_hooks.remove(hook)
+        if hook in self.after_hooks:
+            self.after_hooks.remove(hook)
+        self._update()
+
+    def log_slow_queries(
+        self,
+        seconds: float | None,
+        *,
+        keep: int = 100,
+    ) -> None:
+        """Log warning for statements slower than threshold.
+
+        Args:
+            seconds (float | None): threshold, None disables log.
+            keep (int): count of last slow statements kept in
+            'slow_queries'. Defaults to 100.
+
+        """
+        self.slow_query_time = seconds
+        if keep != self.slow_queries.maxlen:
+            self.slow_queries = deque(self.slow_queries, maxlen=keep)
+        self._update()
+
+    def use_histograms(self, enabled: bool = True) -> None:
+        """Collect latency histogram for each operation."""
+        self.collect_histograms = enabled
+        self._update()
+
+    def latency(self) -> dict[str, dict[str, Any]]:
+        """Return histogram snapshots by operation."""
+        with self._lock:
+            histograms = dict(self.histograms)
+        return {
+            operation: histogram.snapshot()
+            for operation, histogram in histograms.items()
+        }
+
+    def reset(self) -> None:
+        """Forget slow queries and histograms."""
+        with self._lock:
+            self.histograms.clear()
+        self.slow_queries.clear()
+
+    def _call_hooks(
+        self,
+        hooks: list[THook],
+        event: StatementEvent,
+    ) -> None:
+        """Call hooks, their errors are logged and do not break query."""
+        for hook in hooks:
+            try:
+                hook(event)
+            except Exception as e:
+                logging.exception("Error: %s, Hook: %s", e, hook)
+
+    def start(self, query: str, parameters: Any) -> StatementEvent:
+        """Create event of statement and call pre hooks."""
+        event = StatementEvent(
+            query,
+            parameters,
+            query.lstrip().partition(" ")[0].lower(),
+            self.db._query_table_names(query),
+        )
+        if self.count_blobs:
+            event.blob_written = _blob_size(parameters)
+        if self.before_hooks:
+            self._call_hooks(self.before_hooks, event)
+            event.started = perf_counter()
+        return event
+
+    def finish(self, event: StatementEvent) -> None:
+        """Collect finished statement and call post hooks."""
+        if self.collect_histograms:
+            histogram = self.histograms.get(event.operation)
+            if histogram is None:
+                with self._lock:
+                    histogram = self.histograms.setdefault(
+                        event.operation,
+                        Histogram(),
+                    )
+            histogram.add(event.time)
+        if (
+            self.slow_query_time is not None and
+            event.time >= self.slow_query_time
+        ):
+            self.slow_queries.append(event)
+            logging.warning(
+                "Slow query %.6fs, %s rows: %s",
+                event.time,
+                event.rows,
+                event.query,
+            )
+        if self.after_hooks:
+            self._call_hooks(self.after_hooks, event)
+
+    def fail(self, event: StatementEvent, error: Exception) -> None:
+        """Finish statement failed in sqlite."""
+        event.sqlite_time = perf_counter() - event.started
+        event.error = error
+        self.finish(event)
+
+    def build_rows(
+        self,
+        event: StatementEvent,
+        cursor: sqlite3.Cursor,
+        rows: Any,
+        result: ResultFetch | None,
+        row_factory: Callable[[sqlite3.Cursor, tuple], Any] | None,
+    ) -> Any:
+        """Create result rows from fetched items and finish statement."""
+        start = perf_counter()
+        event.sqlite_time = start - event.started
+        built = self.db._build_rows(rows, result, row_factory)
+        event.build_time = perf_counter() - start
+        event.rows = _row_count(rows, result, cursor.rowcount)
+        if self.count_blobs and rows is not None:
+            event.blob_read = _blob_size(rows)
+        self.finish(event)
+        return built
+
+    def iterate(
+        self,
+        event: StatementEvent,
+        rows: Iterator[Any],
+        row_factory: Callable[[sqlite3.Cursor, tuple], Any] | None,
+    ) -> Iterator[Any]:
+        """Wrap streamed rows, statement is finished with iteration."""
+        event.sqlite_time = perf_counter() - event.started
+        return self._iterate(event, rows, row_factory)
+
+    def _iterate(
+        self,
+        event: StatementEvent,
+        rows: Iterator[Any],
+        row_factory: Callable[[sqlite3.Cursor, tuple], Any] | None,
+    ) -> Iterator[Any]:
+        """Yield rows and time fetching apart from creating rows."""
+        try:
+            while True:
+                start = perf_counter()
+                row = next(rows, _END)
+                event.sqlite_time += perf_counter() - start
+                if row is _END:
+                    return
+                if self.count_blobs:
+                    event.blob_read += _blob_size(row)
+                if row_factory is not None:
+                    start = perf_counter()
+                    row = row_factory(None, row)  # type: ignore
+                    event.build_time += perf_counter() - start
+                event.rows += 1
+                yield row
+        except Exception as e:
+            event.error = e
+            raise
+        finally:
+            rows.close()  # type: ignore
+            self.finish(event)
+
@@ -0,0 +1,183 @@
+"""Module contains per table metrics components."""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Dict
+
+
+if TYPE_CHECKING:
+    from .db import DB
+    from .instrumentation import StatementEvent
+
+
+__all__ = (
+    "OPERATIONS",
+    "Metrics",
+    "TMetricsSnapshot",
+)
+
+
+# Table operations with timed calls
+OPERATIONS = ("select", "insert", "update", "delete", "query")
+
+# Counters of each table
+COUNTERS = (
+    "statements",
+    "errors",
+    "rows_read",
+    "rows_written",
+    "blob_bytes_read",
+    "blob_bytes_written",
+    "cache_hits",
+    *(f"{operation}_calls" for operation in OPERATIONS),
+    *(f"{operation}_seconds" for operation in OPERATIONS),
+)
+
+# Statements changing rows
+_WRITES = frozenset(("insert", "update", "delete", "replace"))
+
+# Table name -> counter name -> value
+TMetricsSnapshot = Dict[str, Dict[str, float]]
+
+
+class Metrics:
+    """Thread safe per table counters of db.
+
+    Statement counters are collected by instrumentation hook, so they
+    include writes merged by ThreadDB group commit and streamed rows.
+    Table operations add count and seconds of their calls, result cache
+    adds hits. Statement using several tables is counted for each.
+    """
+
+    def __init__(self, db: DB) -> None:
+        """Initialize disabled metrics."""
+        self.db = db
+        self.enabled = False
+        self._tables: TMetricsSnapshot = {}
+        self._lock = Lock()
+
+    def enable(self) -> None:
+        """Start collecting metrics."""
+        if self.enabled:
+            return
+        self.enabled = True
+        self.db.instrumentation.count_blobs = True
+        self.db.instrumentation.add_hook(after=self._add_statement)
+
+    def disable(self) -> None:
+        """Stop collecting metrics, collected values are kept."""
+        if not self.enabled:
+            return
+        self.enabled = False
+        self.db.instrumentation.count_blobs = False
+        self.db.instrumentation.remove_hook(self._add_statement)
+
+    def reset(self) -> None:
+        """Set all counters to zero."""
+        with self._lock:
+            self._tables.clear()
+
+    def add(self, table: str, **counters: float) -> None:
+        """Increase counters of table by values."""
+        with self._lock:
+            values = self._tables.get(table)
+            if values is None:
+                values = self._tables[table] = dict.fromkeys(COUNTERS, 0)
+            for name, value in counters.items():
+                values[name] += value
+
+    def _add_statement(self, event: StatementEvent) -> None:
+        """Count statement finished by instrumentation."""
+        rows = "rows_written" if event.operation in _WRITES else "rows_read"
+        for table in event.tables:
+            self.add(
+                table,
+                statements=1,
+                errors=int(event.error is not None),
+                blob_bytes_read=event.blob_read,
+                blob_bytes_written=event.blob_written,
+                **{rows: event.rows},
+            )
+
+    def add_cache_hit(self, query: str) -> None:
+        """Count select result taken from result cache."""
+        for table in self.db._query_table_names(query):
+            self.add(table, cache_hits=1)
+
+    def add_call(self, table: str, operation: str, seconds: float) -> None:
+        """Count call of table operation, like 'select'."""
+        self.add(
+            table.lower(),
+            **{f"{operation}_calls": 1, f"{operation}_seconds": seconds},
+        )
+
+    def snapshot(self) -> TMetricsSnapshot:
+        """Return copy of counters by table."""
+        with self._lock:
+            return {
+                table: dict(values)
+                for table, values in self._tables.items()
+            }
+
+    @staticmethod
+    def diff(
+        before: TMetricsSnapshot,
+        after: TMetricsSnapshot,
+    ) -> TMetricsSnapshot:
+        """Return counters changed between two snapshots."""
+        changes = {}
+        for table, values in after.items():
+            previous = before.get(table, {})
+            changed = {
+                name: value - previous.get(name, 0)
+                for name, value in values.items()
+                if value != previous.get(name, 0)
+            }
+            if changed:
+                changes[table] = changed
+        return changes
+
+    def to_dict(self) -> dict[str, Any]:
+        """Export counters by table with totals of all tables."""
+        tables = self.snapshot()
+        total: dict[str, float] = dict.fromkeys(COUNTERS, 0)
+        for values in tables.values():
+            for name, value in values.items():
+                total[name] += value
+        return {"tables": tables, "total": total}
+
+    def to_prometheus(self, prefix: str = "lildb") -> str:
+        """Export counters in Prometheus text format."""
+        tables = self.snapshot()
+        lines = []
+        for name in COUNTERS:
+            metric = f"{prefix}_{name}_total"
+            lines.append(f"# TYPE {metric} counter")
+            for table, values in sorted(tables.items()):
+                label = table.replace("\\", "\\\\").replace('"', '\\"')
+                lines.append(
+                    f'{metric}{{table="{label}"}} {values[name]}',
+                )
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(
+        self,
+        path: str | Path,
+        prefix: str = "lildb",
+    ) -> None:
+        """Write Prometheus text file, like for node exporter collector.
+
+        File is replaced at once, so collector never reads half of it.
+        """
+        path = Path(path)
+        temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        temp_path.write_text(self.to_prometheus(prefix))
+        os.replace(temp_path, path)
+
+    def __repr__(self) -> str:
+        """Repr view."""
+        return f"<{self.__class__.__name__}: {len(self._tables)} tables>"
@@ -1,25 +1,41 @@
 """Module contains base operation classes."""
 from __future__ import annotations
 
+import os
 from abc import ABC
 from abc import abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from functools import reduce
+from itertools import islice
+from operator import add
+from time import perf_counter
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import Callable
 from typing import Generator
 from typing import Iterable
+from typing import Iterator
 from typing import Literal
 from typing import MutableMapping
 from typing import Sequence
+from typing import overload
 
 from .column_types import BaseType
 from .enumcls import ResultFetch
+from .parallel import db_uri
+from .parallel import map_partition
+from .parallel import partition_bounds
+from .parallel import reduce_partition
+from .profiles import profile_pragmas
 from .rows import ABCRow
-from .rows import create_result_row
 
 
 if TYPE_CHECKING:
     from .column_types import ForeignKey
+    from .column_types import Index
     from .db import DB
+    from .plan import QueryPlan
     from .rows import TRow
     from .sql import SQLBase
     from .table import Column
@@ -85,6 +101,9 @@ class TableOperation(Operation, ABC):
 
     __slots__ = ("table",)
 
+    # Name of operation in db metrics
+    metric_name = "operation"
+
     def __init__(self, table: Table) -> None:
         self.table = table
 
@@ -95,6 +114,7 @@ class TableOperation(Operation, ABC):
         *,
         without_parameters: bool = False,
         is_null: bool = True,
+        prefix: str = "",
     ) -> str:
         if operator.lower() not in {"and", "or", ","}:
             msg = "Incorrect operator."
@@ -104,7 +124,7 @@ class TableOperation(Operation, ABC):
             return f" {operator} ".join(
                 f"{key} is NULL" if (
                     value is None and is_null
-                ) else f"{key} = :{key}"
+                ) else f"{key} = :{prefix}{key}"
                 for key, value in data.items()
             )
 
@@ -119,6 +139,75 @@ class TableOperation(Operation, ABC):
             for key, value in data.items()
         )
 
+    def _execute_observed(self, query: str, *args: Any, **kwargs: Any) -> Any:
+        """Execute query and record it by db metrics and index advisor."""
+        db = self.table.db
+        if not db.metrics.enabled and not db.advisor.enabled:
+            return self.table.execute(query, *args, **kwargs)
+        start = perf_counter()
+        result = self.table.execute(query, *args, **kwargs)
+        seconds = perf_counter() - start
+        if db.metrics.enabled:
+            db.metrics.add_call(self.table.name, self.metric_name, seconds)
+        if db.advisor.enabled and query.startswith("SELECT"):
+            db.advisor.record(
+                self.table,
+                query,
+                args[0] if args else (),
+                seconds,
+            )
+        return result
+
+    def _iterate_observed(
+        self,
+        query: str,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Iterator[Any]:
+        """Stream query rows and record it by db metrics and advisor.
+
+        Metrics call lasts until rows are exhausted or stream is closed,
+        advisor records time of starting the query.
+        """
+        db = self.table.db
+        if not db.metrics.enabled and not db.advisor.enabled:
+            return self.table.iterate(query, *args, **kwargs)
+        start = perf_counter()
+        rows = self.table.iterate(query, *args, **kwargs)
+        if db.advisor.enabled and query.startswith("SELECT"):
+            db.advisor.record(
+                self.table,
+                query,
+                args[0] if args else (),
+                perf_counter() - start,
+            )
+        if not db.metrics.enabled:
+            return rows
+        return self._observe_rows(rows, start)
+
+    def _observe_rows(
+        self,
+        rows: Iterator[Any],
+        start: float,
+    ) -> Iterator[Any]:
+        """Yield rows and add call time to db metrics at the end."""
+        try:
+            yield from rows
+        finally:
+            self.table.db.metrics.add_call(
+                self.table.name,
+                self.metric_name,
+                perf_counter() - start,
+            )
+
+    def _statement(
+        self,
+        key: tuple[Any, ...],
+        factory: Callable[[], str],
+    ) -> str:
+        """Fetch sql text for operation shape from table statement cache."""
+        return self.table.statements.get_or_create(key, factory)
+
     @abstractmethod
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
         ...
@@ -129,10 +218,18 @@ class Select(TableOperation):
 
     __slots__ = ()
 
+    metric_name = "select"
+
     def query(self, columns: Iterable[str] | None = None) -> str:
         """Fetch base query."""
-        columns_str = self._generate_columns(columns)
-        return f"SELECT {columns_str} FROM {self.table.name}"  # noqa: S608
+        columns_key = tuple(columns) if columns else None
+        return self._statement(
+            ("select", columns_key),
+            lambda: "SELECT {} FROM {}".format(  # noqa: S608
+                self._generate_columns(columns_key),
+                self.table.name,
+            ),
+        )
 
     def _generate_columns(
         self,
@@ -149,6 +246,34 @@ class Select(TableOperation):
             for name in columns_names
         )
 
+    @overload
+    def _execute(
+        self,
+        query: str,
+        parameters: TQueryData,
+        *,
+        size: int = ...,
+        columns: Iterable[str] | None = ...,
+        return_generator: Literal[False] = ...,
+        chunk_size: int | None = ...,
+        cache: bool = ...,
+    ) -> list[TRow]:
+        ...
+
+    @overload
+    def _execute(
+        self,
+        query: str,
+        parameters: TQueryData,
+        *,
+        size: int = ...,
+        columns: Iterable[str] | None = ...,
+        return_generator: Literal[True],
+        chunk_size: int | None = ...,
+        cache: bool = ...,
+    ) -> Iterator[TRow]:
+        ...
+
     def _execute(
         self,
         query: str,
@@ -157,79 +282,127 @@ class Select(TableOperation):
         size: int = 0,
         columns: Iterable[str] | None = None,
         return_generator: bool = False,
-    ) -> list[TRow]:
+        chunk_size: int | None = None,
+        cache: bool = True,
+    ) -> list[TRow] | Iterator[TRow]:
         """Execute with size."""
-        # result = None
+        row_factory = self.table.row_factory(columns)
+        if return_generator:
+            items = self._iterate_observed(
+                query,
+                parameters,
+                size=chunk_size,
+                row_factory=row_factory,
+            )
+            if size:
+                return islice(items, size)
+            return items
         if size:
-            result = self.table.execute(
+            result = self._execute_observed(
                 query,
                 parameters,
                 size=size,
                 result=ResultFetch.fetchmany,
+                row_factory=row_factory,
+                cache=cache,
             )
         else:
-            result = self.table.execute(
+            result = self._execute_observed(
                 query,
                 parameters,
                 result=ResultFetch.fetchall,
+                row_factory=row_factory,
+                cache=cache,
             )
-        if return_generator:
-            self._as_generator_row(result, columns=columns)
-        return self._as_list_row(result, columns=columns)
+        return result or []
 
-    def _as_list_row(
+    def _filter(
         self,
-        items: Iterable[tuple[tuple[Any, ...]]],
+        filter_by: TQueryData,
         *,
+        operator: TOperator = "AND",
         columns: Iterable[str] | None = None,
-    ) -> list[TRow]:
-        """Create list rows."""
-        row_cls = self.table.row_cls
-        columns_name = self.table.column_names
-        if columns:
-            row_cls = create_result_row(columns)
-            columns_name = columns
-        return [
-            row_cls(
-                table=self.table,
-                **dict(zip(columns_name, item)),
-            )
-            for item in items
-        ]
+    ) -> str:
+        """Filter data by filters value where key is
+        column name value is content.
+        """
+        key = (
+            "select",
+            tuple(columns) if columns else None,
+            tuple(filter_by),
+            operator,
+            tuple(value is None for value in filter_by.values()),
+        )
+        return self._statement(
+            key,
+            lambda: "{} WHERE {}".format(
+                self.query(columns),
+                self._make_operator_query(filter_by, operator),
+            ),
+        )
 
-    def _as_generator_row(
+    def _select_query(
         self,
-        items: Iterable[tuple[tuple[Any, ...]]],
-        *,
-        columns: Iterable[str] | None = None,
-    ) -> Generator[ABCRow, Any, None]:
-        """Create rows generator."""
-        row_cls = self.table.row_cls
-        columns_name = self.table.column_names
-        if columns:
-            row_cls = create_result_row(columns)
-            columns_name = columns
-        for item in items:
-            yield row_cls(
-                table=self.table,
-                **dict(zip(columns_name, item)),
+        filter_by: TQueryData,
+        operator: TOperator,
+        columns: Iterable[str] | None,
+        condition: str | None,
+    ) -> str:
+        """Create select query with condition or filter."""
+        if condition:
+            return "{} WHERE {}".format(
+                self.query(columns),
+                condition,
             )
+        if filter_by:
+            return self._filter(
+                filter_by,
+                operator=operator,
+                columns=columns,
+            )
+        return self.query(columns)
 
-    def _filter(
+    def explain(
         self,
-        filter_by: TQueryData,
         *,
         operator: TOperator = "AND",
         columns: Iterable[str] | None = None,
+        condition: str | None = None,
+        **filter_by: Any,
+    ) -> QueryPlan:
+        """Return query plan of select with the same arguments."""
+        query = self._select_query(filter_by, operator, columns, condition)
+        return self.table.db.explain(query, filter_by)
+
+    @overload
+    def __call__(
+        self,
+        *,
+        size: int = ...,
+        operator: TOperator = ...,
+        columns: Iterable[str] | None = ...,
+        condition: str | None = ...,
+        return_generator: Literal[False] = ...,
+        chunk_size: int | None = ...,
+        cache: bool = ...,
+        **filter_by: Any,
     ) -> list[TRow]:
-        """Filter data by filters value where key is
-        column name value is content.
-        """
-        operator_query = self._make_operator_query(
-            filter_by,
-            operator,
-        )
-        return f"{self.query(columns)} WHERE {operator_query}"
+        ...
+
+    @overload
+    def __call__(
+        self,
+        *,
+        size: int = ...,
+        operator: TOperator = ...,
+        columns: Iterable[str] | None = ...,
+        condition: str | None = ...,
+        return_generator: Literal[True],
+        chunk_size: int | None = ...,
+        cache: bool = ...,
+        **filter_by: Any,
+    ) -> Iterator[TRow]:
+        ...
 
     def __call__(
         self,
@@ -239,27 +412,35 @@ class Select(TableOperation):
         columns: Iterable[str] | None = None,
         condition: str | None = None,
         return_generator: bool = False,
-        **filter_by: int | str | None,
-    ) -> list[TRow]:
-        """Select-query for current table."""
-        query = self.query(columns)
-        if filter_by:
-            query = self._filter(
+        chunk_size: int | None = None,
+        cache: bool = True,
+        **filter_by: Any,
+    ) -> list[TRow] | Iterator[TRow]:
+        """Select-query for current table.
+
+        With 'return_generator' rows are streamed from an open cursor
+        by chunks of 'chunk_size' rows (DB.chunk_size by default).
+        The cursor sees rows written during iteration, so do not modify
+        the table while iterating, use list result instead.
+        Streamed rows are never cached, 'cache=False' skips db result
+        cache for list result.
+        """
+        query = self._select_query(filter_by, operator, columns, condition)
+        if return_generator:
+            return self._execute(
+                query,
                 filter_by,
-                operator=operator,
+                size=size,
                 columns=columns,
-            )
-        if condition:
-            query = "{} WHERE {}".format(
-                self.query(columns),
-                condition,
+                return_generator=True,
+                chunk_size=chunk_size,
             )
         return self._execute(
             query,
             filter_by,
             size=size,
             columns=columns,
-            return_generator=return_generator,
+            cache=cache,
         )
 
 
@@ -268,18 +449,27 @@ class Insert(TableOperation):
 
     __slots__ = ()
 
+    metric_name = "insert"
+
     def query(
         self,
         data: Sequence[TQueryData],
     ) -> str:
         """Create insert sql-query."""
+        return self._statement(
+            ("insert", tuple(data[0])),
+            lambda: self._create_query_str(data[0]),
+        )
+
+    def _create_query_str(self, row: TQueryData) -> str:
+        """Create insert sql-query for row keys."""
         query = ", ".join(
             f":{key}"
-            for key in data[0]
+            for key in row
         )
         colums_name = ", ".join(
             name
-            for name in data[0]
+            for name in row
         )
         return f"INSERT INTO {self.table.name} ({colums_name}) VALUES({query})"
 
@@ -293,7 +483,7 @@ class Insert(TableOperation):
             raise ValueError(msg)
         if isinstance(data, dict):
             data = (data,)
-        self.table.execute(self.query(data), data, many=True)
+        self._execute_observed(self.query(data), data, many=True)
 
 
 class Delete(TableOperation):
@@ -301,6 +491,8 @@ class Delete(TableOperation):
 
     __slots__ = ()
 
+    metric_name = "delete"
+
     def query(self) -> str:
         """Fetch base delete query."""
         return f"DELETE FROM {self.table.name} WHERE id=?"  # noqa: S608
@@ -315,12 +507,20 @@ class Delete(TableOperation):
         if not filter_by:
             msg = "Value do not be empty."
             raise ValueError(msg)
-        query_and = self._make_operator_query(filter_by, operator)
-        query = "DELETE FROM {} WHERE {}".format(
-            self.table.name,
-            query_and
+        key = (
+            "delete",
+            tuple(filter_by),
+            operator,
+            tuple(value is None for value in filter_by.values()),
+        )
+        query = self._statement(
+            key,
+            lambda: "DELETE FROM {} WHERE {}".format(
+                self.table.name,
+                self._make_operator_query(filter_by, operator),
+            ),
         )
-        self.table.execute(query, filter_by)
+        self._execute_observed(query, filter_by)
 
     def __call__(
         self,
@@ -331,16 +531,30 @@ class Delete(TableOperation):
         **filter_by: int | str | None,
     ) -> None:
         """Delete-query for current table."""
+        try:
+            self._delete(id, operator, condition, filter_by)
+        finally:
+            # Rows read meanwhile could be stale, so clear after write
+            self.table.clear_identity_map()
+
+    def _delete(
+        self,
+        id: int | Iterable[int] | None,  # noqa: A002
+        operator: TOperator,
+        condition: str | None,
+        filter_by: dict[str, Any],
+    ) -> None:
+        """Execute delete query."""
         if isinstance(id, Iterable):
             ids = tuple((id_,) for id_ in id)
-            self.table.execute(self.query(), ids, many=True)  # type: ignore
+            self._execute_observed(self.query(), ids, many=True)
             return
         if id is not None:
             filter_by["id"] = id
 
         if condition:
             query = f"DELETE FROM {self.table.name} WHERE {condition}"
-            self.table.execute(query)  # type: ignore
+            self._execute_observed(query)
             return
 
         self._filter(filter_by, operator=operator)
@@ -351,6 +565,11 @@ class Update(TableOperation):
 
     __slots__ = ("query",)
 
+    metric_name = "update"
+
+    # Prefix of filter parameter names, so they do not clash with data keys
+    filter_prefix = "__filter_"
+
     def __init__(self, table: Table) -> None:
         super().__init__(table)
         self.query = f"UPDATE {self.table.name} SET "
@@ -369,24 +588,59 @@ class Update(TableOperation):
         if not data:
             msg = "Argument 'data' do not be empty."
             raise ValueError(msg)
-        new_column_values = self._make_operator_query(
-            data,
-            operator=",",
-            is_null=False,
-        )
-        filter_value = self._make_operator_query(
-            filter_by,
-            operator,
-            without_parameters=True,
-        )
-        query = self.query + new_column_values
+        try:
+            self._update(data, operator, condition, filter_by)
+        finally:
+            # Rows read meanwhile could be stale, so clear after write
+            self.table.clear_identity_map()
+
+    def _update(
+        self,
+        data: TQueryData,
+        operator: TOperator,
+        condition: str | None,
+        filter_by: dict[str, Any],
+    ) -> None:
+        """Execute update query."""
         if filter_by:
-            query = f"{query} WHERE {filter_value}"
-            self.table.execute(query, data)  # type: ignore
+            key = (
+                "update",
+                tuple(data),
+                tuple(filter_by),
+                operator,
+                tuple(value is None for value in filter_by.values()),
+            )
+            query = self._statement(
+                key,
+                lambda: "{} WHERE {}".format(
+                    self._set_query(data),
+                    self._make_operator_query(
+                        filter_by,
+                        operator,
+                        prefix=self.filter_prefix,
+                    ),
+                ),
+            )
+            parameters = dict(data)
+            for name, value in filter_by.items():
+                parameters[self.filter_prefix + name] = value
+            self._execute_observed(query, parameters)
             return
+        query = self._statement(
+            ("update", tuple(data)),
+            lambda: self._set_query(data),
+        )
         if condition:
             query = f"{query} WHERE {condition}"
-        self.table.execute(query, data)  # type: ignore
+        self._execute_observed(query, data)
+
+    def _set_query(self, data: TQueryData) -> str:
+        """Create update sql-query without filter."""
+        return self.query + self._make_operator_query(
+            data,
+            operator=",",
+            is_null=False,
+        )
 
 
 class Query(TableOperation):
@@ -400,9 +654,12 @@ class Query(TableOperation):
         "_groups",
         "_limit",
         "_offset",
+        "_use_cache",
         "columns",
     )
 
+    metric_name = "query"
+
     _body: str
     _filters: tuple[Any, ...]
     _having: tuple[Any, ...]
@@ -410,6 +667,7 @@ class Query(TableOperation):
     _groups: tuple[Any, ...]
     _limit: int
     _offset: int
+    _use_cache: bool
     columns: Iterable[str | SQLBase] | None
 
     def __init__(
@@ -461,23 +719,11 @@ class Query(TableOperation):
 
     __str__ = _create_query_str
 
-    def _as_list_row(
-        self,
-        items: Iterable[tuple[tuple[Any, ...]]],
-    ) -> list[ABCRow]:
-        """Create list rows."""
-        row_cls = self.table.row_cls
-        columns_name: Iterable[str] = self.table.column_names
+    def _row_factory(self) -> Callable[[Any, tuple], ABCRow]:
+        """Return cursor row factory for query columns."""
         if self.columns:
-            columns_name = self.result_row_column_names
-            row_cls = create_result_row(columns_name)
-        return [
-            row_cls(
-                table=self.table,
-                **dict(zip(columns_name, item)),
-            )
-            for item in items
-        ]
+            return self.table.row_factory(self.result_row_column_names)
+        return self.table.row_factory()
 
     @property
     def result_row_column_names(self) -> list[str]:
@@ -509,17 +755,27 @@ class Query(TableOperation):
             for name in columns_names
         )
 
-    def _execute(self, query: str, size: int | None = None) -> list[tuple]:
+    def _execute(
+        self,
+        query: str,
+        size: int | None = None,
+        *,
+        row_factory: Callable[[Any, tuple], Any] | None = None,
+    ) -> list[Any]:
         """Execute query."""
         if size:
-            return self.table.execute(
+            return self._execute_observed(
                 query,
                 size=size,
                 result=ResultFetch.fetchmany,
+                row_factory=row_factory,
+                cache=self._use_cache,
             )
-        return self.table.execute(
+        return self._execute_observed(
             query,
             result=ResultFetch.fetchall,
+            row_factory=row_factory,
+            cache=self._use_cache,
         )
 
     def limit(self, limit_number: int) -> Query:
@@ -538,6 +794,11 @@ class Query(TableOperation):
         self._offset = offset_number
         return self
 
+    def cache(self, enabled: bool = True) -> Query:
+        """Use db result cache for query results, it is used by default."""
+        self._use_cache = enabled
+        return self
+
     def order_by(self, *args: str, **orders: Literal["asc", "desc"]) -> Query:
         """Use order by in query."""
         order_types = {"asc", "desc"}
@@ -656,6 +917,10 @@ class Query(TableOperation):
         self._groups += tuple(map(str, args))
         return self
 
+    def explain(self) -> QueryPlan:
+        """Return query plan, see QueryPlan."""
+        return self.table.db.explain(self._create_query_str())
+
     def exists(self) -> bool:
         """Contain all query in exists command."""
         query = self._create_query_str()
@@ -681,8 +946,7 @@ class Query(TableOperation):
         """Return first item from query."""
         self.limit(1)
         query = self._create_query_str()
-        result = self._execute(query, 0)
-        items = self._as_list_row(result)
+        items = self._execute(query, 0, row_factory=self._row_factory())
         if not items:
             return None
         return items[0]
@@ -697,34 +961,277 @@ class Query(TableOperation):
     ) -> list[ABCRow]:
         """Return first item from query."""
         query = self._create_query_str()
-        result = self._execute(query, size)
         if only_data:
-            return result
-        return self._as_list_row(result)
+            return self._execute(query, size)
+        return self._execute(query, size, row_factory=self._row_factory())
 
-    def generative_all(self, limit: int) -> Generator[ABCRow, Any, None]:
-        """Return first item from query."""
-        row_cls = self.table.row_cls
-        columns_name = self.table.column_names
-        if self.columns:
-            columns_name = self.result_row_column_names
-            row_cls = create_result_row(columns_name)
+    def _parse_order(self, order: str) -> tuple[str, str]:
+        """Split order by item on column and direction."""
+        column, _, direction = order.strip().rpartition(" ")
+        if column and direction.lower() in {"asc", "desc"}:
+            return column.strip(), direction.upper()
+        return order.strip(), "ASC"
+
+    def _keyset_all(
+        self,
+        limit: int,
+        key: str | Sequence[str],
+    ) -> Generator[ABCRow, Any, None]:
+        """Return rows page by page with keyset (seek) pagination."""
+        if self._groups or self._having:
+            msg = "Keyset pagination do not support group by and having."
+            raise ValueError(msg)
+
+        orders = [self._parse_order(order) for order in self._orders]
+        directions = {direction for _, direction in orders} or {"ASC"}
+        if len(directions) > 1:
+            msg = "Keyset pagination need one direction for all orders."
+            raise ValueError(msg)
+        direction = directions.pop()
+
+        keys = (key,) if isinstance(key, str) else tuple(key)
+        seek_columns = [
+            self._prepare_column(column)
+            for column, _ in orders
+        ]
+        seek_columns.extend(f"`{self.table.name}`.{key}" for key in keys)
+        seek_str = ", ".join(seek_columns)
+        seek_count = len(seek_columns)
+
+        where_str = " ".join(map(lambda i: str(i), self._filters))
+        seek_condition = "({}) {} ({})".format(
+            seek_str,
+            ">" if direction == "ASC" else "<",
+            ", ".join("?" * seek_count),
+        )
+        order_by_str = " ORDER BY {} LIMIT {}".format(
+            ", ".join(f"{column} {direction}" for column in seek_columns),
+            limit,
+        )
+        base_query = "SELECT {}, {} FROM {}".format(
+            self._body,
+            seek_str,
+            self.table.name,
+        )
+        first_query = base_query + order_by_str
+        next_query = f"{base_query} WHERE {seek_condition}{order_by_str}"
+        if where_str:
+            first_query = f"{base_query} WHERE {where_str}{order_by_str}"
+            next_query = (
+                f"{base_query} WHERE ({where_str}) "
+                f"AND {seek_condition}{order_by_str}"
+            )
+
+        make_row = self._row_factory()
+
+        query = first_query
+        parameters: Sequence[Any] = ()
+        while True:
+            items = self._execute_observed(
+                query,
+                parameters,
+                result=ResultFetch.fetchall,
+                cache=self._use_cache,
+            )
+            for item in items:
+                yield make_row(None, item[:-seek_count])
+
+            if len(items) < limit:
+                break
+            # All next pages use the same statement text
+            query = next_query
+            parameters = items[-1][-seek_count:]
+
+    def generative_all(
+        self,
+        limit: int,
+        *,
+        keyset: bool = False,
+        key: str | Sequence[str] = "rowid",
+    ) -> Generator[ABCRow, Any, None]:
+        """Return all items from query page by page.
+
+        Args:
+            limit (int): page size.
+            keyset (bool): use keyset (seek) pagination 'WHERE key > ?'
+            instead of LIMIT/OFFSET. Order columns must not contain NULL.
+            Defaults to False.
+            key (str | Sequence[str]): unique column (or columns) for keyset
+            pagination. Use primary key for WITHOUT ROWID tables.
+            Defaults to 'rowid'.
+
+        """
+        if keyset:
+            yield from self._keyset_all(limit, key)
+            return
+
+        row_factory = self._row_factory()
 
         offset = 0
         self.limit(limit)
         while True:
             self.offset(offset * limit)
-            items = self._execute(self._create_query_str(), 0)
+            items = self._execute(
+                self._create_query_str(),
+                0,
+                row_factory=row_factory,
+            )
             offset += 1
 
             if not items:
                 break
 
-            for item in items:
-                yield row_cls(
-                    table=self.table,
-                    **dict(zip(columns_name, item)),
+            yield from items
+
+    def _partitions(
+        self,
+        workers: int | None,
+        only_data: bool,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """Create kwargs for process pool workers, one item per rowid range."""
+        if (
+            self._groups or
+            self._having or
+            self._orders or
+            self._limit or
+            self._offset
+        ):
+            msg = (
+                "Parallel scan do not support group by, having, order by, "
+                "limit and offset."
+            )
+            raise ValueError(msg)
+
+        uri = db_uri(self.table.db.path)
+        workers = workers or os.cpu_count() or 1
+        where_str = " ".join(map(lambda i: str(i), self._filters))
+        rowid = f"`{self.table.name}`.rowid"
+        row: Any = self.table.execute(
+            f"SELECT MIN({rowid}), MAX({rowid}) FROM {self.table.name}",
+            result=ResultFetch.fetchone,
+        )
+        low: int | None
+        high: int | None
+        low, high = row
+        if low is None or high is None:
+            return [], workers
+
+        condition = f"{rowid} BETWEEN ? AND ?"
+        if where_str:
+            condition = f"({where_str}) AND {condition}"
+        query = "SELECT {} FROM {} WHERE {} ORDER BY {}".format(
+            self._body,
+            self.table.name,
+            condition,
+            rowid,
+        )
+        columns = None
+        if not only_data:
+            columns = (
+                self.result_row_column_names
+                if self.columns else
+                self.table.column_names
+            )
+        chunk_size = self.table.db.chunk_size
+        pragmas = {}
+        if self.table.db.profile is not None:
+            pragmas = profile_pragmas(
+                self.table.db.profile,
+                connection_only=True,
+            )
+        # Several ranges per worker smooth out uneven rowid density
+        return [
+            {
+                "uri": uri,
+                "query": query,
+                "bounds": bounds,
+                "columns": columns,
+                "chunk_size": chunk_size,
+                "pragmas": pragmas,
+            }
+            for bounds in partition_bounds(low, high, workers * 4)
+        ], workers
+
+    def parallel_map(
+        self,
+        func: Callable[[Any], Any],
+        workers: int | None = None,
+        *,
+        only_data: bool = False,
+    ) -> list[Any]:
+        """Apply func to every row in process pool.
+
+        Table is split on rowid ranges, every range is scanned by pool
+        process with own read-only connection. Only committed data is
+        visible. Rows are dicts (or tuples with only_data), func and its
+        result must be picklable.
+
+        Args:
+            func (Callable[[Any], Any]): function for one row.
+            workers (int | None): count of processes. Defaults to cpu count.
+            only_data (bool): pass raw tuples instead of dicts.
+            Defaults to False.
+
+        Returns:
+            list[Any]: func results in rowid order.
+
+        """
+        partitions, workers = self._partitions(workers, only_data)
+        if not partitions:
+            return []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(partial(map_partition, func=func, **kwargs))
+                for kwargs in partitions
+            ]
+            return [
+                item
+                for future in futures
+                for item in future.result()
+            ]
+
+    def parallel_reduce(
+        self,
+        func: Callable[[Any, Any], Any],
+        initial: Any,
+        workers: int | None = None,
+        *,
+        combine: Callable[[Any, Any], Any] = add,
+        only_data: bool = False,
+    ) -> Any:
+        """Reduce rows in process pool.
+
+        Every rowid range is reduced by func(accumulator, row) from
+        initial in pool process, then partial results are combined in
+        current process. Initial must be neutral for combine, like 0 for
+        sum or empty list for concatenation.
+
+        Args:
+            func (Callable[[Any, Any], Any]): reduce function.
+            initial (Any): start value for every range.
+            workers (int | None): count of processes. Defaults to cpu count.
+            combine (Callable[[Any, Any], Any]): function joining partial
+            results. Defaults to operator.add.
+            only_data (bool): pass raw tuples instead of dicts.
+            Defaults to False.
+
+        """
+        partitions, workers = self._partitions(workers, only_data)
+        if not partitions:
+            return initial
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    partial(
+                        reduce_partition,
+                        func=func,
+                        initial=initial,
+                        **kwargs,
+                    ),
                 )
+                for kwargs in partitions
+            ]
+            return reduce(combine, (future.result() for future in futures))
 
     def __iter__(self) -> Iterable:
         """Iteration by data."""
@@ -743,6 +1250,7 @@ class Query(TableOperation):
         self._groups = ()
         self._limit = 0
         self._offset = 0
+        self._use_cache = True
         self.columns = None
 
         if self.table is None and table:
@@ -840,6 +1348,7 @@ class CreateTable(Operation):
         foreign_keys: Sequence[ForeignKey] | None = None,
         *,
         if_not_exists: bool = True,
+        indexes: Sequence[Index] = (),
     ) -> None:
         """Create table in DB.
 
@@ -851,6 +1360,8 @@ class CreateTable(Operation):
             Defaults to None.
             if_not_exists (bool): use 'if not exists' in query.
             Defaults to True.
+            indexes (Sequence[Index]): indexes created with table.
+            Defaults to ().
 
         Raises:
             TypeError: Incorrect type for columns
@@ -879,3 +1390,5 @@ class CreateTable(Operation):
             if_not_exists=if_not_exists,
         )
         self.db.execute(query)
+        for index in indexes:
+            self.db.execute(index(table_name))
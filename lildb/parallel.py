@@ -0,0 +1,115 @@
+"""Module contains process pool scan components."""
+from __future__ import annotations
+
+import sqlite3
+from functools import reduce
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Iterator
+from typing import Sequence
+
+from .profiles import apply_pragmas
+
+
+__all__ = (
+    "db_uri",
+    "partition_bounds",
+    "map_partition",
+    "reduce_partition",
+)
+
+
+def db_uri(path: str) -> str:
+    """Return read-only uri for db file."""
+    if path == ":memory:" or not Path(path).exists():
+        msg = "Parallel scan needs db file."
+        raise ValueError(msg)
+    return Path(path).resolve().as_uri() + "?mode=ro"
+
+
+def partition_bounds(
+    low: int,
+    high: int,
+    count: int,
+) -> list[tuple[int, int]]:
+    """Split closed rowid range on count nearly equal ranges."""
+    step = max(-(-(high - low + 1) // count), 1)
+    return [
+        (start, min(start + step - 1, high))
+        for start in range(low, high + 1, step)
+    ]
+
+
+def _iterate_partition(
+    uri: str,
+    query: str,
+    bounds: tuple[int, int],
+    columns: Sequence[str] | None,
+    chunk_size: int,
+    pragmas: dict[str, Any],
+) -> Iterator[Any]:
+    """Fetch partition rows with own read-only connection."""
+    connect = sqlite3.connect(uri, uri=True)
+    try:
+        apply_pragmas(connect, pragmas)
+        cursor = connect.execute(query, bounds)
+        while True:
+            items = cursor.fetchmany(chunk_size)
+            if not items:
+                break
+            if columns is None:
+                yield from items
+            else:
+                for item in items:
+                    yield dict(zip(columns, item))
+    finally:
+        connect.close()
+
+
+def map_partition(
+    uri: str,
+    query: str,
+    bounds: tuple[int, int],
+    columns: Sequence[str] | None,
+    chunk_size: int,
+    pragmas: dict[str, Any],
+    func: Callable[[Any], Any],
+) -> list[Any]:
+    """Apply func to every partition row, it runs in pool process."""
+    return [
+        func(row)
+        for row in _iterate_partition(
+            uri,
+            query,
+            bounds,
+            columns,
+            chunk_size,
+            pragmas,
+        )
+    ]
+
+
+def reduce_partition(
+    uri: str,
+    query: str,
+    bounds: tuple[int, int],
+    columns: Sequence[str] | None,
+    chunk_size: int,
+    pragmas: dict[str, Any],
+    func: Callable[[Any, Any], Any],
+    initial: Any,
+) -> Any:
+    """Reduce partition rows, it runs in pool process."""
+    return reduce(
+        func,
+        _iterate_partition(
+            uri,
+            query,
+            bounds,
+            columns,
+            chunk_size,
+            pragmas,
+        ),
+        initial,
+    )
@@ -0,0 +1,168 @@
+"""Module contains query plan components."""
+from __future__ import annotations
+
+import re
+from typing import Any
+from typing import Iterable
+from typing import Iterator
+
+
+__all__ = (
+    "PlanNode",
+    "QueryPlan",
+)
+
+
+# Table and index of SCAN/SEARCH plan step, sqlite before 3.36 writes
+# 'SCAN TABLE person'. Steps reading constant row, subquery or
+# co-routine do not read table.
+_STEP = re.compile(
+    r"(?P<kind>SCAN|SEARCH) (?:TABLE )?"
+    r"(?!CONSTANT ROW\b|SUBQUERY\b|CO-ROUTINE\b)"
+    r"(?P<table>\w+)(?: AS \w+)?"
+    r"(?: USING (?:COVERING |PRIMARY KEY |INTEGER PRIMARY KEY )?"
+    r"(?:INDEX (?P<index>\w+))?)?",
+)
+
+
+class PlanNode:
+    """Step of EXPLAIN QUERY PLAN tree."""
+
+    __slots__ = ("id", "parent", "detail", "children")
+
+    def __init__(
+        self,
+        id: int,  # noqa: A002
+        parent: int,
+        detail: str,
+    ) -> None:
+        """Initialize.
+
+        Args:
+            id (int): step id.
+            parent (int): parent step id, 0 for root step.
+            detail (str): step description, like 'SCAN person'.
+
+        """
+        self.id = id
+        self.parent = parent
+        self.detail = detail
+        self.children: list[PlanNode] = []
+
+    @property
+    def kind(self) -> str:
+        """Return step kind: 'SCAN', 'SEARCH', 'TEMP B-TREE' or other."""
+        if self.detail.startswith("USE TEMP B-TREE"):
+            return "TEMP B-TREE"
+        match = _STEP.match(self.detail)
+        if match is not None:
+            return match.group("kind")
+        return self.detail
+
+    @property
+    def table(self) -> str | None:
+        """Return table read by SCAN or SEARCH step."""
+        match = _STEP.match(self.detail)
+        return match.group("table") if match is not None else None
+
+    @property
+    def index(self) -> str | None:
+        """Return index used by step."""
+        match = _STEP.match(self.detail)
+        return match.group("index") if match is not None else None
+
+    @property
+    def is_full_scan(self) -> bool:
+        """Check step reads all rows of table without index."""
+        return (
+            self.kind == "SCAN" and
+            self.index is None and
+            "PRIMARY KEY" not in self.detail
+        )
+
+    def __iter__(self) -> Iterator[PlanNode]:
+        """Iterate by this step and all nested steps."""
+        yield self
+        for child in self.children:
+            yield from child
+
+    def __repr__(self) -> str:
+        """Repr view."""
+        return f"<{self.__class__.__name__}: {self.detail}>"
+
+
+class QueryPlan:
+    """Parsed EXPLAIN QUERY PLAN result."""
+
+    __slots__ = ("query", "roots")
+
+    def __init__(
+        self,
+        query: str,
+        rows: Iterable[tuple[Any, ...]],
+    ) -> None:
+        """Initialize.
+
+        Args:
+            query (str): explained sql query.
+            rows (Iterable[tuple[Any, ...]]): EXPLAIN QUERY PLAN rows
+            (id, parent, notused, detail).
+
+        """
+        self.query = query
+        self.roots: list[PlanNode] = []
+        nodes: dict[int, PlanNode] = {}
+        for id_, parent, _, detail in rows:
+            node = PlanNode(id_, parent, detail)
+            nodes[id_] = node
+            parent_node = nodes.get(parent)
+            if parent_node is None:
+                self.roots.append(node)
+            else:
+                parent_node.children.append(node)
+
+    def __iter__(self) -> Iterator[PlanNode]:
+        """Iterate by all steps in plan order."""
+        for root in self.roots:
+            yield from root
+
+    @property
+    def full_scans(self) -> tuple[str, ...]:
+        """Return tables read without index."""
+        return tuple(
+            node.table
+            for node in self
+            if node.is_full_scan and node.table is not None
+        )
+
+    @property
+    def indexes(self) -> tuple[str, ...]:
+        """Return used indexes."""
+        return tuple(node.index for node in self if node.index is not None)
+
+    @property
+    def temp_btrees(self) -> tuple[str, ...]:
+        """Return steps sorting with temp b-tree, like ORDER BY."""
+        return tuple(
+            node.detail
+            for node in self
+            if node.kind == "TEMP B-TREE"
+        )
+
+    def __str__(self) -> str:
+        """Draw plan tree like sqlite3 shell."""
+        lines = ["QUERY PLAN"]
+
+        def draw(nodes: list[PlanNode], prefix: str) -> None:
+            for position, node in enumerate(nodes, 1):
+                last = position == len(nodes)
+                branch = "`--" if last else "|--"
+                lines.append(f"{prefix}{branch}{node.detail}")
+                draw(node.children, prefix + ("   " if last else "|  "))
+
+        draw(self.roots, "")
+        return "\n".join(lines)
+
+    def __repr__(self) -> str:
+        """Repr view."""
+        return f"<{self.__class__.__name__}: {self.query}>"
@@ -0,0 +1,105 @@
+"""Module contains PRAGMA profiles."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Literal
+
+
+if TYPE_CHECKING:
+    import sqlite3
+
+
+__all__ = (
+    "PROFILES",
+    "profile_pragmas",
+    "apply_pragmas",
+)
+
+
+TProfile = Literal["durable", "throughput", "bulk_load", "read_only"]
+
+
+PROFILES: dict[str, dict[str, Any]] = {
+    # Every commit is synced to disk, survives power loss
+    "durable": {
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "busy_timeout": 5000,
+    },
+    # Commit is synced at WAL checkpoint, last commits may be lost
+    # on power loss but db stays consistent
+    "throughput": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -64000,
+        "mmap_size": 268435456,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+    # No syncs at all, use it for filling new db
+    "bulk_load": {
+        "journal_mode": "WAL",
+        "synchronous": "OFF",
+        "cache_size": -256000,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+    # Writes are forbidden for connection
+    "read_only": {
+        "query_only": "ON",
+        "cache_size": -64000,
+        "mmap_size": 268435456,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+}
+
+
+# SQLite defaults, they reset pragmas of previous profile
+DEFAULT_PRAGMAS: dict[str, Any] = {
+    "synchronous": "FULL",
+    "cache_size": -2000,
+    "mmap_size": 0,
+    "temp_store": "DEFAULT",
+    "query_only": "OFF",
+}
+
+
+# Pragmas changing db file, they are executed by main connection only
+DB_PRAGMAS = frozenset(("journal_mode",))
+
+
+def profile_pragmas(
+    profile: TProfile | str,
+    *,
+    connection_only: bool = False,
+) -> dict[str, Any]:
+    """Return pragmas of profile.
+
+    Args:
+        profile (TProfile | str): profile name from PROFILES.
+        connection_only (bool): skip pragmas changing db file.
+        Defaults to False.
+
+    """
+    if profile not in PROFILES:
+        msg = f"Unknown profile '{profile}'."
+        raise ValueError(msg)
+    pragmas = {**DEFAULT_PRAGMAS, **PROFILES[profile]}
+    if connection_only:
+        return {
+            name: value
+            for name, value in pragmas.items()
+            if name not in DB_PRAGMAS
+        }
+    return pragmas
+
+
+def apply_pragmas(
+    connect: sqlite3.Connection,
+    pragmas: dict[str, Any],
+) -> None:
+    """Execute pragmas for connection."""
+    for name, value in pragmas.items():
+        connect.execute(f"PRAGMA {name}={value}")
@@ -4,6 +4,7 @@ from __future__ import annotations
 import sys
 from abc import ABC
 from abc import abstractmethod
+from collections import namedtuple
 from dataclasses import _process_class  # type: ignore
 from dataclasses import field
 from dataclasses import make_dataclass
@@ -11,27 +12,35 @@ from typing import TYPE_CHECKING
 from typing import Any
 from typing import Callable
 from typing import Iterable
+from typing import Literal
 from typing import TypeVar
 
+from .cache import LRUCache
+
 
 if TYPE_CHECKING:
     from .table.table import Table
 
 
 TRow = TypeVar("TRow", bound="ABCRow")
+TRowMode = Literal["dict", "datacls", "tuple"]
 
 
 __all__ = (
     "ABCRow",
     "RowDict",
     "_RowDataClsMixin",
+    "_RowTupleMixin",
     "make_row_data_cls",
+    "make_row_tuple_cls",
 )
 
 
 class ABCRow(ABC):
     """Abstract row interface."""
 
+    __slots__ = ()
+
     table: Table
     changed_columns: set
 
@@ -59,7 +68,8 @@ class ABCRow(ABC):
             self.changed_column_values,
             **self.not_changed_column_values,
         )
-        self.changed_columns = set()
+        # Clear in place, slotted subclasses declare the attribute
+        self.changed_columns.clear()
 
 
 class _RowDataClsMixin(ABCRow):
@@ -110,6 +120,8 @@ class _RowDataClsMixin(ABCRow):
 class RowDict(ABCRow, dict):
     """DB row like a dict."""
 
+    __slots__ = ("table", "changed_columns")
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize."""
         self.table = kwargs.pop("table")
@@ -145,6 +157,54 @@ class RowDict(ABCRow, dict):
         super().__setitem__(key, value)
 
 
+class _RowTupleMixin:
+    """Mixin for compact tuple-backed rows.
+
+    Row has not instance dict, table is stored in row cls. Rows are
+    immutable, 'change' updates db and returns new row.
+    """
+
+    __slots__ = ()
+
+    table: Table | None = None
+
+    def _column_values(self) -> dict[str, Any]:
+        """Fetch column name with value like dict."""
+        if self.table is None:
+            msg = "Row is not bound to table."
+            raise TypeError(msg)
+        return dict(zip(self.table.column_names, self))  # type: ignore
+
+    def delete(self) -> None:
+        """Delete this row from db."""
+        column_values = self._column_values()
+        self.table.delete(**column_values)  # type: ignore
+
+    def change(self, **values: Any) -> Any:
+        """Update this row and return changed row."""
+        column_values = self._column_values()
+        if not values:
+            return self
+        self.table.update(values, **column_values)  # type: ignore
+        column_values.update(values)
+        return self._make(column_values.values())  # type: ignore
+
+
+def make_row_tuple_cls(
+    table: Table | None,
+    columns_name: Iterable[str],
+) -> type:
+    """Create tuple-backed row cls for the transmitted table."""
+    name = "ResultRowTuple"
+    if table is not None:
+        name = f"Row{table.name.title()}Tuple"
+    return type(
+        name,
+        (_RowTupleMixin, namedtuple(name, columns_name, rename=True)),
+        {"__slots__": (), "table": table},
+    )
+
+
 def make_row_data_cls(table: Table) -> type:
     """Create data cls row for the transmitted table."""
     attributes: list[tuple[str, Any, field]] = [
@@ -172,14 +232,35 @@ def make_row_data_cls(table: Table) -> type:
     # )
 
 
-def create_result_row(columns_name: Iterable[str]) -> type[Any]:
-    """Create result row cls."""
-    columns = list(columns_name)
-    columns.append("table")
-    return make_dataclass(
-        "ResultRow",
+# Result row classes shared by all queries and tables
+result_row_classes = LRUCache(maxsize=512)
+
+
+def create_result_row(
+    columns_name: Iterable[str],
+    *,
+    compact: bool = False,
+) -> type[Any]:
+    """Create result row cls or take it from cache by column names.
+
+    Args:
+        columns_name (Iterable[str]): row column names.
+        compact (bool): create tuple-backed row cls. Defaults to False.
+
+    """
+    columns = tuple(columns_name)
+    if compact:
+        return result_row_classes.get_or_create(
+            (columns, compact),
+            lambda: make_row_tuple_cls(None, columns),
+        )
+    return result_row_classes.get_or_create(
         columns,
-        frozen=True,
+        lambda: make_dataclass(
+            "ResultRow",
+            [*columns, "table"],
+            frozen=True,
+        ),
     )
 
 
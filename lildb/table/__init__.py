@@ -1,11 +1,17 @@
 """Module contains all for tables."""
 from .column import Column
+from .column import ColumnInfo
 from .column import Columns
+from .column import IndexInfo
 from .table import Table
+from .table import TableSlice
 
 
 __all__ = (
     "Table",
+    "TableSlice",
     "Column",
+    "ColumnInfo",
     "Columns",
+    "IndexInfo",
 )
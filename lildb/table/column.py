@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING
 from typing import Any
 from typing import Callable
 from typing import Iterable
+from typing import NamedTuple
 
 from ..sql import func
 
@@ -21,10 +22,37 @@ if TYPE_CHECKING:
 __all__ = (
     "ResultComparison",
     "Column",
+    "ColumnInfo",
+    "IndexInfo",
     "Columns",
 )
 
 
+class ColumnInfo(NamedTuple):
+    """Column metadata from PRAGMA table_info."""
+
+    name: str
+    type: str
+    notnull: bool
+    default: str | None
+    # Position in primary key starting with 1, 0 if not in primary key
+    pk: int
+
+
+class IndexInfo(NamedTuple):
+    """Index metadata from PRAGMA index_list and index_info."""
+
+    name: str
+    # Column names, None for expression
+    columns: tuple[str | None, ...]
+    unique: bool
+    partial: bool
+    # 'c' created by CREATE INDEX, 'u' by UNIQUE, 'pk' by PRIMARY KEY
+    origin: str
+    # CREATE INDEX statement, None for automatic index
+    sql: str | None
+
+
 class ResultComparison(str):
     """The result of the comparison."""
 
@@ -2,12 +2,17 @@
 from __future__ import annotations
 
 from functools import cached_property
+from itertools import groupby
+from itertools import islice
+from operator import itemgetter
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import Callable
 from typing import Generic
 from typing import Iterator
 
+from ..cache import LRUCache
+from ..column_types import Index
 from ..enumcls import ResultFetch
 from ..operations import Delete
 from ..operations import Insert
@@ -16,18 +21,26 @@ from ..operations import Select
 from ..operations import Update
 from ..rows import RowDict
 from ..rows import TRow
+from ..rows import create_result_row
 from ..rows import make_row_data_cls
+from ..rows import make_row_tuple_cls
+from .column import Column
 from .column import Columns
+from .column import IndexInfo
 
 
 if TYPE_CHECKING:
     import sqlite3
+    from typing import Iterable
 
     from ..db import DB
+    from ..rows import TRowMode
+    from .column import ColumnInfo
 
 
 __all__ = (
     "Table",
+    "TableSlice",
 )
 
 
@@ -52,19 +65,47 @@ class Table(Generic[TRow]):
     row_cls: type[TRow] = RowDict  # type: ignore
     table_name: str | None = None
 
+    # Max count of cached sql texts for operation shapes
+    statement_cache_size: int = 256
+
+    # Rows got by primary key, see 'use_identity_map'
+    identity_map: LRUCache | None = None
+    _identity_generation: int = 0
+
     def __init__(
         self,
         name: str | None = None,
         *,
         use_datacls: bool = False,
+        row_mode: TRowMode | None = None,
     ) -> None:
-        """Initialize."""
+        """Initialize.
+
+        Args:
+            name (str | None): table name. Defaults to None.
+            use_datacls (bool): use dataclass rows. Defaults to False.
+            row_mode (TRowMode | None): 'dict', 'datacls' or 'tuple' rows.
+            Defaults to 'datacls' with use_datacls else 'dict'.
+
+        """
         self.name = self.table_name or name
         if self.name is None:
             msg = "Table name do not be None."
             raise ValueError(msg)
 
-        self.use_datacls = use_datacls
+        if row_mode is None:
+            row_mode = "datacls" if use_datacls else "dict"
+        if row_mode not in {"dict", "datacls", "tuple"}:
+            msg = f"Incorrect row mode '{row_mode}'."
+            raise ValueError(msg)
+
+        self.use_datacls = row_mode == "datacls"
+        self.row_mode = row_mode
+
+        # Generated sql text by operation shape
+        self.statements = LRUCache(self.statement_cache_size)
+        # Cursor row factories by result columns
+        self.row_factories = LRUCache(self.statement_cache_size)
 
         # Operations
         self.query = getattr(self, "query", Query)(self)
@@ -97,7 +138,7 @@ class Table(Generic[TRow]):
     @property
     def execute(
         self,
-    ) -> Callable[..., list[tuple] | None]:
+    ) -> Callable[..., list[Any] | None]:
         """Shortcut for execute.
 
         Args:
@@ -114,16 +155,40 @@ class Table(Generic[TRow]):
         """
         return self.db.execute
 
+    @property
+    def iterate(self) -> Callable[..., Iterator[Any]]:
+        """Shortcut for streaming execute.
+
+        Args:
+            query (str): sql query
+            parameters (MutableMapping | Sequence): data for executing.
+            Defaults to ().
+            size (int | None): chunk size for fetchmany operation.
+            Defaults to DB.chunk_size.
+
+        Returns:
+            Iterator[Any]
+
+        """
+        return self.db.iterate
+
+    @cached_property
+    def info(self) -> tuple[ColumnInfo, ...]:
+        """Fetch table columns metadata."""
+        return self.db.table_info(self.name)
+
     @cached_property
     def column_names(self) -> tuple[str, ...]:
         """Fetch table column name."""
-        stmt = "SELECT name FROM PRAGMA_TABLE_INFO('{}');".format(
-            self.name,
-        )
-        result = self.db.execute(stmt, result=ResultFetch.fetchall)
+        return tuple(column.name.lower() for column in self.info)
+
+    @cached_property
+    def primary_key(self) -> tuple[str, ...]:
+        """Fetch primary key column names in key order."""
         return tuple(
-            name[0].lower()
-            for name in result
+            column.name.lower()
+            for column in sorted(self.info, key=lambda column: column.pk)
+            if column.pk
         )
 
     @cached_property
@@ -131,34 +196,281 @@ class Table(Generic[TRow]):
         """Check exist id column."""
         return "id" in self.column_names
 
+    def row_factory(
+        self,
+        columns: Iterable[str] | None = None,
+    ) -> Callable[[sqlite3.Cursor | None, tuple], Any]:
+        """Return cursor row factory creating rows of this table.
+
+        Factory is compatible with sqlite3.Cursor.row_factory,
+        so rows are created while fetching in one call.
+        """
+        key = tuple(columns) if columns else None
+        return self.row_factories.get_or_create(
+            key,
+            lambda: self._create_row_factory(key),
+        )
+
+    def _create_row_factory(
+        self,
+        columns: tuple[str, ...] | None,
+    ) -> Callable[[sqlite3.Cursor | None, tuple], Any]:
+        """Create the fastest row factory for row cls."""
+        row_cls: Any
+        columns_name: tuple[str, ...]
+        if columns:
+            row_cls = create_result_row(
+                columns,
+                compact=self.row_mode == "tuple",
+            )
+            columns_name = columns
+        else:
+            row_cls = self.row_cls
+            columns_name = self.column_names
+
+        if issubclass(row_cls, tuple):
+            new_tuple = tuple.__new__
+            return lambda _, item: new_tuple(row_cls, item)
+
+        table = self
+        if issubclass(row_cls, RowDict):
+            return lambda _, item: row_cls(
+                zip(columns_name, item),
+                table=table,
+            )
+
+        # Generated data cls rows take column values positionally
+        field_names = list(getattr(row_cls, "__dataclass_fields__", ()))
+        if field_names[:len(columns_name) + 1] == [*columns_name, "table"]:
+            return lambda _, item: row_cls(*item, table)
+
+        return lambda _, item: row_cls(
+            table=table,
+            **dict(zip(columns_name, item)),
+        )
+
     def all(self) -> list[TRow]:
         """Get all rows from table."""
         return self.select()
 
     def __iter__(self) -> Iterator[Any]:
-        """Iterate through the row list."""
-        return self.select().__iter__()
-
-    def __getitem__(self, index: int | str) -> TRow | None:
-        """Get row item by id or index in list."""
-        result = None
-        if not self.id_exist:
-            result = self.select()[index]
-        result = self.select(id=index)
-        return result[0] if result else None
-
-    def get(self, **filter_by: str | int) -> TRow | None:
-        """Get one row by filter."""
+        """Iterate through the table rows without loading all of them.
+
+        Rows are read from open cursor, so rows added while iterating
+        are iterated too. Do not modify the table while iterating,
+        use '.all()' for it.
+        """
+        return self.select(return_generator=True)
+
+    def __getitem__(self, index: int | str | slice) -> Any:
+        """Get row by id or by position if id column does not exist.
+
+        Position is rowid order like in iteration, only one row is read
+        with LIMIT/OFFSET. Slice returns lazy TableSlice streaming rows.
+        """
+        if isinstance(index, slice):
+            return TableSlice(self, index)
+        if self.id_exist:
+            return self.get(id=index)
+        if not isinstance(index, int):
+            msg = "Table indices must be integers or slices."
+            raise TypeError(msg)
+        if index < 0:
+            rows = self.iterate_positions(-index - 1, 1, reverse=True)
+        else:
+            rows = self.iterate_positions(index, 1)
+        row = next(rows, None)
+        if row is None:
+            msg = "Table index out of range."
+            raise IndexError(msg)
+        return row
+
+    def iterate_positions(
+        self,
+        offset: int,
+        limit: int = -1,
+        *,
+        reverse: bool = False,
+    ) -> Iterator[Any]:
+        """Stream rows by positions in rowid order.
+
+        Args:
+            offset (int): count of skipped rows.
+            limit (int): max count of rows, -1 is not limited.
+            Defaults to -1.
+            reverse (bool): count positions from the end.
+            Defaults to False.
+
+        """
+        query = self.statements.get_or_create(
+            ("positions", reverse),
+            lambda: "{} ORDER BY rowid{} LIMIT ? OFFSET ?".format(
+                self.select.query(),
+                " DESC" if reverse else "",
+            ),
+        )
+        return self.select._iterate_observed(
+            query,
+            (limit, offset),
+            row_factory=self.row_factory(),
+        )
+
+    def __len__(self) -> int:
+        """Return count of table rows without reading them."""
+        result = self.select._execute_observed(
+            f"SELECT COUNT(*) FROM {self.name}",  # noqa: S608
+            result=ResultFetch.fetchone,
+        )
+        return result[0] if result else 0  # type: ignore
+
+    def __bool__(self) -> bool:
+        """Table obj is always true, even if it is empty."""
+        return True
+
+    def get(self, **filter_by: Any) -> TRow | None:
+        """Get one row by filter.
+
+        With identity map row got by full primary key is kept and
+        returned by next calls, see 'use_identity_map'.
+        """
+        identity_map = self.identity_map
+        if (
+            identity_map is None or
+            not self.primary_key or
+            filter_by.keys() != set(self.primary_key)
+        ):
+            result = self.select(size=1, **filter_by)
+            return result[0] if result else None
+
+        key = tuple(filter_by[name] for name in self.primary_key)
+        row = identity_map.get(key)
+        if row is not None:
+            return row
+        generation = self._identity_generation
         result = self.select(size=1, **filter_by)
-        return result[0] if result else None
+        if not result:
+            return None
+        # Row read inside transaction could be rolled back, row read
+        # before update finished could be stale
+        if (
+            generation == self._identity_generation and
+            not self.db.transaction_depth and
+            not self.db.connect.in_transaction
+        ):
+            identity_map.set(key, result[0])
+        return result[0]
+
+    def use_identity_map(self, maxsize: int = 1024) -> None:
+        """Keep rows got by primary key with 'get' and table[id].
+
+        Next lookups of the same key return the same row obj without
+        query. Update and delete of this table, 'row.change()' and
+        'row.delete()' clear the map. Writes with raw sql are not
+        tracked, call 'clear_identity_map' after them.
+
+        Args:
+            maxsize (int): max count of kept rows, 0 disables identity
+            map. Defaults to 1024.
+
+        """
+        self.identity_map = LRUCache(maxsize) if maxsize else None
+
+    def clear_identity_map(self) -> None:
+        """Forget rows kept by identity map."""
+        self._identity_generation += 1
+        if self.identity_map is not None:
+            self.identity_map.clear()
+
+    def create_index(
+        self,
+        *columns: str | Column,
+        unique: bool = False,
+        where: str | None = None,
+        name: str | None = None,
+        include: tuple[str | Column, ...] = (),
+    ) -> str:
+        """Create index if it does not exist and return its name.
+
+        Args:
+            *columns (str | Column): key columns or expressions.
+            unique (bool): create unique index. Defaults to False.
+            where (str | None): condition of partial index.
+            Defaults to None.
+            name (str | None): index name. Defaults to
+            'ix_<table>_<columns>'.
+            include (tuple[str | Column, ...]): extra columns for
+            covering index. Defaults to ().
+
+        """
+        index = Index(
+            *map(self._index_column, columns),
+            unique=unique,
+            where=where,
+            name=name,
+            include=tuple(map(self._index_column, include)),
+        )
+        self.db.execute(index(self.name))
+        return index.index_name(self.name)
+
+    @staticmethod
+    def _index_column(column: str | Column) -> str:
+        """Return column name for index."""
+        if isinstance(column, Column):
+            return column.row_name
+        return column
+
+    @property
+    def indexes(self) -> tuple[IndexInfo, ...]:
+        """Read indexes metadata of table."""
+        result = self.execute(
+            "SELECT l.name, i.name, l.\"unique\", l.partial, l.origin, m.sql "
+            "FROM pragma_index_list(?) AS l "
+            "JOIN pragma_index_info(l.name) AS i "
+            "LEFT JOIN sqlite_master AS m ON m.name = l.name "
+            "ORDER BY l.name, i.seqno",
+            (self.name,),
+            result=ResultFetch.fetchall,
+            cache=False,
+        )
+        indexes = []
+        for name, items in groupby(result or (), key=itemgetter(0)):
+            rows = list(items)
+            _, _, unique, partial, origin, sql = rows[0]
+            indexes.append(IndexInfo(
+                name,
+                tuple(row[1] for row in rows),
+                bool(unique),
+                bool(partial),
+                origin,
+                sql,
+            ))
+        return tuple(indexes)
+
+    def drop_index(self, name: str) -> None:
+        """Drop index if it exists."""
+        self.db.execute(f"DROP INDEX IF EXISTS `{name}`")
 
     def drop(self, *, init_tables: bool = True) -> None:
-        """Drop this table."""
+        """Drop this table.
+
+        DB.execute refreshes schema after DROP, 'init_tables' is kept
+        for compatibility.
+        """
         self.db.execute(f"DROP TABLE IF EXISTS {self.name}")
-        # TODO(stickking): What ?!?! replace in db.execute
-        # 0000
-        if init_tables:
-            self.db.initialize_tables()
+
+    def refresh(self) -> None:
+        """Forget cached schema data after table was changed."""
+        for name in (
+            "info",
+            "column_names",
+            "primary_key",
+            "id_exist",
+            "row_cls",
+        ):
+            self.__dict__.pop(name, None)
+        self.statements.clear()
+        self.clear_identity_map()
+        self(self.db)
 
     def __repr__(self) -> str:
         """Repr view."""
@@ -167,5 +479,101 @@ class Table(Generic[TRow]):
     def __call__(self, db: DB) -> None:
         """Prepare table obj."""
         self.db = db
-        if self.use_datacls and self.row_cls == RowDict:
+        self.row_factories.clear()
+        if self.row_cls != RowDict:
+            return
+        if self.row_mode == "datacls":
             self.row_cls = make_row_data_cls(self)
+        elif self.row_mode == "tuple":
+            self.row_cls = make_row_tuple_cls(self, self.column_names)
+
+
+class TableSlice:
+    """Lazy view of table rows by positions.
+
+    Rows are streamed with LIMIT/OFFSET query on iteration, count of
+    rows is read only for negative bounds, steps and len.
+    """
+
+    __slots__ = ("table", "positions")
+
+    def __init__(self, table: Table, positions: slice | range) -> None:
+        """Initialize.
+
+        Args:
+            table (Table): viewed table.
+            positions (slice | range): row positions in rowid order.
+
+        """
+        if isinstance(positions, slice) and positions.step == 0:
+            msg = "Slice step cannot be zero."
+            raise ValueError(msg)
+        self.table = table
+        self.positions = positions
+
+    def _range(self, total: int | None = None) -> range:
+        """Resolve positions with table row count."""
+        if isinstance(self.positions, range):
+            return self.positions
+        if total is None:
+            total = len(self.table)
+        return range(*self.positions.indices(total))
+
+    def __iter__(self) -> Iterator[Any]:
+        """Stream rows of view."""
+        positions = self.positions
+        if (
+            isinstance(positions, slice) and
+            (positions.start or 0) >= 0 and
+            (positions.stop is None or positions.stop >= 0) and
+            (positions.step or 1) > 0
+        ):
+            # Forward slice needs no row count
+            start = positions.start or 0
+            limit = -1
+            if positions.stop is not None:
+                limit = max(positions.stop - start, 0)
+            step = positions.step or 1
+        else:
+            total = len(self.table)
+            resolved = self._range(total)
+            if not resolved:
+                return iter(())
+            if resolved.step < 0:
+                rows = self.table.iterate_positions(
+                    total - 1 - resolved.start,
+                    resolved.start - resolved.stop,
+                    reverse=True,
+                )
+                return islice(rows, 0, None, -resolved.step)
+            start = resolved.start
+            limit = resolved.stop - resolved.start
+            step = resolved.step
+        if limit == 0:
+            return iter(())
+        rows = self.table.iterate_positions(start, limit)
+        if step == 1:
+            return rows
+        return islice(rows, 0, None, step)
+
+    def __len__(self) -> int:
+        """Return count of rows in view."""
+        return len(self._range())
+
+    def __getitem__(self, index: int | slice) -> Any:
+        """Get row by position in view or narrower view."""
+        positions = self._range()[index]
+        if isinstance(positions, range):
+            return TableSlice(self.table, positions)
+        if positions < 0:
+            msg = "Table index out of range."
+            raise IndexError(msg)
+        row = next(self.table.iterate_positions(positions, 1), None)
+        if row is None:
+            msg = "Table index out of range."
+            raise IndexError(msg)
+        return row
+
+    def __repr__(self) -> str:
+        """Repr view."""
+        return f"<{self.__class__.__name__}: {self.table.name.title()}>"
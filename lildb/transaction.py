@@ -0,0 +1,68 @@
+"""Module contains transaction components."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Literal
+
+
+if TYPE_CHECKING:
+    from .db import DB
+
+
+__all__ = (
+    "Transaction",
+)
+
+
+TTransactionMode = Literal[
+    "DEFERRED",
+    "IMMEDIATE",
+    "EXCLUSIVE",
+    "deferred",
+    "immediate",
+    "exclusive",
+]
+
+
+class Transaction:
+    """Context manager for one explicit transaction.
+
+    Inside it DB.execute does not commit after every write, transaction
+    is committed (or rolled back on exception) once at exit.
+    Nested transaction uses SAVEPOINT.
+    """
+
+    __slots__ = ("db", "mode", "savepoint")
+
+    def __init__(self, db: DB, mode: TTransactionMode = "DEFERRED") -> None:
+        """Initialize.
+
+        Args:
+            db (DB): db object.
+            mode (TTransactionMode): BEGIN mode, it is ignored for nested
+            transaction. Defaults to 'DEFERRED'.
+
+        """
+        if mode.upper() not in {"DEFERRED", "IMMEDIATE", "EXCLUSIVE"}:
+            msg = f"Incorrect transaction mode '{mode}'."
+            raise ValueError(msg)
+        self.db = db
+        self.mode = mode.upper()
+        self.savepoint: str | None = None
+
+    def __enter__(self) -> Transaction:
+        """Begin transaction or savepoint."""
+        self.savepoint = self.db._begin_transaction(self.mode)
+        return self
+
+    def __exit__(self, exc_type: type | None, *args: Any) -> None:
+        """Commit or rollback transaction."""
+        self.db._end_transaction(
+            self.savepoint,
+            commit=exc_type is None,
+        )
+
+    def __repr__(self) -> str:
+        """Repr view."""
+        return f"<{self.__class__.__name__}: {self.savepoint or self.mode}>"
@@ -0,0 +1,837 @@
+"""Module contain test for db objects."""
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from threading import Event
+from threading import Thread
+from threading import current_thread
+from typing import Any
+from typing import Iterator
+
+import pytest
+
+from lildb import AsyncDB
+from lildb import ColumnInfo
+from lildb import DB
+from lildb import QueryPlan
+from lildb import ResultFetch
+from lildb import Table
+from lildb import ThreadDB
+from lildb.column_types import Integer
+from lildb.column_types import Text
+
+
+@pytest.fixture()
+def db(tmp_path: Path) -> Iterator[DB]:
+    """Create db with empty table."""
+    path = str(tmp_path / "local.db")
+    db = DB(path)
+    db.create_table("ttable", ["id", "name"])
+    yield db
+    db.close()
+    DB._instances.pop(path)
+
+
+@pytest.fixture()
+def thread_db(tmp_path: Path) -> Iterator[ThreadDB]:
+    """Create thread db with filled table."""
+    db = ThreadDB(str(tmp_path / "thread.db"))
+    db.create_table("ttable", ["id", "name"])
+    db.ttable.add([{"id": id_, "name": str(id_)} for id_ in range(1, 51)])
+    yield db
+    db.close()
+    ThreadDB._instances.pop(str(tmp_path / "thread.db"))
+
+
+class TestTransaction:
+    """Test for explicit transaction."""
+
+    def test_commit(self, db: DB) -> None:
+        """Test writes are committed once at exit."""
+        with db.transaction(mode="IMMEDIATE"):
+            for id_ in range(10):
+                db.ttable.add({"id": id_, "name": str(id_)})
+            assert db.connect.in_transaction
+        assert not db.connect.in_transaction
+        assert db.transaction_depth == 0
+        assert len(db.ttable.all()) == 10
+
+    def test_rollback(self, db: DB) -> None:
+        """Test rollback on exception."""
+        with pytest.raises(RuntimeError), db.transaction():
+            db.ttable.add({"id": 1, "name": "1"})
+            raise RuntimeError
+        assert db.ttable.all() == []
+        assert db.transaction_depth == 0
+
+    def test_savepoint(self, db: DB) -> None:
+        """Test nested transaction rollback only savepoint."""
+        with db.transaction():
+            db.ttable.add({"id": 1, "name": "1"})
+            with pytest.raises(RuntimeError), db.transaction():
+                db.ttable.add({"id": 2, "name": "2"})
+                raise RuntimeError
+            with db.transaction():
+                db.ttable.add({"id": 3, "name": "3"})
+        assert [row["id"] for row in db.ttable.all()] == [1, 3]
+
+    def test_failed_commit(self, db: DB) -> None:
+        """Test failed commit does not leak writes in next autocommit."""
+        db.execute("PRAGMA foreign_keys=ON")
+        db.execute("CREATE TABLE parent (id INTEGER PRIMARY KEY)")
+        db.execute(
+            "CREATE TABLE child (id INTEGER, parent INTEGER REFERENCES "
+            "parent(id) DEFERRABLE INITIALLY DEFERRED)"
+        )
+        with pytest.raises(sqlite3.IntegrityError), db.transaction():
+            db.child.add({"id": 1, "parent": 100})
+        assert not db.connect.in_transaction
+        assert db.transaction_depth == 0
+
+        db.ttable.add({"id": 1, "name": "1"})
+        assert db.child.all() == []
+
+    def test_failed_write(self, db: DB) -> None:
+        """Test failed write outside transaction is rolled back."""
+        db.execute("CREATE UNIQUE INDEX ttable_id ON ttable(id)")
+        db.ttable.add({"id": 1, "name": "1"})
+        with pytest.raises(sqlite3.IntegrityError):
+            db.ttable.add({"id": 1, "name": "1"})
+        assert not db.connect.in_transaction
+
+    def test_failed_write_manual_transaction(self, db: DB) -> None:
+        """Test failed write keeps transaction opened with 'BEGIN'."""
+        db.execute("CREATE UNIQUE INDEX ttable_id ON ttable(id)")
+        db.ttable.add({"id": 1, "name": "1"})
+        db.execute("BEGIN")
+        db.connect.execute("UPDATE ttable SET name = 'new' WHERE id = 1")
+        with pytest.raises(sqlite3.IntegrityError):
+            db.execute("INSERT INTO ttable VALUES(1, '1')")
+        assert db.connect.in_transaction
+        db.execute("ROLLBACK")
+        assert db.ttable.get(id=1)["name"] == "1"
+
+    def test_mode(self, db: DB) -> None:
+        """Test incorrect mode."""
+        with pytest.raises(ValueError):
+            db.transaction(mode="LAZY")  # type: ignore
+
+
+class TestDiscovery:
+    """Tests for lazy table discovery."""
+
+    def test_lazy_tables(self, tmp_path: Path) -> None:
+        """Test table obj is created on first access."""
+        path = str(tmp_path / "lazy.db")
+        connect = sqlite3.connect(path)
+        for id_ in range(50):
+            connect.execute(f"CREATE TABLE Table{id_} (id, name)")
+        connect.close()
+
+        db = DB(path)
+        assert len(db.table_names) == 50
+        assert not any(isinstance(value, Table) for value in vars(db).values())
+
+        table = db.table7
+        assert table.name == "Table7"
+        assert db.table7 is table
+        assert not hasattr(db, "missing")
+
+        assert len(db.tables) == 50
+        db.create_table("new", ["id"])
+        assert db.new.name == "new"
+        db.new.drop()
+        assert not hasattr(db, "new")
+
+        db.close()
+        DB._instances.pop(path)
+
+
+    def test_schema_refresh(self, db: DB) -> None:
+        """Test only changed tables are updated after DDL."""
+        table = db.ttable
+        assert table.column_names == ("id", "name")
+        db.create_table("other", ["id"])
+        assert db.ttable is table
+
+        version = db.schema_version
+        db.create_table("other", ["id"])
+        assert db.schema_version == version
+
+        db.execute("ALTER TABLE ttable ADD COLUMN post")
+        assert db.ttable is table
+        assert table.column_names == ("id", "name", "post")
+        table.add({"id": 1, "name": "1", "post": "dev"})
+        assert table.get(id=1)["post"] == "dev"
+
+        connect = sqlite3.connect(db.path)
+        connect.execute("CREATE TABLE External (id)")
+        connect.commit()
+        connect.close()
+        assert db.external.name == "External"
+
+        db.other.drop()
+        assert "other" not in db.table_names
+        assert db.ttable is table
+
+    def test_external_tables(self, db: DB) -> None:
+        """Test tables created together by other connection are found."""
+        connect = sqlite3.connect(db.path)
+        connect.execute("CREATE TABLE a (id)")
+        connect.execute("CREATE TABLE b (id)")
+        connect.commit()
+        connect.close()
+
+        assert db.a.name == "a"
+        assert db.b.name == "b"
+        assert {table.name for table in db.tables} == {"ttable", "a", "b"}
+
+
+    def test_table_info(self, tmp_path: Path) -> None:
+        """Test columns metadata of all tables is read by one query."""
+        path = str(tmp_path / "info.db")
+        db = DB(path)
+        db.execute(
+            "CREATE TABLE Post (id INTEGER NOT NULL, name TEXT DEFAULT 'a', "
+            "PRIMARY KEY(name, id))"
+        )
+        for id_ in range(10):
+            db.create_table(f"table{id_}", ["id", "name"])
+
+        statements: list[str] = []
+        db.connect.set_trace_callback(statements.append)
+        assert db.post.info == (
+            ColumnInfo("id", "INTEGER", True, None, 2),
+            ColumnInfo("name", "TEXT", False, "'a'", 1),
+        )
+        assert db.post.primary_key == ("name", "id")
+        for table in db.tables:
+            assert table.column_names
+        db.connect.set_trace_callback(None)
+        # pragma_table_info calls are traced like '-- PRAGMA ...' comments
+        assert [
+            stmt for stmt in statements if not stmt.startswith("--")
+        ] == statements[:1]
+
+        db.execute("ALTER TABLE Post ADD COLUMN salary REAL")
+        assert db.post.column_names == ("id", "name", "salary")
+
+        db.close()
+        DB._instances.pop(path)
+
+
+class TestProfile:
+    """Tests for PRAGMA profiles."""
+
+    def test_use_profile(self, tmp_path: Path) -> None:
+        """Test profile applied at connect and switched at runtime."""
+        path = str(tmp_path / "profile.db")
+        db = DB(path, profile="throughput")
+        db.create_table("ttable", ["id"])
+
+        def pragma(name: str) -> Any:
+            return db.execute(
+                f"PRAGMA {name}",
+                result=ResultFetch.fetchone,
+            )[0]
+
+        assert pragma("journal_mode") == "wal"
+        assert pragma("synchronous") == 1
+        assert pragma("temp_store") == 2
+
+        db.use_profile("read_only")
+        assert db.profile == "read_only"
+        with pytest.raises(sqlite3.OperationalError):
+            db.ttable.add({"id": 1})
+
+        db.use_profile("durable")
+        assert pragma("synchronous") == 2
+        assert pragma("temp_store") == 0
+        db.ttable.add({"id": 1})
+        assert len(db.ttable.all()) == 1
+
+        with pytest.raises(ValueError):
+            db.use_profile("unknown")  # type: ignore
+
+        db.close()
+        DB._instances.pop(path)
+
+    def test_readers(self, tmp_path: Path) -> None:
+        """Test profile applied to reader connections."""
+        path = str(tmp_path / "profile_readers.db")
+        db = ThreadDB(path, readers=2, profile="throughput")
+
+        def reader_cache_size() -> list[int]:
+            readers = [db.readers.get() for _ in range(2)]
+            for connect in readers:
+                db.readers.put(connect)
+            return [
+                connect.execute("PRAGMA cache_size").fetchone()[0]
+                for connect in readers
+            ]
+
+        assert reader_cache_size() == [-64000, -64000]
+        db.use_profile("bulk_load")
+        assert reader_cache_size() == [-256000, -256000]
+
+        db.close()
+        ThreadDB._instances.pop(path)
+
+
+class TestResultCache:
+    """Tests for select result cache."""
+
+    def test_invalidation(self, tmp_path: Path) -> None:
+        """Test results are cached until their table is written."""
+        path = str(tmp_path / "cache.db")
+        db = DB(path, result_cache=16)
+        db.create_table("ttable", ["id", "name"])
+        db.create_table("other", ["id"])
+        db.ttable.add([{"id": 1, "name": "1"}, {"id": 2, "name": "2"}])
+        cache = db.result_cache
+        assert cache is not None
+
+        assert len(db.ttable.all()) == 2
+        assert db.other.all() == []
+        rows = db.ttable.all()
+        assert cache.hits == 1
+        assert cache.stats()["bytes"] > 0
+        # Cached rows are new objs on every hit
+        rows[0]["name"] = "changed"
+        assert db.ttable.all()[0]["name"] == "1"
+
+        db.ttable.add({"id": 3, "name": "3"})
+        assert len(cache) == 1
+        assert len(db.ttable.all()) == 3
+        db.ttable.update({"name": "new"}, id=1)
+        assert db.ttable.get(id=1)["name"] == "new"
+        db.ttable.delete(id=1)
+        assert db.ttable.query().count() == 2
+        assert db.other.all() == []
+
+        with db.transaction():
+            db.ttable.add({"id": 4, "name": "4"})
+            assert len(db.ttable.all()) == 3
+        assert len(db.ttable.all()) == 3
+
+        hits = cache.hits
+        db.ttable.select(cache=False)
+        db.ttable.query().cache(False).all()
+        assert cache.hits == hits
+
+        db.other.drop()
+        assert len(cache) == 0
+        db.close()
+        DB._instances.pop(path)
+
+    def test_ttl(self, tmp_path: Path) -> None:
+        """Test expired and least recently used results are evicted."""
+        path = str(tmp_path / "cache_ttl.db")
+        db = DB(path, result_cache=2, result_cache_ttl=0.05)
+        db.create_table("ttable", ["id"])
+        cache = db.result_cache
+        assert cache is not None
+
+        for id_ in range(3):
+            db.ttable.get(id=id_)
+        assert len(cache) == 2
+        assert cache.evictions == 1
+        time.sleep(0.1)
+        db.ttable.get(id=2)
+        assert cache.stats()["evictions"] == 2
+        assert cache.hits == 0
+
+        db.close()
+        DB._instances.pop(path)
+
+    def test_data_version(self, tmp_path: Path) -> None:
+        """Test commit of other connection drops cached results."""
+        path = str(tmp_path / "cache_version.db")
+        db = DB(path, result_cache=16)
+        db.create_table("ttable", ["id"])
+        db.ttable.add({"id": 1})
+        assert len(db.ttable.all()) == 1
+        assert len(db.ttable.all()) == 1
+
+        other = sqlite3.connect(path)
+        other.execute("INSERT INTO ttable (id) VALUES (2)")
+        other.commit()
+        other.close()
+        assert len(db.ttable.all()) == 2
+        assert db.result_cache is not None
+        assert db.result_cache.hits == 1
+
+        db.close()
+        DB._instances.pop(path)
+
+    def test_thread_db_data_version(self, tmp_path: Path) -> None:
+        """Test data version is read by worker of thread db."""
+        path = str(tmp_path / "cache_thread_version.db")
+        db = ThreadDB(path, result_cache=16)
+        db.create_table("ttable", ["id"])
+        db.ttable.add({"id": 1})
+        threads: list[Any] = []
+        read_version = DB._read_data_version
+
+        def read_in_worker(self: DB) -> int:
+            threads.append(current_thread())
+            return read_version(self)
+
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setattr(DB, "_read_data_version", read_in_worker)
+            assert len(db.ttable.all()) == 1
+            assert len(db.ttable.all()) == 1
+            other = sqlite3.connect(path)
+            other.execute("INSERT INTO ttable (id) VALUES (2)")
+            other.commit()
+            other.close()
+            assert len(db.ttable.all()) == 2
+
+        assert threads
+        assert set(threads) == {db.worker}
+        assert db.result_cache is not None
+        assert db.result_cache.hits == 1
+
+        db.close()
+        DB._instances.pop(path)
+
+    def test_thread_db(self, tmp_path: Path) -> None:
+        """Test readers and group commit invalidate results."""
+        path = str(tmp_path / "cache_thread.db")
+        db = ThreadDB(path, result_cache=16, readers=2)
+        db.create_table("ttable", ["id", "name"])
+        cache = db.result_cache
+        assert cache is not None
+
+        assert db.ttable.all() == []
+        with ThreadPoolExecutor(4) as executor:
+            list(executor.map(
+                lambda id_: db.ttable.add({"id": id_, "name": str(id_)}),
+                range(20),
+            ))
+        assert len(db.ttable.all()) == 20
+        assert len(db.ttable.all()) == 20
+        assert cache.hits == 1
+
+        db.close()
+        ThreadDB._instances.pop(path)
+
+
+class TestExplain:
+    """Tests for query plans."""
+
+    @pytest.mark.parametrize(
+        ("scan", "search"),
+        [
+            (
+                "SCAN person",
+                "SEARCH person USING INDEX ix_person_name (name=?)",
+            ),
+            (
+                "SCAN TABLE person",
+                "SEARCH TABLE person USING INDEX ix_person_name (name=?)",
+            ),
+        ],
+    )
+    def test_plan_formats(self, scan: str, search: str) -> None:
+        """Test plan steps of new and old sqlite versions."""
+        plan = QueryPlan(
+            "SELECT ...",
+            [
+                (2, 0, 0, scan),
+                (3, 0, 0, search),
+                (4, 0, 0, "SCAN CONSTANT ROW"),
+                (5, 0, 0, "SCAN SUBQUERY 1"),
+                (6, 0, 0, "SCAN CO-ROUTINE 2"),
+            ],
+        )
+        assert plan.full_scans == ("person",)
+        assert plan.indexes == ("ix_person_name",)
+        assert [node.table for node in plan] == [
+            "person",
+            "person",
+            None,
+            None,
+            None,
+        ]
+
+    def test_scan_warning(
+        self,
+        tmp_path: Path,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Test full scan of big table is logged."""
+        path = str(tmp_path / "scan.db")
+        db = DB(path, scan_warning_rows=10)
+        db.create_table("ttable", ["id", "name"])
+        db.ttable.add([{"id": id_, "name": str(id_)} for id_ in range(20)])
+        db.ttable.create_index("name")
+
+        db.ttable.select(name="1")
+        db.ttable.get(rowid=1)
+        assert not caplog.records
+        db.ttable.select(id=1)
+        list(db.ttable)
+        assert [record.levelname for record in caplog.records] == [
+            "WARNING",
+            "WARNING",
+        ]
+        assert "Full scan of ttable" in caplog.records[0].getMessage()
+
+        db.close()
+        DB._instances.pop(path)
+
+
+class TestInstrumentation:
+    """Tests for statement instrumentation."""
+
+    def test_hooks(
+        self,
+        db: DB,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Test hooks get rows and times, slow queries are logged."""
+        assert not db.instrumentation.enabled
+        # Load table metadata before counting statements
+        assert db.ttable.column_names == ("id", "name")
+        started: list[Any] = []
+        events: list[Any] = []
+        db.instrumentation.add_hook(
+            before=started.append,
+            after=events.append,
+        )
+        db.instrumentation.use_histograms()
+        db.ttable.add([{"id": id_, "name": str(id_)} for id_ in range(5)])
+        assert len(db.ttable.all()) == 5
+        assert len(list(db.ttable.select(return_generator=True))) == 5
+        with pytest.raises(sqlite3.OperationalError):
+            db.execute("SELECT * FROM missing")
+
+        assert started == events
+        insert, select, iterate, failed = events
+        assert (insert.operation, insert.rows) == ("insert", 5)
+        assert (select.operation, select.rows) == ("select", 5)
+        assert select.tables == frozenset(("ttable",))
+        assert select.sqlite_time > 0
+        assert select.build_time > 0
+        assert iterate.rows == 5
+        assert iterate.build_time > 0
+        assert isinstance(failed.error, sqlite3.OperationalError)
+
+        latency = db.instrumentation.latency()
+        assert latency["select"]["count"] == 3
+        assert latency["insert"]["p99"] > 0
+
+        db.instrumentation.log_slow_queries(0.0)
+        db.ttable.all()
+        assert "Slow query" in caplog.records[-1].getMessage()
+        assert len(db.instrumentation.slow_queries) == 1
+
+        db.instrumentation.log_slow_queries(None)
+        db.instrumentation.use_histograms(False)
+        db.instrumentation.remove_hook(events.append)
+        assert db.instrumentation.enabled
+        db.instrumentation.remove_hook(started.append)
+        assert not db.instrumentation.enabled
+
+    def test_thread_db(self, thread_db: ThreadDB) -> None:
+        """Test merged writes and worker iteration are instrumented."""
+        assert thread_db.ttable.column_names == ("id", "name")
+        events: list[Any] = []
+        thread_db.instrumentation.add_hook(after=events.append)
+
+        gate = Event()
+        blocker = Thread(target=thread_db.call, args=(gate.wait,))
+        blocker.start()
+        while (
+            thread_db.worker_queue.qsize() or
+            not thread_db.worker_queue.unfinished_tasks
+        ):
+            time.sleep(0.001)
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            for id_ in range(51, 56):
+                executor.submit(thread_db.ttable.add, {"id": id_})
+            while thread_db.worker_queue.qsize() < 5:
+                time.sleep(0.001)
+            gate.set()
+        blocker.join()
+        rows = list(thread_db.ttable.select(return_generator=True))
+
+        write, read = events
+        assert (write.operation, write.rows) == ("insert", 5)
+        assert (read.operation, read.rows) == ("select", len(rows))
+        assert len(rows) == 55
+
+
+class TestMetrics:
+    """Tests for per table metrics."""
+
+    def test_counters(self, tmp_path: Path) -> None:
+        """Test operations, statements and cache hits are counted."""
+        path = str(tmp_path / "metrics.db")
+        db = DB(path, result_cache=16)
+        db.create_table("ttable", ["id", "name"])
+        assert db.ttable.column_names == ("id", "name")
+        db.metrics.enable()
+
+        db.ttable.add([{"id": id_, "name": b"ab"} for id_ in range(5)])
+        before = db.metrics.snapshot()
+        assert len(db.ttable.all()) == 5
+        assert len(db.ttable.all()) == 5
+        db.ttable.update({"name": "c"}, id=1)
+        db.ttable.delete(id=2)
+        assert len(db.ttable.query().where(id=3).all()) == 1
+        changes = db.metrics.diff(before, db.metrics.snapshot())
+
+        assert before["ttable"]["rows_written"] == 5
+        assert before["ttable"]["blob_bytes_written"] == 10
+        assert before["ttable"]["insert_calls"] == 1
+        assert changes["ttable"]["rows_read"] == 6
+        assert changes["ttable"]["blob_bytes_read"] == 12
+        assert changes["ttable"]["cache_hits"] == 1
+        assert changes["ttable"]["rows_written"] == 2
+        assert changes["ttable"]["statements"] == 4
+        assert changes["ttable"]["select_calls"] == 2
+        assert changes["ttable"]["query_calls"] == 1
+        assert changes["ttable"]["update_seconds"] > 0
+        assert "insert_calls" not in changes["ttable"]
+        assert db.metrics.to_dict()["total"]["delete_calls"] == 1
+
+        db.metrics.write_prometheus(tmp_path / "lildb.prom")
+        text = (tmp_path / "lildb.prom").read_text()
+        assert "# TYPE lildb_rows_written_total counter" in text
+        assert 'lildb_rows_written_total{table="ttable"} 7' in text
+
+        db.metrics.disable()
+        db.ttable.all()
+        assert not db.instrumentation.enabled
+        assert db.metrics.snapshot()["ttable"]["select_calls"] == 2
+
+        db.close()
+        DB._instances.pop(path)
+
+    def test_streaming(self, db: DB) -> None:
+        """Test streamed selects, slices and len are counted."""
+        db.ttable.add([{"id": id_, "name": str(id_)} for id_ in range(5)])
+        db.metrics.enable()
+
+        # list() would call len() of table and slice
+        assert sum(1 for _ in db.ttable) == 5
+        rows = db.ttable.select(name="1", return_generator=True)
+        assert sum(1 for _ in rows) == 1
+        assert sum(1 for _ in db.ttable[1:3]) == 2
+        assert len(db.ttable) == 5
+
+        counters = db.metrics.snapshot()["ttable"]
+        assert counters["select_calls"] == 4
+        assert counters["select_seconds"] > 0
+        assert counters["rows_read"] == 9
+
+    def test_thread_db(self, thread_db: ThreadDB) -> None:
+        """Test writes merged by group commit are counted."""
+        assert thread_db.ttable.column_names == ("id", "name")
+        thread_db.metrics.enable()
+
+        gate = Event()
+        blocker = Thread(target=thread_db.call, args=(gate.wait,))
+        blocker.start()
+        while (
+            thread_db.worker_queue.qsize() or
+            not thread_db.worker_queue.unfinished_tasks
+        ):
+            time.sleep(0.001)
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            for id_ in range(51, 56):
+                executor.submit(thread_db.ttable.add, {"id": id_})
+            while thread_db.worker_queue.qsize() < 5:
+                time.sleep(0.001)
+            gate.set()
+        blocker.join()
+
+        counters = thread_db.metrics.snapshot()["ttable"]
+        assert counters["rows_written"] == 5
+        assert counters["statements"] == 1
+        assert counters["insert_calls"] == 5
+
+
+class TestIndexAdvisor:
+    """Tests for index advisor."""
+
+    def test_recommend(self, tmp_path: Path) -> None:
+        """Test advisor recommends and creates index of filtered column."""
+        path = str(tmp_path / "advisor.db")
+        db = DB(path)
+        db.create_table("ttable", ["id", "name", "post"])
+        db.ttable.add([
+            {"id": id_, "name": str(id_), "post": str(id_ % 3)}
+            for id_ in range(300)
+        ])
+        db.advisor.enable()
+        for id_ in range(5):
+            db.ttable.select(name=str(id_))
+        db.ttable.query().where(post="1").order_by("name").all()
+        db.ttable.get(rowid=1)
+        rows = db.ttable.select(post="2", return_generator=True)
+        assert sum(1 for _ in rows) == 100
+
+        recommendations = db.advisor.recommend()
+        assert {item.columns for item in recommendations} == {
+            ("name",),
+            ("post", "name"),
+            ("post",),
+        }
+        name = next(
+            item for item in recommendations if item.columns == ("name",)
+        )
+        assert name.queries == 5
+        assert 0 < name.saving < name.time
+        assert "ttable(name)" in db.advisor.report()
+
+        assert len(db.advisor.apply()) == 3
+        assert not db.advisor.recommend()
+        assert "ix_ttable_name" in db.ttable.select.explain(
+            name="1",
+        ).indexes
+
+        db.close()
+        DB._instances.pop(path)
+
+
+class TestThreadDB:
+    """Test for thread db."""
+
+    def test_create(self, thread_db: ThreadDB) -> None:
+        """Test DDL executed in worker."""
+        assert "ttable" in thread_db.table_names
+        assert len(thread_db.ttable.all()) == 50
+
+    def test_iterate(self, thread_db: ThreadDB) -> None:
+        """Test streaming rows through worker."""
+        rows = thread_db.ttable.select(return_generator=True, chunk_size=7)
+        assert [row["id"] for row in rows] == list(range(1, 51))
+
+    def test_transaction(self, thread_db: ThreadDB) -> None:
+        """Test transaction executed through worker."""
+        with thread_db.transaction():
+            thread_db.ttable.add({"id": 100, "name": "100"})
+            thread_db.ttable.delete(id=1)
+            assert thread_db.connect.in_transaction
+        assert not thread_db.connect.in_transaction
+        assert thread_db.ttable.get(id=100) is not None
+        assert thread_db.ttable.get(id=1) is None
+
+        with pytest.raises(RuntimeError), thread_db.transaction():
+            thread_db.ttable.delete(id=2)
+            raise RuntimeError
+        assert thread_db.ttable.get(id=2) is not None
+
+    def test_group_commit(self, thread_db: ThreadDB) -> None:
+        """Test queued writes are committed once."""
+        thread_db.create_table(
+            "utable",
+            {"id": Integer(primary_key=True), "name": Text(nullable=True)},
+        )
+        statements: list[str] = []
+        thread_db.connect.set_trace_callback(statements.append)
+
+        # Hold worker until all writes are queued
+        gate = Event()
+        blocker = Thread(target=thread_db.call, args=(gate.wait,))
+        blocker.start()
+        while (
+            thread_db.worker_queue.qsize() or
+            not thread_db.worker_queue.unfinished_tasks
+        ):
+            time.sleep(0.001)
+        with ThreadPoolExecutor(max_workers=21) as executor:
+            for id_ in (*range(1, 21), 5):
+                executor.submit(thread_db.utable.add, {"id": id_})
+            while thread_db.worker_queue.qsize() < 21:
+                time.sleep(0.001)
+            gate.set()
+        blocker.join()
+        thread_db.connect.set_trace_callback(None)
+
+        assert statements.count("COMMIT") == 1
+        assert [row["id"] for row in thread_db.utable.all()] == list(
+            range(1, 21),
+        )
+
+    def test_readers(self, tmp_path: Path) -> None:
+        """Test select executed by read-only connections."""
+        path = str(tmp_path / "readers.db")
+        db = ThreadDB(path, readers=2)
+        db.create_table("ttable", ["id", "name"])
+        db.ttable.add([{"id": id_, "name": str(id_)} for id_ in range(10)])
+
+        journal_mode = db.execute(
+            "PRAGMA journal_mode",
+            result=ResultFetch.fetchone,
+        )
+        assert journal_mode[0] == "wal"
+        assert len(db.ttable.all()) == 10
+
+        rows = db.ttable.select(return_generator=True, chunk_size=3)
+        assert next(rows)["id"] == 0
+        assert db.readers.qsize() == 1
+        assert len(list(rows)) == 9
+        assert db.readers.qsize() == 2
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(
+                lambda id_: db.ttable.get(id=id_)["id"],
+                range(10),
+            ))
+        assert results == list(range(10))
+
+        db.close()
+        ThreadDB._instances.pop(path)
+
+
+class TestAsyncDB:
+    """Tests for asyncio db."""
+
+    def test_operations(self, tmp_path: Path) -> None:
+        """Test awaitable table operations."""
+        path = str(tmp_path / "async.db")
+
+        async def main() -> None:
+            async with AsyncDB(path) as db:
+                await db.create_table("ttable", ["id", "name"])
+                await db.ttable.add([
+                    {"id": id_, "name": str(id_)} for id_ in range(10)
+                ])
+                await db.ttable.update({"name": "new"}, id=1)
+                await db.ttable.delete(id=2)
+
+                assert len(await db.ttable.all()) == 9
+                assert (await db.ttable.get(id=1))["name"] == "new"
+                query = db.ttable.query().where(id=3)
+                assert (await query.first())["name"] == "3"
+                assert await db.ttable.query().count() == 9
+
+                rows = [row["id"] async for row in db.ttable.iterate(
+                    chunk_size=4,
+                )]
+                assert rows == [0, 1, *range(3, 10)]
+
+                results = await asyncio.gather(*(
+                    db.ttable.get(id=id_) for id_ in range(3, 10)
+                ))
+                assert [row["id"] for row in results] == list(range(3, 10))
+
+                with pytest.raises(sqlite3.OperationalError):
+                    await db.execute("SELECT * FROM missing")
+
+        asyncio.run(main())
+        ThreadDB._instances.pop(path)
+
+    def test_failed_init(self) -> None:
+        """Test db without initialized ThreadDB has no tables."""
+        db = AsyncDB.__new__(AsyncDB)
+        with pytest.raises(AttributeError):
+            db.ttable  # noqa: B018
@@ -19,6 +19,16 @@ from lildb.operations import Query
 from lildb.sql import func
 
 
+def row_id(row: dict[str, Any]) -> int:
+    """Return row id, picklable for process pool."""
+    return row["id"]
+
+
+def sum_id(total: int, row: dict[str, Any]) -> int:
+    """Add row id to total, picklable for process pool."""
+    return total + row["id"]
+
+
 @pytest.fixture(scope="package")
 def dbs() -> tuple[DB, ...]:
     """Create db objects."""
@@ -712,6 +722,19 @@ class TestSelect:
                 for name in row2.__dict__
             )
 
+    def test_column_cls(self, dbs: tuple[DB, ...]) -> None:
+        """Test result row cls is shared between queries."""
+        db_dict, db_cls = dbs
+        tb = db_dict.ttable
+
+        row1 = db_dict.ttable.select(columns=["id", "name"])[0]
+        row2 = db_cls.ttable.select(columns=("id", "name"))[0]
+        row3 = db_cls.ttable.query(tb.c.id, tb.c.name).first()
+        assert type(row1) is type(row2) is type(row3)
+        assert type(row1) is not type(
+            db_dict.ttable.select(columns=["name", "id"])[0]
+        )
+
     def test_condition(self, dbs: tuple[DB, ...]) -> None:
         """Test for geting one row."""
         db_dict, db_cls = dbs
@@ -719,6 +742,45 @@ class TestSelect:
         assert len(db_dict.ttable.select(condition="id < 6")) == 5
         assert len(db_cls.ttable.select(condition="id < 6")) == 5
 
+    def test_generator(self, dbs: tuple[DB, ...]) -> None:
+        """Test for streaming rows."""
+        db_dict, db_cls = dbs
+
+        rows = db_cls.ttable.select(return_generator=True, chunk_size=3)
+        assert not isinstance(rows, list)
+        assert [row.id for row in rows] == [
+            row.id for row in db_cls.ttable.all()
+        ]
+
+        rows = db_dict.ttable.select(
+            size=2,
+            return_generator=True,
+            columns=["id"],
+        )
+        assert len(list(rows)) == 2
+        assert len(list(db_dict.ttable)) == self.MAX_COUNT
+
+
+class TestStatementCache:
+    """Test for cache of generated sql text."""
+
+    def test_hits(self, dbs: tuple[DB, ...]) -> None:
+        """Test repeated operation shape hit cache."""
+        db_dict, _ = dbs
+        statements = db_dict.ttable.statements
+
+        db_dict.ttable.get(id=11)
+        hits = statements.hits
+        misses = statements.misses
+        for id_ in range(12, 16):
+            assert db_dict.ttable.get(id=id_)["id"] == id_
+        assert statements.hits > hits
+        assert statements.misses == misses
+
+        db_dict.ttable.get(id=11, name=None)
+        assert statements.misses > misses
+        assert 0 < statements.hit_rate < 1
+
 
 class TestUpdate:
     """Test for update obj."""
@@ -1107,3 +1169,65 @@ class TestQuery:
         query = db_cls.ttable.query(tb.c.name)
         for row in query.generative_all(2):
             assert row is not None
+
+    def test_generative_keyset(self, dbs: tuple[DB, ...]) -> None:
+        """Test keyset pagination."""
+        db_dict, _ = dbs
+        tb = db_dict.ttable
+
+        rows = list(tb.query().generative_all(3, keyset=True))
+        assert [row["id"] for row in rows] == [row["id"] for row in tb.all()]
+
+        query = tb.query().order_by(salary="desc")
+        rows = list(query.generative_all(3, keyset=True))
+        expected = tb.query().order_by("salary desc", "rowid desc").all()
+        assert [row["id"] for row in rows] == [row["id"] for row in expected]
+
+        query = tb.query(tb.c.id).where(tb.c.id > 10)
+        rows = list(query.generative_all(4, keyset=True, key="id"))
+        assert [row.id for row in rows] == list(range(11, 21))
+
+        query = tb.query().order_by(salary="desc", id="asc")
+        with pytest.raises(ValueError):
+            list(query.generative_all(3, keyset=True))
+
+    def test_parallel(self, dbs: tuple[DB, ...]) -> None:
+        """Test process pool scan."""
+        db_dict, _ = dbs
+        tb = db_dict.ttable
+        ids = [row["id"] for row in tb.query().order_by("rowid").all()]
+
+        assert tb.query().parallel_map(row_id, 2) == ids
+        assert tb.query().parallel_reduce(sum_id, 0, 2) == sum(ids)
+
+        query = tb.query(tb.c.id).where(tb.c.id > 10)
+        assert query.parallel_map(row_id, 2) == [
+            id_ for id_ in ids if id_ > 10
+        ]
+        query = tb.query(tb.c.id).where(tb.c.id > 10)
+        assert query.parallel_map(tuple, 2, only_data=True) == [
+            (id_,) for id_ in ids if id_ > 10
+        ]
+
+        with pytest.raises(ValueError):
+            tb.query().limit(2).parallel_map(row_id)
+
+    def test_explain(self, dbs: tuple[DB, ...]) -> None:
+        """Test parsed query plan."""
+        db_dict, _ = dbs
+        tb = db_dict.ttable
+
+        plan = tb.query().where(salary=10).order_by("name").explain()
+        assert [node.kind for node in plan] == ["SCAN", "TEMP B-TREE"]
+        assert plan.full_scans == ("ttable",)
+        assert plan.temp_btrees == ("USE TEMP B-TREE FOR ORDER BY",)
+        assert str(plan).splitlines()[1] == "|--SCAN ttable"
+
+        plan = tb.query().where("rowid = 1").explain()
+        assert plan.roots[0].kind == "SEARCH"
+        assert plan.full_scans == ()
+
+        plan = tb.select.explain(name="test", columns=["id"])
+        assert plan.roots[0].table == "ttable"
+        assert plan.roots[0].is_full_scan
+
@@ -1,9 +1,17 @@
 """Module contain test for select query."""
 from __future__ import annotations
 
+from pathlib import Path
+
 import pytest
 
 from lildb import DB
+from lildb import ResultFetch
+from lildb import RowDict
+from lildb import Table
+from lildb.column_types import Index
+from lildb.column_types import Integer
+from lildb.column_types import Text
 
 
 @pytest.fixture(scope="package")
@@ -27,3 +35,174 @@ class TestTable:
         # assert table.c.name.upper() == "UPPER(`ttable`.name) AS name"
         # assert table.c.name.lower() == "LOWER(`ttable`.name) AS name"
         # assert False
+
+    def test_tuple_rows(self, db: DB) -> None:
+        """Test compact tuple-backed rows."""
+        tb = Table("ttable", row_mode="tuple")
+        tb(db)
+
+        row = tb.get(id=11)
+        assert isinstance(row, tuple)
+        assert not hasattr(row, "__dict__")
+        assert row.id == row[0] == 11
+        assert row.table is tb
+
+        row = row.change(post="tuple")
+        assert row.post == "tuple"
+        assert tb.get(id=11).post == "tuple"
+
+        tb.add({"id": 100, "name": "tmp"})
+        tb.get(id=100).delete()
+        assert tb.get(id=100) is None
+
+        row = tb.select(columns=["id", "name"])[0]
+        assert row._fields == ("id", "name")
+        assert row.table is None
+        with pytest.raises(TypeError):
+            row.delete()
+
+        row = tb.query(tb.c.id).first()
+        assert row.id == row[0]
+
+    @pytest.mark.parametrize("row_mode", ["dict", "datacls", "tuple"])
+    def test_row_factory(self, db: DB, row_mode: str) -> None:
+        """Test cursor row factory builds same rows like row cls."""
+        tb = Table("ttable", row_mode=row_mode)  # type: ignore
+        tb(db)
+        columns = tb.column_names
+        items = db.execute(
+            "SELECT {} FROM ttable".format(", ".join(columns)),
+            result=ResultFetch.fetchall,
+        )
+        if row_mode == "dict":
+            expected = [RowDict(zip(columns, item), table=tb) for item in items]
+        elif row_mode == "datacls":
+            # Generated data cls takes column values positionally
+            fields = list(tb.row_cls.__dataclass_fields__)
+            assert fields[:len(columns) + 1] == [*columns, "table"]
+            expected = [
+                tb.row_cls(table=tb, **dict(zip(columns, item)))
+                for item in items
+            ]
+        else:
+            expected = [tb.row_cls._make(item) for item in items]
+
+        rows = tb.all()
+        assert rows == expected
+        assert [type(row) for row in rows] == [type(row) for row in expected]
+        assert list(tb) == expected
+
+    def test_identity_map(self, tmp_path: Path) -> None:
+        """Test rows got by primary key are kept until table write."""
+        path = str(tmp_path / "identity.db")
+        db = DB(path)
+        db.create_table(
+            "person",
+            {"id": Integer(primary_key=True), "name": Text()},
+        )
+        tb = db.person
+        tb.add([{"id": 1, "name": "Ann"}, {"id": 2, "name": "Sam"}])
+        tb.use_identity_map()
+
+        row = tb.get(id=1)
+        assert tb.get(id=1) is row
+        assert tb[1] is row
+        assert tb.get(name="Ann") is not row
+
+        row["name"] = "Bob"
+        row.change()
+        assert tb.get(id=1) is not row
+        assert tb.get(id=1)["name"] == "Bob"
+
+        tb.update({"name": "Tom"}, id=2)
+        assert tb.get(id=2)["name"] == "Tom"
+        tb.get(id=2).delete()
+        assert tb.get(id=2) is None
+
+        with db.transaction():
+            assert tb.get(id=1) is not tb.get(id=1)
+
+        tb.use_identity_map(0)
+        assert tb.identity_map is None
+        db.close()
+        DB._instances.pop(path)
+
+    def test_positions(self, tmp_path: Path) -> None:
+        """Test positional access and lazy slices without id column."""
+        path = str(tmp_path / "positions.db")
+        db = DB(path)
+        db.create_table("number", ["value"])
+        tb = db.number
+        assert len(tb) == 0
+        assert tb
+        tb.add([{"value": value} for value in range(20)])
+        values = list(range(20))
+
+        assert len(tb) == 20
+        assert tb[0]["value"] == 0
+        assert tb[-1]["value"] == 19
+        with pytest.raises(IndexError):
+            tb[20]
+
+        for positions in (
+            slice(2, 8),
+            slice(None, None, 3),
+            slice(-5, None),
+            slice(None, None, -2),
+            slice(15, 3, -4),
+        ):
+            view = tb[positions]
+            assert [row["value"] for row in view] == values[positions]
+            assert len(view) == len(values[positions])
+        view = tb[2:15:2]
+        assert [row["value"] for row in view[1:-1]] == values[2:15:2][1:-1]
+        assert view[-1]["value"] == values[2:15:2][-1]
+
+        db.close()
+        DB._instances.pop(path)
+
+    def test_indexes(self, tmp_path: Path) -> None:
+        """Test create, inspect and drop indexes."""
+        path = str(tmp_path / "indexes.db")
+        db = DB(path)
+        db.create_table(
+            "person",
+            {
+                "id": Integer(primary_key=True),
+                "name": Text(),
+                "email": Text(unique=True),
+                "salary": Integer(),
+            },
+            indexes=[Index("name", "salary")],
+        )
+        tb = db.person
+
+        assert tb.create_index(
+            tb.c.salary,
+            include=("name",),
+            where="salary > 0",
+        ) == "ix_person_salary_name"
+        assert tb.create_index("lower(name)", name="ix_lower") == "ix_lower"
+        assert tb.create_index("email", "name", unique=True)
+
+        indexes = {index.name: index for index in tb.indexes}
+        assert indexes["ix_person_name_salary"].columns == ("name", "salary")
+        assert indexes["ix_person_salary_name"].partial
+        assert indexes["ix_lower"].columns == (None,)
+        assert indexes["ix_person_email_name"].unique
+        assert [
+            index.origin for index in indexes.values() if index.sql is None
+        ] == ["u"]
+
+        plan = db.execute(
+            "EXPLAIN QUERY PLAN SELECT name FROM person "
+            "WHERE salary > 0 AND salary = 1",
+            result=ResultFetch.fetchall,
+        )
+        assert "COVERING INDEX ix_person_salary_name" in plan[0][-1]
+
+        tb.drop_index("ix_lower")
+        assert "ix_lower" not in {index.name for index in tb.indexes}
+
+        db.close()
+        DB._instances.pop(path)